@@ -0,0 +1,99 @@
+"""Compare two benchmark result files
+
+Benchmarks are matched on (suite, name, rows). A benchmark is a regression
+when it got slower by more than the threshold; the script then exits with 1.
+
+Usage:
+    python -m benchmarks.compare                          # two latest results
+    python -m benchmarks.compare baseline.json current.json --threshold 0.2
+"""
+
+import os
+import sys
+import json
+import glob
+import argparse
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from benchmarks.run_benchmarks import RESULTS_DIR
+
+REGRESSION_THRESHOLD = 0.10
+
+
+def load_results(filepath):
+    """Load a results file as (suite, name, rows) -> record"""
+    with open(filepath, encoding='utf-8') as file:
+        report = json.load(file)
+    return report, {(r['suite'], r['name'], r['rows']): r for r in report['results']}
+
+
+def compare_results(baseline, current, threshold=REGRESSION_THRESHOLD):
+    """Compare the records of two runs
+
+    Args:
+        baseline (dict): (suite, name, rows) -> record, see load_results
+        current (dict): same for the run to check
+        threshold (float): Slowdown counted as a regression, 0.10 = 10%
+
+    Returns:
+        list: one dict per shared benchmark with both timings, the ratio
+        current/baseline and a regression flag
+    """
+    rows = []
+    for key in sorted(baseline.keys() & current.keys(), key=lambda k: (k[0], k[2], k[1])):
+        before, after = baseline[key]['seconds'], current[key]['seconds']
+        ratio = after / before if before else float('inf')
+        rows.append({
+            'suite': key[0], 'name': key[1], 'rows': key[2],
+            'baseline_s': before, 'current_s': after, 'ratio': ratio,
+            'regression': ratio > 1 + threshold,
+        })
+    return rows
+
+
+def latest_results(results_dir=RESULTS_DIR, count=2):
+    """Paths of the `count` most recent results files, oldest first"""
+    return sorted(glob.glob(os.path.join(results_dir, '*.json')))[-count:]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument('files', nargs='*', help="baseline and current results (default: the two latest)")
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help="slowdown reported as a regression (default: 0.10 = 10%%)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    files = args.files or latest_results()
+    if len(files) != 2:
+        print("❌ Need two results files to compare")
+        return 2
+
+    baseline_report, baseline = load_results(files[0])
+    current_report, current = load_results(files[1])
+    print(f"Baseline: {baseline_report['commit']} ({baseline_report['created_at']})")
+    print(f"Current:  {current_report['commit']} ({current_report['created_at']})\n")
+
+    comparison = compare_results(baseline, current, args.threshold)
+    print(f"{'Suite':<12}{'Benchmark':<26}{'Rows':>12}{'Before (s)':>12}{'After (s)':>12}{'Change':>9}")
+    for row in comparison:
+        flag = '  ⚠️' if row['regression'] else ''
+        print(f"{row['suite']:<12}{row['name']:<26}{row['rows']:>12,}{row['baseline_s']:>12.4f}"
+              f"{row['current_s']:>12.4f}{row['ratio'] - 1:>+9.1%}{flag}")
+
+    regressions = [row for row in comparison if row['regression']]
+    if regressions:
+        print(f"\n⚠️  {len(regressions)} regression(s) above {args.threshold:.0%}")
+        return 1
+    print(f"\n✅ No regressions above {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
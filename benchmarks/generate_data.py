@@ -0,0 +1,142 @@
+"""Synthetic raw FIFA 21 data for benchmarks
+
+Rows follow the layout of 'fifa21 raw data v2.csv' with the string shapes
+the converters see in the real file ('€1.5M', '€500K', "5'10\"", '170lbs',
+'1.2K' hits, ...) and a similar number of distinct values per column.
+
+Usage:
+    python -m benchmarks.generate_data 1000000 data/raw/synthetic_1m.csv
+"""
+
+import os
+import sys
+import argparse
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config.config import FILE_ENCODING
+
+RAW_COLUMNS = [
+    'ID', 'Name', 'LongName', 'photoUrl', 'playerUrl', 'Nationality', 'Age', '↓OVA', 'POT',
+    'Club', 'Contract', 'Positions', 'Height', 'Weight', 'Preferred Foot', 'BOV',
+    'Best Position', 'Joined', 'Loan Date End', 'Value', 'Wage', 'Release Clause',
+    'Attacking', 'Crossing', 'Finishing', 'Heading Accuracy', 'Short Passing', 'Volleys',
+    'Skill', 'Dribbling', 'Curve', 'FK Accuracy', 'Long Passing', 'Ball Control',
+    'Movement', 'Acceleration', 'Sprint Speed', 'Agility', 'Reactions', 'Balance', 'Power',
+    'Shot Power', 'Jumping', 'Stamina', 'Strength', 'Long Shots', 'Mentality', 'Aggression',
+    'Interceptions', 'Positioning', 'Vision', 'Penalties', 'Composure', 'Defending',
+    'Marking', 'Standing Tackle', 'Sliding Tackle', 'Goalkeeping', 'GK Diving',
+    'GK Handling', 'GK Kicking', 'GK Positioning', 'GK Reflexes', 'Total Stats',
+    'Base Stats', 'W/F', 'SM', 'A/W', 'D/W', 'IR', 'PAC', 'SHO', 'PAS', 'DRI', 'DEF', 'PHY',
+    'Hits',
+]
+
+#(lowest, highest) of the summed rating columns
+TOTAL_RANGES = {
+    'Attacking': (100, 440), 'Skill': (90, 470), 'Movement': (150, 460), 'Power': (130, 440),
+    'Mentality': (100, 430), 'Defending': (20, 280), 'Goalkeeping': (20, 440),
+    'Total Stats': (700, 2300), 'Base Stats': (200, 500),
+}
+
+POSITIONS = ['GK', 'CB', 'LB', 'RB', 'CDM', 'CM', 'CAM', 'LM', 'RM', 'LW', 'RW', 'ST', 'CF', 'LWB', 'RWB']
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+GENERATOR_CHUNKSIZE = 1_000_000
+
+
+def string_pools():
+    """Distinct raw strings per column, roughly as many as in the real file"""
+    value_k = [f"€{k}K" for k in range(10, 1000, 5)]
+    value_m = [f"€{m / 10:g}M" for m in range(10, 1060, 5)]
+    return {
+        'Value': np.array(['€0'] + value_k + value_m, dtype=object),
+        'Release Clause': np.array(['€0'] + value_k + [f"€{m / 10:g}M" for m in range(10, 2030, 7)], dtype=object),
+        'Wage': np.array(['€500', '€750'] + [f"€{k}K" for k in range(1, 561)], dtype=object),
+        'Height': np.array(
+            [f"{cm}cm" for cm in range(155, 207)] + [f"{feet}'{inches}\"" for feet in (5, 6) for inches in range(12)],
+            dtype=object
+        ),
+        'Weight': np.array([f"{kg}kg" for kg in range(50, 111)] + [f"{lbs}lbs" for lbs in range(110, 244)], dtype=object),
+        'Hits': np.array([str(hits) for hits in range(1, 1000)] + [f"{k / 10:g}K" for k in range(10, 90)], dtype=object),
+        'Nationality': np.array([f"Country {i}" for i in range(164)], dtype=object),
+        'Club': np.array([f"Club {i}" for i in range(682)], dtype=object),
+        'Positions': np.array(
+            [', '.join(POSITIONS[j] for j in sorted({i % 15, (i * 7) % 15})) for i in range(120)],
+            dtype=object
+        ),
+        'Best Position': np.array(POSITIONS, dtype=object),
+        'Contract': np.array([f"{start} ~ {start + length}" for start in range(2010, 2021) for length in range(1, 6)], dtype=object),
+        'Joined': np.array([f"{month} {day}, {year}" for month in MONTHS for day in (1, 15) for year in range(2010, 2021)], dtype=object),
+        'Loan Date End': np.array(['Jun 30, 2021', 'Dec 31, 2020', 'Jun 30, 2022'], dtype=object),
+        'Preferred Foot': np.array(['Right', 'Left'], dtype=object),
+        'A/W': np.array(['Low', 'Medium', 'High'], dtype=object),
+        'D/W': np.array(['Low', 'Medium', 'High'], dtype=object),
+        'W/F': np.array([f"{stars} ★" for stars in range(1, 6)], dtype=object),
+        'SM': np.array([f"{stars}★" for stars in range(1, 6)], dtype=object),
+        'IR': np.array([f"{stars} ★" for stars in range(1, 6)], dtype=object),
+    }
+
+
+def make_raw_fifa_rows(rows, seed=0, first_id=1):
+    """Build a raw-format FIFA frame with `rows` synthetic players
+
+    Args:
+        rows (int): Number of players
+        seed (int): Random seed, the same seed gives the same frame
+        first_id (int): ID of the first player
+
+    Returns:
+        pd.DataFrame: Frame with the columns of the raw CSV
+    """
+    rng = np.random.default_rng(seed)
+    pools = string_pools()
+    pick = lambda column: pools[column][rng.integers(0, len(pools[column]), rows)]
+
+    ids = np.arange(first_id, first_id + rows)
+    id_strings = pd.Series(ids).astype(str)
+    data = {column: rng.integers(20, 100, rows, dtype=np.int16) for column in RAW_COLUMNS}
+    data.update({column: rng.integers(low, high, rows, dtype=np.int16) for column, (low, high) in TOTAL_RANGES.items()})
+    data.update({column: pick(column) for column in pools})
+    data.update({
+        'ID': ids,
+        'Name': ('Player ' + id_strings).to_numpy(dtype=object),
+        'LongName': ('Synthetic Player ' + id_strings).to_numpy(dtype=object),
+        'photoUrl': ('https://cdn.sofifa.com/players/' + id_strings + '.png').to_numpy(dtype=object),
+        'playerUrl': ('http://sofifa.com/player/' + id_strings).to_numpy(dtype=object),
+        'Age': rng.integers(16, 44, rows, dtype=np.int16),
+    })
+    data['Loan Date End'] = np.where(rng.random(rows) < 0.95, None, data['Loan Date End'])
+    data['Hits'] = np.where(rng.random(rows) < 0.13, None, data['Hits'])
+
+    return pd.DataFrame(data, columns=RAW_COLUMNS)
+
+
+def write_raw_csv(filepath, rows, seed=0, chunksize=GENERATOR_CHUNKSIZE):
+    """Write `rows` synthetic players to a raw-format CSV, chunk by chunk
+
+    Memory stays bounded by the chunk size, so 10M-row files can be built.
+
+    Returns:
+        str: filepath
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
+    with open(filepath, 'w', encoding=FILE_ENCODING, newline='') as file:
+        for index, start in enumerate(range(0, rows, chunksize)):
+            chunk = make_raw_fifa_rows(min(chunksize, rows - start), seed=seed + index, first_id=start + 1)
+            chunk.to_csv(file, index=False, header=index == 0)
+    return filepath
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a synthetic raw FIFA 21 CSV")
+    parser.add_argument('rows', type=int, help="number of players")
+    parser.add_argument('filepath', help="CSV file to write")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    write_raw_csv(args.filepath, args.rows, seed=args.seed)
+    print(f"✅ Wrote {args.rows:,} rows to {args.filepath}")
@@ -0,0 +1,324 @@
+"""Benchmark suite of the FIFA 21 pipeline
+
+Times, on synthetic raw data of several sizes:
+    converters: every string converter, per-row apply vs vectorized vs
+        factorized (the path transform_fifa_data takes)
+    transform: transform_fifa_data
+    formats: save_cleaned_data, one output format at a time
+    pipeline: run_pipeline end to end (Extract, Transform, Load)
+    startup: import time of the entry modules in a fresh interpreter
+        (python -X importtime), checked against STARTUP_BUDGET_SECONDS
+
+Results are written to benchmarks/results/<timestamp>_<commit>.json;
+compare two of them with benchmarks/compare.py.
+
+Usage:
+    python -m benchmarks.run_benchmarks --rows 10000 100000 1000000
+    python -m benchmarks.run_benchmarks --suites converters transform --rows 10000000
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import tempfile
+import subprocess
+from contextlib import redirect_stdout
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from benchmarks.generate_data import write_raw_csv
+from eti_pipeline.src.extract.extract import load_raw_data
+from eti_pipeline.src.transform.transform import CONVERTERS, transform_fifa_data
+from eti_pipeline.src.utilis.series_utilis import convert_factorized
+from eti_pipeline.src.load.save_data import save_cleaned_data
+from eti_pipeline.src.utilis.file_utilis import path_size
+from config.config import (
+    COL_VALUE,
+    COL_WEIGHT,
+    COL_HEIGHT,
+    COL_WAGE,
+    COL_RELEASE_COLUMN,
+    COL_HITS,
+    CONVERTER_CACHE_SIZE,
+    DEFAULT_OUTPUT_FILENAME,
+    DEFAULT_OUTPUT_FORMATS,
+    MB_CONVERSION
+)
+
+SUITES = ['converters', 'transform', 'formats', 'pipeline', 'startup']
+DEFAULT_ROWS = [10_000, 100_000]
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+#Raw column read by every converter
+CONVERTER_COLUMNS = {
+    'value': COL_VALUE,
+    'weight': COL_WEIGHT,
+    'height': COL_HEIGHT,
+    'wages': COL_WAGE,
+    'clause': COL_RELEASE_COLUMN,
+    'hits': COL_HITS,
+}
+
+#Per-row apply is only timed up to this size, it is the slow baseline
+APPLY_MAX_ROWS = 1_000_000
+#The pure-Python Excel writers manage roughly 1-2k rows/s on this data
+EXCEL_BENCH_MAX_ROWS = 100_000
+PIPELINE_FORMATS = ['csv', 'parquet']
+
+#Modules every run (and every worker process) imports, and the time a cold
+#`import main` may take. Optional heavy packages must not be among its imports.
+STARTUP_MODULES = ['main', 'eti_pipeline.src.transform.transform', 'eti_pipeline.src.load.save_data']
+STARTUP_BUDGET_SECONDS = 1.0
+STARTUP_REPEATS = 5
+#pandas 3 imports the pyarrow core itself, so pyarrow is tracked by its heavier
+#submodules (Parquet, Feather, datasets)
+HEAVY_MODULES = ['matplotlib', 'seaborn', 'sqlalchemy', 'openpyxl', 'xlsxwriter', 'zstandard',
+                 'pyarrow.parquet', 'pyarrow.feather', 'pyarrow.dataset']
+
+
+def repeats_for(rows):
+    """Number of timed runs per benchmark, fewer for large inputs"""
+    return 3 if rows <= 100_000 else 1
+
+
+def best_time(func, repeats, setup=None):
+    """Run func `repeats` times and return the fastest wall time in seconds"""
+    times = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def result(suite, name, rows, seconds, **extra):
+    """One benchmark record"""
+    return {
+        'suite': suite,
+        'name': name,
+        'rows': rows,
+        'seconds': round(seconds, 5),
+        'rows_per_second': round(rows / seconds) if seconds else None,
+        **extra,
+    }
+
+
+def bench_converters(raw_data, repeats):
+    """Time every converter on its raw column, one record per strategy"""
+    rows = len(raw_data)
+    records = []
+    for name, (memo_func, series_func) in CONVERTERS.items():
+        values = raw_data[CONVERTER_COLUMNS[name]]
+        strategies = {
+            'vectorized': lambda: series_func(values),
+            'factorized': lambda: convert_factorized(values, memo_func, series_func, CONVERTER_CACHE_SIZE),
+        }
+        if rows <= APPLY_MAX_ROWS:
+            strategies['apply'] = lambda: values.apply(memo_func.__wrapped__)
+
+        for strategy, func in strategies.items():
+            # Cold memo every run, as in a fresh pipeline process
+            seconds = best_time(func, repeats, setup=memo_func.cache_clear)
+            records.append(result('converters', f"{name}/{strategy}", rows, seconds))
+    return records
+
+
+def bench_transform(raw_data, repeats):
+    """Time transform_fifa_data in a single process"""
+    seconds = best_time(lambda: transform_fifa_data(raw_data, workers=1), repeats)
+    return [result('transform', 'transform_fifa_data', len(raw_data), seconds)]
+
+
+def bench_formats(cleaned_data, repeats, formats, work_dir):
+    """Time save_cleaned_data for each output format on its own"""
+    rows = len(cleaned_data)
+    records = []
+    for fmt in formats:
+        if fmt == 'excel' and rows > EXCEL_BENCH_MAX_ROWS:
+            logging.warning(f"⏭️  Skipping excel at {rows:,} rows (limit {EXCEL_BENCH_MAX_ROWS:,})")
+            continue
+
+        saved = {}
+        def save():
+            saved.update(save_cleaned_data(cleaned_data, formats=[fmt], output_dir=work_dir, parallel=False))
+
+        # A single Excel write already takes minutes at the larger sizes
+        seconds = best_time(save, 1 if fmt == 'excel' else repeats)
+        if fmt not in saved:
+            logging.warning(f"⚠️  {fmt} could not be written, no timing recorded")
+            continue
+        size_mb = path_size(saved[fmt]) / MB_CONVERSION
+        records.append(result('formats', fmt, rows, seconds, size_mb=round(size_mb, 2)))
+    return records
+
+
+def bench_pipeline(raw_path, rows, repeats, work_dir):
+    """Time run_pipeline end to end, without the run cache"""
+    from main import run_pipeline
+
+    targets = [{'format': fmt, 'base_filename': DEFAULT_OUTPUT_FILENAME} for fmt in PIPELINE_FORMATS]
+    def run():
+        with redirect_stdout(io.StringIO()):
+            cleaned_data = run_pipeline(raw_path=raw_path, output_dir=work_dir, targets=targets,
+                                        use_cache=False, workers=1)
+        if cleaned_data is None:
+            raise RuntimeError("run_pipeline failed")
+
+    seconds = best_time(run, repeats)
+    return [result('pipeline', 'run_pipeline/' + '+'.join(PIPELINE_FORMATS), rows, seconds)]
+
+
+def import_time(module):
+    """Import module in a fresh interpreter with -X importtime
+
+    Returns:
+        tuple: (cumulative import time in seconds, modules and top-level
+        packages imported)
+    """
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                               cwd=project_root, capture_output=True, text=True, check=True)
+    seconds, packages = None, set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if name.strip() == module and not name[1:].startswith(' '):
+            seconds = int(cumulative) / 1e6
+        packages.update({name.strip(), name.strip().split('.')[0]})
+    return seconds, packages
+
+
+def bench_startup(modules=None, repeats=STARTUP_REPEATS):
+    """Time a cold import of each entry module, best of `repeats`"""
+    records = []
+    for module in modules or STARTUP_MODULES:
+        runs = [import_time(module) for _ in range(repeats)]
+        seconds = min(run[0] for run in runs)
+        heavy = sorted(set(HEAVY_MODULES) & runs[0][1])
+        extra = {'heavy_modules': heavy}
+        if module == 'main':
+            extra['budget_s'] = STARTUP_BUDGET_SECONDS
+            if seconds > STARTUP_BUDGET_SECONDS:
+                logging.warning(f"⚠️  import main took {seconds:.2f}s, over the {STARTUP_BUDGET_SECONDS:.2f}s budget")
+        if heavy:
+            logging.warning(f"⚠️  import {module} pulls in {', '.join(heavy)}")
+        records.append(result('startup', f"import {module}", 0, seconds, **extra))
+    return records
+
+
+def run_benchmarks(rows_list=None, suites=None, formats=None, seed=0):
+    """Run the selected suites at every size
+
+    Args:
+        rows_list (list): Input sizes in rows
+        suites (list): Suites to run, see SUITES
+        formats (list): Output formats timed by the formats suite
+        seed (int): Seed of the synthetic data
+
+    Returns:
+        list: benchmark records
+    """
+    rows_list = rows_list or DEFAULT_ROWS
+    suites = suites or SUITES
+    formats = formats or DEFAULT_OUTPUT_FORMATS
+
+    records = bench_startup() if 'startup' in suites else []
+    for rows in rows_list:
+        repeats = repeats_for(rows)
+        with tempfile.TemporaryDirectory(prefix='fifa21_bench_') as work_dir:
+            raw_path = write_raw_csv(os.path.join(work_dir, 'raw.csv'), rows, seed=seed)
+            raw_data = load_raw_data(raw_path)
+
+            if 'converters' in suites:
+                records += bench_converters(raw_data, repeats)
+            if 'transform' in suites:
+                records += bench_transform(raw_data, repeats)
+            if 'formats' in suites:
+                cleaned_data = transform_fifa_data(raw_data, workers=1)
+                records += bench_formats(cleaned_data, repeats, formats, work_dir)
+                del cleaned_data
+            if 'pipeline' in suites:
+                del raw_data
+                records += bench_pipeline(raw_path, rows, repeats, work_dir)
+
+        print(f"✅ {rows:,} rows done")
+    return records
+
+
+def git_commit():
+    """Short hash of the checked-out commit, '+dirty' with local changes"""
+    try:
+        sha = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=project_root,
+                             capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=project_root,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return sha + ('+dirty' if dirty else '')
+
+
+def write_results(records, results_dir=RESULTS_DIR):
+    """Save the records with the commit and environment they were measured on
+
+    Returns:
+        str: path of the results file
+    """
+    os.makedirs(results_dir, exist_ok=True)
+    commit = git_commit()
+    started = datetime.now()
+    report = {
+        'commit': commit,
+        'created_at': started.isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'results': records,
+    }
+    filepath = os.path.join(results_dir, f"{started:%Y%m%d_%H%M%S}_{commit.replace('+', '_')}.json")
+    with open(filepath, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+    return filepath
+
+
+def print_results(records):
+    """Print the records as a table"""
+    print(f"{'Suite':<12}{'Benchmark':<26}{'Rows':>12}{'Seconds':>11}{'Rows/s':>14}")
+    for record in records:
+        print(f"{record['suite']:<12}{record['name']:<26}{record['rows']:>12,}"
+              f"{record['seconds']:>11.4f}{record['rows_per_second'] or 0:>14,}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the FIFA 21 pipeline on synthetic data")
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS,
+                        help=f"input sizes in rows (default: {' '.join(map(str, DEFAULT_ROWS))})")
+    parser.add_argument('--suites', nargs='+', choices=SUITES, default=SUITES)
+    parser.add_argument('--formats', nargs='+', default=DEFAULT_OUTPUT_FORMATS,
+                        help="output formats timed by the formats suite")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--results-dir', default=RESULTS_DIR)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    records = run_benchmarks(args.rows, args.suites, args.formats, seed=args.seed)
+    print_results(records)
+    print(f"\n📊 Results saved: {write_results(records, args.results_dir)}")
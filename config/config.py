@@ -8,12 +8,8 @@ from pathlib import Path
 #Get the project root directory
 PROJECT_ROOT = Path(__file__).parent.parent
 
-#Define log directory
-LOG_DIR= PROJECT_ROOT/ 'logs'
-
-#Create directory
-LOG_DIR.mkdir(exist_ok= True)
-
+#Nothing here touches the filesystem: directories are created by the code
+#that writes into them (logs/ by setup_logging)
 
 
 #=======EXTRACT SETTINGS=====
@@ -25,6 +21,37 @@ RAW_FILENAME = "fifa21 raw data v2.csv"
     
 CSV_LOW_MEMORY = False 
 
+#Read the raw CSV with the dtypes/usecols in eti_pipeline/src/extract/schema.py
+CSV_TYPED_SCHEMA = True
+
+#CSV parser: 'c' (pandas default) or 'pyarrow' (multithreaded pyarrow.csv,
+#batch mode only - streaming always uses 'c')
+CSV_ENGINE = 'c'
+
+#With CSV_ENGINE = 'pyarrow', keep Arrow-backed dtypes (dtype_backend='pyarrow')
+#through Transform to the writers
+CSV_ARROW_DTYPES = False
+
+#Rows per chunk when streaming (run_pipeline(stream=True))
+STREAM_CHUNKSIZE = 50_000
+
+#Multi-file runs (run_pipeline(raw_glob=...)): every file in data/raw/ matching
+#the glob is extracted and transformed in its own worker process, then the
+#results are combined and tagged with their source file and season
+RAW_BATCH_GLOB = '*.csv'
+BATCH_WORKERS = None #None = one process per file, at most one per CPU
+COL_SOURCE_FILE = 'Source File'
+COL_SEASON = 'Season'
+#Season read from the file name, e.g. 'FIFA 20 players.csv' -> 'fifa20'.
+#Files without one are tagged with their name.
+SEASON_PATTERN = r'fifa[\s_-]*(\d{2})'
+
+#Per-season raw column renames (column in that season's dumps -> FIFA 21 name),
+#applied right after reading so Transform sees FIFA 21 headers, e.g.
+#    'fifa20': {'OVA': '↓OVA', 'Wage(€)': 'Wage'}
+#Columns Transform needs that a file lacks are added empty (and logged).
+RAW_COLUMN_MAPS = {}
+
 #======TRANSFORM SETTINGS=========
 
 
@@ -36,6 +63,7 @@ COL_WAGE   = 'Wage'
 COL_VALUE  = 'Value'
 COL_HITS   = 'Hits'
 COL_RELEASE_COLUMN = 'Release Clause'
+COL_ID = 'ID'
 
 #Column names(Transformed)
 
@@ -43,6 +71,42 @@ COL_WEIGHT_KG = 'Weight(KG)'
 COL_HEIGHT_CM = 'Height(cm)'
 COL_WAGES_K = "Wages(€K)"
 
+#Cleaned columns, compiled by transform_fifa_data into a single pass. Keys:
+#  source: raw column read once
+#  target: name in the cleaned data (renames are applied in one rename)
+#  converter: name in CONVERTERS (eti_pipeline/src/transform/transform.py)
+#  dtype: output dtype, None = as converted
+#  strict_dtype: nullable output dtype with TRANSFORM_STRICT (default Float64)
+#  nulls: 'keep' leaves missing values as NaN, 'zero' fills them with 0
+#  as_text (optional): convert the raw values as strings (NaN -> 'nan')
+#A new cleaned column is one more entry here.
+TRANSFORM_REGISTRY = [
+    {'source': COL_VALUE, 'target': COL_VALUE, 'converter': 'value',
+     'dtype': None, 'strict_dtype': 'Float64', 'nulls': 'keep'},
+    {'source': COL_WEIGHT, 'target': COL_WEIGHT_KG, 'converter': 'weight',
+     'dtype': None, 'strict_dtype': 'Float64', 'nulls': 'keep'},
+    {'source': COL_WAGE, 'target': COL_WAGES_K, 'converter': 'wages',
+     'dtype': None, 'strict_dtype': 'Float64', 'nulls': 'keep'},
+    {'source': COL_HEIGHT, 'target': COL_HEIGHT_CM, 'converter': 'height',
+     'dtype': None, 'strict_dtype': 'Float64', 'nulls': 'keep'},
+    {'source': COL_HITS, 'target': COL_HITS, 'converter': 'hits',
+     'dtype': None, 'strict_dtype': 'Int32', 'nulls': 'zero', 'as_text': True},
+    {'source': COL_RELEASE_COLUMN, 'target': COL_RELEASE_COLUMN, 'converter': 'clause',
+     'dtype': None, 'strict_dtype': 'Float64', 'nulls': 'keep'},
+]
+
+#Strict mode: converted columns get their nullable strict_dtype instead of a
+#mix of numbers and False/''/None sentinels (object dtype). Values a converter
+#rejects become <NA> and are listed (ID, column, raw value, reason) in the
+#quarantine table, written next to the outputs as QUARANTINE_FILENAME.
+TRANSFORM_STRICT = False
+QUARANTINE_FILENAME = 'fifa21_quarantine.parquet'
+
+#Source -> transformed names, applied in a single rename
+COLUMN_RENAMES = {
+    entry['source']: entry['target'] for entry in TRANSFORM_REGISTRY if entry['source'] != entry['target']
+}
+
 #Columns to Drop
 
 COLUMNS_TO_DROP = ['W/F', 'SM', 'IR','Contract']
@@ -50,18 +114,118 @@ COLUMNS_TO_DROP = ['W/F', 'SM', 'IR','Contract']
 #Other parameters
 DROP_AXIS = 1
 
+#Processes used by transform_fifa_data (1 = serial)
+TRANSFORM_WORKERS = 1
+
+#Convert each distinct string once (factorize + memoized converter + take)
+#instead of every row. Columns with more distinct values than the memo holds
+#go through the vectorized converters.
+CONVERTER_FACTORIZE = True
+CONVERTER_CACHE_SIZE = 4096
+
+#Incremental mode: only transform players that are new or changed since the
+#previous run (raw snapshot + cleaned rows kept in data/incremental/)
+TRANSFORM_INCREMENTAL = False
+INCREMENTAL_SUBDIR = 'incremental'
+
 #=====LOAD SETTING====
 
 #Output directories
 PROCESSED_SUBDIR = 'processed'
 
+#=====RUN CACHE=====
+#Cleaned output of previous runs, keyed by raw file hash, code version and
+#the settings below (data/cache/)
+RUN_CACHE_ENABLED = True
+CACHE_SUBDIR = 'cache'
+RUN_CACHE_MAX_MB = 500 #Least recently used entries are evicted above this
+RUN_CACHE_KEY_SETTINGS = [
+    'CSV_TYPED_SCHEMA',
+    'CSV_ARROW_DTYPES',
+    'TRANSFORM_REGISTRY',
+    'TRANSFORM_STRICT',
+    'COLUMNS_TO_DROP',
+]
+#Writer settings: changing any of them rewrites the outputs of a cached run
+RUN_CACHE_OUTPUT_SETTINGS = [
+    'SAVE_INDEX',
+    'EXCEL_ENGINE',
+    'EXCEL_STREAMING',
+    'EXCEL_MAX_ROWS',
+    'JSON_ORIENT',
+    'JSON_INDENT',
+    'COMPRESSION_LEVELS',
+    'PARQUET_COMPRESSION',
+    'PARQUET_COMPRESSION_LEVEL',
+    'PARQUET_ROW_GROUP_SIZE',
+    'PARQUET_USE_DICTIONARY',
+    'PARQUET_PARTITION_COLS',
+    'PARQUET_SORT_BY',
+    'FEATHER_COMPRESSION',
+    'FEATHER_COMPRESSION_LEVEL',
+    'SQL_TABLE',
+    'SQL_INDEX_COLUMNS',
+    'SQL_WRITE_MODE',
+]
+
 #Output filenames
-DEFAULT_OUTPUT_FILENAME = 'fifa_cleaned'
+DEFAULT_OUTPUT_FILENAME = 'fifa21_cleaned'
 SUMMARY_FILENAME = 'data_summary.txt'
 
 #File formats
-DEFAULT_OUTPUT_FORMATS= ['csv', 'excel', 'json','parquet']
+DEFAULT_OUTPUT_FORMATS= ['csv', 'excel', 'json','parquet', 'feather']
+
+#File extension when it differs from the format name
+FORMAT_EXTENSIONS = {
+    'excel': 'xlsx',
+    'pickle': 'pkl',
+    'sql': 'db',
+}
+
+#Multi-file runs write the same formats under their own name, with the Parquet
+#output partitioned by season (fifa_batch_cleaned.parquet/Season=fifa20/...)
+BATCH_OUTPUT_FILENAME = 'fifa_batch_cleaned'
+BATCH_PARTITION_COLS = [COL_SEASON]
+
+#Output targets written by run_pipeline, each exactly once.
+#Keys: 'format', optional 'base_filename' and 'name' (defaults to the format).
+#'sql' targets write a SQLite file <base_filename>.db, or take a SQLAlchemy
+#'url' instead, e.g. {'format': 'sql', 'url': 'postgresql://user@host/fifa'}
+OUTPUT_TARGETS = [
+    {'format': fmt, 'base_filename': DEFAULT_OUTPUT_FILENAME} for fmt in DEFAULT_OUTPUT_FORMATS
+]
+BATCH_OUTPUT_TARGETS = [
+    {'format': fmt, 'base_filename': BATCH_OUTPUT_FILENAME} for fmt in DEFAULT_OUTPUT_FORMATS
+]
+
+#Dry-run cost model: format -> (output size / raw CSV size, write speed in MB/s)
+OUTPUT_COST_ESTIMATES = {
+    'csv': (1.0, 60),
+    'excel': (0.8, 0.5),
+    'xlsx': (0.8, 0.5),
+    'json': (2.5, 60),
+    'jsonl': (2.2, 60),
+    'jsonl.gz': (0.35, 20),
+    'jsonl.zst': (0.3, 55),
+    'csv.gz': (0.28, 27),
+    'csv.zst': (0.29, 52),
+    'csv.bz2': (0.2, 28),
+    'parquet': (0.3, 100),
+    'feather': (0.6, 300),
+    'pickle': (1.5, 300),
+    'pkl': (1.5, 300),
+    'sql': (1.2, 15),
+}
+
+#Formats that can be appended chunk by chunk in streaming mode
+#(excel, feather and the compressed csv.* / jsonl.* formats can be added too)
+STREAM_OUTPUT_FORMATS = ['csv', 'parquet', 'jsonl']
+
 
+#Write the output formats concurrently ('thread' or 'process' executor)
+LOAD_PARALLEL = True
+LOAD_EXECUTOR = 'thread'
+LOAD_WORKERS = None #None = one worker per format
 
 #File Encoding
 FILE_ENCODING = 'utf-8'
@@ -71,7 +235,60 @@ SAVE_INDEX = False #For csv,excel & parquet
 EXCEL_ENGINE = 'openpyxl'
 PARQUET_ENGINE = 'pyarrow'
 JSON_ORIENT = 'records'
-JSON_INDENT = 2
+JSON_INDENT = 2 #None writes compact JSON on a single line (~25% smaller)
+
+#Excel writer: stream rows into a write-only workbook (openpyxl write_only,
+#or xlsxwriter constant_memory with EXCEL_ENGINE = 'xlsxwriter') instead of
+#building the whole workbook in memory with to_excel
+EXCEL_STREAMING = True
+EXCEL_MAX_ROWS = 1_048_576 #Rows per sheet incl. header (Excel's limit), then Sheet2, ...
+EXCEL_SHEET_PREFIX = 'Sheet'
+
+#Rows converted at a time by the chunked writers (Excel, JSON Lines, compressed CSV)
+WRITE_CHUNK_ROWS = 10_000
+
+#Level per codec of the compressed text formats ('csv.gz', 'csv.zst', 'csv.bz2',
+#'jsonl.gz', 'jsonl.zst')
+COMPRESSION_LEVELS = {
+    'gzip': 6,
+    'zstd': 3,
+    'bz2': 9,
+}
+
+#Parquet writer options
+PARQUET_COMPRESSION = 'snappy' #'snappy', 'zstd', 'gzip', 'brotli', 'lz4' or None
+PARQUET_COMPRESSION_LEVEL = None #None = codec default (e.g. zstd 1-22, gzip 1-9)
+PARQUET_ROW_GROUP_SIZE = 100_000 #Rows per row group, the unit readers can skip
+PARQUET_USE_DICTIONARY = True #True, False or a list of columns to dictionary-encode
+#Hive-style partitioning, e.g. ['Nationality'] or ['Best Position']: the output
+#becomes a directory fifa21_cleaned.parquet/Nationality=Brazil/<file>.parquet
+PARQUET_PARTITION_COLS = []
+#Sort rows by these columns before writing so each row group's min/max
+#statistics cover a narrow range, e.g. ['Best Position'] (None = keep order)
+PARQUET_SORT_BY = None
+
+#Feather (Arrow IPC file) writer: 'lz4', 'zstd' or None. Uncompressed files are
+#memory-mapped zero-copy by load_cleaned_data; compressed ones are smaller but
+#have to be decompressed into memory when read
+FEATHER_COMPRESSION = None
+FEATHER_COMPRESSION_LEVEL = None #None = codec default
+FEATHER_CHUNK_ROWS = 65_536 #Rows per record batch
+
+#SQL target: the cleaned frame replaces SQL_TABLE in one transaction, inserted
+#SQL_CHUNK_ROWS rows at a time (SQL_INSERT_METHOD None = executemany,
+#'multi' = multi-row INSERT ... VALUES, capped by the driver's bind limit)
+SQL_TABLE = 'fifa21_players'
+SQL_CHUNK_ROWS = 10_000
+SQL_INSERT_METHOD = None
+#Indexed columns (the ID index is unique)
+SQL_INDEX_COLUMNS = [COL_ID, 'Club', 'Nationality', 'Best Position']
+#'replace' rewrites the table every run; 'upsert' merges the rows into it on ID
+#(new IDs inserted, changed rows updated, unchanged and removed rows left as is)
+SQL_WRITE_MODE = 'replace'
+
+#Stage profile of each run (wall/CPU time, peak memory), saved next to the outputs
+RUN_METRICS_FILENAME = 'run_metrics.json'
+PROFILE_TRACEMALLOC = False #Also trace Python allocations per stage (slower)
 
 #Summary report settings
 SUMMARY_SEPARATOR = "=" * 60
@@ -83,6 +300,14 @@ MB_CONVERSION = 1024 * 1024
 #=====Logging settings======
 LOG_LEVEL = 'INFO'
 LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
-LOG_DIR = 'logs'
+LOG_DIR = 'logs' #Under the project root
 LOG_FILENAME_PREFIX = 'pipeline'
+LOG_FILENAME = f'{LOG_FILENAME_PREFIX}.log' #One file, rotated instead of one file per run
+#'size' rotates when the file reaches LOG_MAX_MB, 'time' at LOG_ROTATE_WHEN
+#(TimedRotatingFileHandler 'when', e.g. 'midnight'); only the newest
+#LOG_BACKUP_COUNT rotated files are kept (pipeline.log.1, ...)
+LOG_ROTATION = 'size'
+LOG_MAX_MB = 10
+LOG_ROTATE_WHEN = 'midnight'
+LOG_BACKUP_COUNT = 7
 
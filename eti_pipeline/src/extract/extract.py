@@ -8,8 +8,8 @@ import logging
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..','..','..')))
 from datetime import datetime
 from eti_pipeline.src.utilis.path_utilis import PROJECT_ROOT
-from eti_pipeline.src.utilis.logger_utilis import setup_logging 
-from eti_pipeline.src.utilis.file_utilis import load_csv_safe
+from eti_pipeline.src.utilis.file_utilis import load_csv_safe, iter_csv_safe
+from eti_pipeline.src.extract.schema import RAW_SCHEMA
 
 
 
@@ -17,17 +17,71 @@ from config.config import(
     DATA_DIR,
     RAW_FILENAME,
     RAW_SUBDIR,
+    PROCESSED_SUBDIR,
+    DEFAULT_OUTPUT_FILENAME,
     CSV_LOW_MEMORY,
+    CSV_TYPED_SCHEMA,
+    CSV_ENGINE,
+    CSV_ARROW_DTYPES,
+    STREAM_CHUNKSIZE,
     LOG_FORMAT,
     LOG_LEVEL
 )
 
-# Setup logger
-logger = setup_logging(__file__)
+# Setup logger (handlers are configured by the entry point, see setup_logging)
+logger = logging.getLogger(__name__)
 
-def load_raw_data(file_path=None):
+def default_raw_path():
+    """Return the location of the raw fifa21 CSV inside data/raw/"""
+    #Get to the script's directory and go to the project path
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    #Go up: Extract- src-eti_pipeline-simple_project1
+    project_root = os.path.join(script_dir,'..','..','..')
+    return os.path.join(project_root, DATA_DIR,RAW_SUBDIR,RAW_FILENAME)
+
+def raw_schema(column_map=None):
+    """Return the read schema for the raw CSV, or None when disabled in config
+
+    With a column_map (file column -> FIFA 21 name) the dtypes are keyed by
+    the file's own column names.
+    """
+    if not CSV_TYPED_SCHEMA:
+        return None
+    if not column_map:
+        return RAW_SCHEMA
+    dtypes = {column: dtype for column, dtype in RAW_SCHEMA['dtype'].items() if column not in column_map.values()}
+    dtypes.update({column: RAW_SCHEMA['dtype'][renamed] for column, renamed in column_map.items()
+                   if renamed in RAW_SCHEMA['dtype']})
+    return {**RAW_SCHEMA, 'dtype': dtypes}
+
+def raw_read_options(engine=CSV_ENGINE):
+    """Return the pd.read_csv options for the configured parser engine
+
+    engine='pyarrow' parses the file with pyarrow.csv on all cores and, with
+    CSV_ARROW_DTYPES, keeps Arrow-backed dtypes; 'c' is the default parser.
+    Both engines read integer columns untyped and narrow them with the same
+    range checks (see read_csv_typed), so they give the same values.
+    """
+    if engine == 'pyarrow':
+        options = {'engine': 'pyarrow'}
+        if CSV_ARROW_DTYPES:
+            options['dtype_backend'] = 'pyarrow'
+        return options
+    return {'low_memory': CSV_LOW_MEMORY}
+
+def load_raw_data(file_path=None, engine=CSV_ENGINE, column_map=None):
 
     """Load raw fifa21 data from csv file
+
+       Columns are read with the dtypes declared in schema.py and the
+       columns the Transform step drops are skipped.
+
+       Args:
+        file_path (str): Raw CSV, defaults to data/raw/RAW_FILENAME
+        engine (str): CSV parser, 'c' or 'pyarrow'
+        column_map (dict): Renames to FIFA 21 column names for files of
+            another season, see RAW_COLUMN_MAPS
        Raises:
         FileNotFoundError: If CSV file doesn't exist
         pd.errors.EmptyDataError: If CSV is empty
@@ -35,22 +89,85 @@ def load_raw_data(file_path=None):
     
     """
     if file_path is None:
-        #Get to the script's directory and go to the project path
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-
-        #Go up: Extract- src-eti_pipeline-simple_project1
-        project_root = os.path.join(script_dir,'..','..','..')
-        file_path = os.path.join(project_root, DATA_DIR,RAW_SUBDIR,RAW_FILENAME)
+        file_path = default_raw_path()
 
     logging.info(f"\n🔄 Extract: Loading data from: {os.path.basename(file_path)}")
     logging.info(f" 📂 Location: {file_path}")
+    logging.info(f" ⚙️  Parser engine: {engine}")
 
     # load_csv_safe now raises exceptions instead of returning None
-    df = load_csv_safe(file_path, low_memory=CSV_LOW_MEMORY)
+    df = load_csv_safe(file_path, schema=raw_schema(column_map), **raw_read_options(engine))
+    if column_map:
+        df.rename(columns=column_map, inplace=True)
     
     logging.info(f"✅ Extraction complete!")
     return df
+
+def load_raw_data_chunks(file_path=None, chunksize=STREAM_CHUNKSIZE):
+    """Stream raw fifa21 data from csv file in chunks of at most chunksize rows
+
+       Yields:
+        pd.DataFrame: The next chunk of raw rows, in file order
+       Raises:
+        FileNotFoundError: If CSV file doesn't exist
+        pd.errors.EmptyDataError: If CSV is empty
+        pd.errors.ParserError: If CSV is corrupted
+    """
+    if file_path is None:
+        file_path = default_raw_path()
+
+    # The pyarrow engine cannot read in chunks, streaming always uses 'c'
+    logging.info(f"\n🔄 Extract: Streaming data from: {os.path.basename(file_path)}")
+    logging.info(f" 📂 Location: {file_path}")
+
+    yield from iter_csv_safe(file_path, chunksize, schema=raw_schema(), **raw_read_options('c'))
     
+def default_cleaned_path():
+    """Return the Feather output of the Load step, data/processed/<name>.feather"""
+    return os.path.join(PROJECT_ROOT, DATA_DIR, PROCESSED_SUBDIR, f"{DEFAULT_OUTPUT_FILENAME}.feather")
+
+def load_cleaned_data(file_path=None, columns=None, as_table=False):
+    """Open the cleaned FIFA table written by the Load step
+
+       Feather/Arrow IPC files are memory-mapped: with FEATHER_COMPRESSION =
+       None the Arrow table points straight into the file (zero-copy), so
+       opening it costs no parsing and almost no memory. Parquet outputs
+       (single files or partitioned directories) and CSV are read too.
+
+       Args:
+        file_path (str): Cleaned file, defaults to data/processed/<name>.feather
+        columns (list): Only read these columns
+        as_table (bool): Return the pyarrow.Table instead of a DataFrame
+       Returns:
+        pd.DataFrame or pa.Table: Cleaned data
+       Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    if file_path is None:
+        file_path = default_cleaned_path()
+
+    if not os.path.exists(file_path):
+        error_msg = f"❌ Cleaned data not found: {file_path} (run the pipeline first)"
+        logging.error(error_msg)
+        raise FileNotFoundError(error_msg)
+
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension in ('.feather', '.arrow', '.ipc'):
+        table = feather.read_table(file_path, columns=columns, memory_map=True)
+    elif extension == '.parquet' or os.path.isdir(file_path):
+        table = pq.read_table(file_path, columns=columns, memory_map=True)
+    else:
+        data = load_csv_safe(file_path, usecols=columns)
+        logging.info(f"📂 Cleaned data opened: {os.path.basename(file_path)} ({len(data):,} rows)")
+        return pa.Table.from_pandas(data, preserve_index=False) if as_table else data
+
+    logging.info(f"📂 Cleaned data opened: {os.path.basename(file_path)} ({table.num_rows:,} rows)")
+    return table if as_table else table.to_pandas()
+
 # Test code
 if __name__ == "__main__":
     #logging configuration
@@ -0,0 +1,55 @@
+import os
+import sys
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config.config import COLUMNS_TO_DROP, COL_ID
+
+#Single attribute ratings, capped at 99 by the game
+RATING_COLUMNS = [
+    'Age', '↓OVA', 'POT', 'BOV',
+    'Crossing', 'Finishing', 'Heading Accuracy', 'Short Passing', 'Volleys',
+    'Dribbling', 'Curve', 'FK Accuracy', 'Long Passing', 'Ball Control',
+    'Acceleration', 'Sprint Speed', 'Agility', 'Reactions', 'Balance',
+    'Shot Power', 'Jumping', 'Stamina', 'Strength', 'Long Shots',
+    'Aggression', 'Interceptions', 'Positioning', 'Vision', 'Penalties', 'Composure',
+    'Marking', 'Standing Tackle', 'Sliding Tackle',
+    'GK Diving', 'GK Handling', 'GK Kicking', 'GK Positioning', 'GK Reflexes',
+    'PAC', 'SHO', 'PAS', 'DRI', 'DEF', 'PHY',
+]
+
+#Sums of ratings (Total Stats tops out around 2,300)
+TOTAL_COLUMNS = [
+    'Attacking', 'Skill', 'Movement', 'Power', 'Mentality', 'Defending', 'Goalkeeping',
+    'Total Stats', 'Base Stats',
+]
+
+#Low-cardinality text columns
+CATEGORY_COLUMNS = [
+    'Nationality', 'Club', 'Positions', 'Preferred Foot', 'Best Position', 'A/W', 'D/W',
+]
+
+#Column -> dtype used when reading the raw CSV. Integer widths come from the
+#game's value ranges; integer columns are narrowed only when every value fits
+#(see narrow_integers), values outside them are kept with inferred dtypes.
+RAW_DTYPES = {
+    COL_ID: 'int32',
+    **{column: 'int8' for column in RATING_COLUMNS},
+    **{column: 'int16' for column in TOTAL_COLUMNS},
+    **{column: 'category' for column in CATEGORY_COLUMNS},
+}
+
+
+def keep_raw_column(column):
+    """usecols filter: skip the columns the Transform step drops anyway"""
+    return column not in COLUMNS_TO_DROP
+
+
+#Read options for the raw fifa21 CSV, see load_csv_safe(schema=...)
+RAW_SCHEMA = {
+    'dtype': RAW_DTYPES,
+    'usecols': keep_raw_column,
+}
@@ -1,11 +1,12 @@
 import pandas as pd
 import os
 import re 
-import sqlite3
-from sqlalchemy import create_engine
+import shutil
 import sys
+import time
 import logging
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 # Add project root to path FIRST
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
@@ -14,8 +15,8 @@ if project_root not in sys.path:
 
 # Import utilities
 from eti_pipeline.src.utilis.path_utilis import PROJECT_ROOT
-from eti_pipeline.src.utilis.logger_utilis import setup_logging
-from eti_pipeline.src.utilis.file_utilis import load_csv_safe
+from eti_pipeline.src.utilis.file_utilis import load_csv_safe, path_size
+from eti_pipeline.src.utilis.logger_utilis import worker_logging_options
 
 
 
@@ -32,13 +33,32 @@ from config.config import(
     #Output filenames
     DEFAULT_OUTPUT_FILENAME,
     SUMMARY_FILENAME,
+    QUARANTINE_FILENAME,
 
     #File formats
     DEFAULT_OUTPUT_FORMATS,
+    FORMAT_EXTENSIONS,
+    OUTPUT_TARGETS,
+    OUTPUT_COST_ESTIMATES,
+    STREAM_OUTPUT_FORMATS,
+
+    #Parallel writer settings
+    LOAD_PARALLEL,
+    LOAD_EXECUTOR,
+    LOAD_WORKERS,
 
     #Pandas Save Parameters
     EXCEL_ENGINE,
+    EXCEL_STREAMING,
+    EXCEL_MAX_ROWS,
+    WRITE_CHUNK_ROWS,
     PARQUET_ENGINE,
+    PARQUET_ROW_GROUP_SIZE,
+    PARQUET_PARTITION_COLS,
+    PARQUET_SORT_BY,
+    FEATHER_COMPRESSION,
+    FEATHER_COMPRESSION_LEVEL,
+    FEATHER_CHUNK_ROWS,
     SAVE_INDEX,
     JSON_INDENT,
     JSON_ORIENT,
@@ -61,66 +81,477 @@ from config.config import(
 
 )
 
-# Setup logger
-logger = setup_logging(__name__)
+# Setup logger (handlers are configured by the entry point, see setup_logging)
+logger = logging.getLogger(__name__)
 
 from eti_pipeline.src.transform.transform import transform_fifa_data
+from eti_pipeline.src.load.stream_writers import (
+    STREAM_WRITERS,
+    ExcelChunkWriter,
+    is_streamable,
+    open_stream_writer,
+    parquet_write_options
+)
+from eti_pipeline.src.load.sql_writer import write_sql, is_database_url, display_target
+from eti_pipeline.src.utilis.compression_utilis import split_compressed_format
+from eti_pipeline.src.utilis.profile_utilis import profile_stage
+
+def default_output_dir():
+    """Return data/processed/ under the project root"""
+    # Use PROJECT_ROOT from utilities instead of manual path construction
+    return os.path.join(PROJECT_ROOT, DATA_DIR, PROCESSED_SUBDIR)
+
+
+class SavedFiles(dict):
+    """format -> path of every file saved, plus what happened per format.
+
+    Behaves like the plain dict save_cleaned_data always returned, with
+    extra attributes:
+        timings (dict): format -> seconds spent writing it
+        errors (dict): format -> error message for formats that failed
+        compression (dict): compressed format -> codec, uncompressed and
+            compressed bytes, compression ratio and write throughput (MB/s
+            of uncompressed text), see compression_stats
+        sql (dict): sql target -> rows inserted, updated and unchanged
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.timings = {}
+        self.errors = {}
+        self.compression = {}
+        self.sql = {}
+
+
+def output_filepath(output_dir, base_filename, fmt):
+    """Return the file a format is written to, e.g. 'excel' -> base.xlsx"""
+    return os.path.join(output_dir, f"{base_filename}.{FORMAT_EXTENSIONS.get(fmt, fmt)}")
+
+
+def write_format(raw_data, fmt, filepath, stats=None, partition_cols=None):
+    """Write raw_data to filepath in one format.
+
+    Args:
+        partition_cols (list): Parquet partition columns, defaults to
+            PARQUET_PARTITION_COLS
+        stats (dict): Filled with 'uncompressed_bytes' for compressed
+            formats ('csv.gz', 'jsonl.zst', ...) and 'sql_rows' for 'sql'
+
+    Returns:
+        str: Path of the file written, or None if the format is unknown
+    """
+    base_format, compression = split_compressed_format(fmt)
+
+    if fmt == 'csv':
+        raw_data.to_csv(filepath, index=SAVE_INDEX)
+        logging.info(f" CSV saved:{filepath}")
+    elif compression and base_format == 'csv':
+        writer = write_in_chunks(raw_data, open_stream_writer(fmt, filepath))
+        if stats is not None:
+            stats['uncompressed_bytes'] = writer.uncompressed_bytes
+        logging.info(f" CSV ({compression}) saved: {filepath}")
+    elif fmt == 'excel' or fmt == 'xlsx':
+        if EXCEL_STREAMING:
+            write_excel(raw_data, filepath)
+        else:
+            raw_data.to_excel(filepath,index=SAVE_INDEX, engine=EXCEL_ENGINE)
+        logging.info(f" Excel saved:{filepath}")
+
+    elif fmt == 'json':
+         raw_data.to_json(filepath, orient=JSON_ORIENT, indent= JSON_INDENT)
+         logging.info(f" JSON saved: {filepath}")
+
+    elif base_format == 'jsonl':
+         writer = write_in_chunks(raw_data, open_stream_writer(fmt, filepath))
+         if stats is not None and compression:
+              stats['uncompressed_bytes'] = writer.uncompressed_bytes
+         logging.info(f" JSON Lines saved: {filepath}")
+
+    elif fmt == 'parquet':
+        write_parquet(raw_data, filepath, partition_cols=partition_cols)
+        logging.info(f" Parquet saved: {filepath}")
+
+    elif fmt == 'feather':
+         write_feather(raw_data, filepath)
+         logging.info(f" Feather saved:{filepath}")
+        
+    elif fmt == 'sql':
+         rows = write_sql(raw_data, filepath)
+         if stats is not None:
+              stats['sql_rows'] = rows
+         logging.info(f" SQL saved into {display_target(filepath)}: {rows['inserted']:,} inserted, "
+                      f"{rows['updated']:,} updated, {rows['unchanged']:,} unchanged")
+
+    elif fmt == 'pickle' or fmt == 'pkl':
+         raw_data.to_pickle(filepath)
+         logging.info(f"Pickled saved: {filepath}")
+    else:
+         return None
+    return filepath
+
+
+def write_in_chunks(raw_data, writer):
+    """Feed raw_data to a chunk writer WRITE_CHUNK_ROWS rows at a time, then close it
+
+    Returns:
+        The closed writer
+    """
+    try:
+        for start in range(0, max(len(raw_data), 1), WRITE_CHUNK_ROWS):
+            writer.write(raw_data.iloc[start:start + WRITE_CHUNK_ROWS])
+    finally:
+        writer.close()
+    return writer
+
+
+def write_excel(raw_data, filepath, max_rows=EXCEL_MAX_ROWS, engine=EXCEL_ENGINE):
+    """Stream raw_data into a write-only workbook, chunk by chunk.
+
+    Only one chunk is converted to Python values at a time and rows are
+    written as they are produced, see ExcelChunkWriter. Outputs longer than
+    Excel's row limit are split across sheets.
+
+    Returns:
+        int: Number of sheets written
+    """
+    writer = ExcelChunkWriter(filepath, engine=engine, max_rows=max_rows)
+    write_in_chunks(raw_data, writer)
 
-def save_cleaned_data(raw_data, base_filename=DEFAULT_OUTPUT_FILENAME, formats=None):
-    """Saves fifa cleaned data to multiple options."""
+    if writer.sheet_count > 1:
+        logging.info(f" Excel row limit reached, rows split across {writer.sheet_count} sheets")
+    return writer.sheet_count
+
+
+def write_feather(raw_data, filepath):
+    """Write raw_data as a Feather v2 (Arrow IPC) file.
+
+    Goes through pyarrow with preserve_index=SAVE_INDEX, so any index
+    (sliced, shuffled, non-zero RangeIndex) is dropped like in the other
+    formats instead of being rejected or stored, and FEATHER_COMPRESSION
+    picks the codec ('lz4', 'zstd' or None for memory-mappable files).
+    """
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    table = pa.Table.from_pandas(raw_data, preserve_index=SAVE_INDEX)
+    feather.write_feather(
+        table,
+        filepath,
+        compression=FEATHER_COMPRESSION or 'uncompressed',
+        compression_level=FEATHER_COMPRESSION_LEVEL,
+        chunksize=FEATHER_CHUNK_ROWS
+    )
+    return filepath
+
+
+def write_parquet(raw_data, filepath, partition_cols=None, sort_by=None):
+    """Write raw_data as Parquet with the PARQUET_* options from config.
+
+    With partition columns the output is a Hive-style directory with one
+    sub-directory per value (Nationality=Brazil/...), so readers filtering on
+    those columns only open the matching files. Within each file, rows are
+    split into row groups of PARQUET_ROW_GROUP_SIZE rows whose min/max
+    statistics let readers skip the groups a filter rules out.
+
+    Args:
+        raw_data (pd.DataFrame): Cleaned Fifa data
+        filepath (str): Output file, or directory when partitioned
+        partition_cols (list): Defaults to PARQUET_PARTITION_COLS
+        sort_by (list): Defaults to PARQUET_SORT_BY
+    """
+    if partition_cols is None:
+        partition_cols = PARQUET_PARTITION_COLS
+    if sort_by is None:
+        sort_by = PARQUET_SORT_BY
+
+    missing = [column for column in list(partition_cols) + list(sort_by or []) if column not in raw_data.columns]
+    if missing:
+        raise ValueError(f"Parquet partition/sort columns not in the data: {missing}")
+
+    if sort_by:
+        raw_data = raw_data.sort_values(list(sort_by), kind='stable')
+
+    # A previous run may have left a file where a directory goes (or the
+    # reverse), and stale partitions must not survive a rewrite
+    if os.path.isdir(filepath):
+        shutil.rmtree(filepath)
+    elif os.path.exists(filepath) and partition_cols:
+        os.remove(filepath)
+
+    raw_data.to_parquet(
+        filepath,
+        index=SAVE_INDEX,
+        engine=PARQUET_ENGINE,
+        partition_cols=list(partition_cols) or None,
+        row_group_size=PARQUET_ROW_GROUP_SIZE,
+        **parquet_write_options()
+    )
+    return filepath
+
+
+def save_one_format(raw_data, fmt, filepath, partition_cols=None):
+    """Write one format and time it, capturing any error instead of raising.
+
+    Returns:
+        tuple: (filepath, seconds, error, stats) - filepath is None when
+        nothing was written, error is None on success and stats holds what
+        write_format reported
+    """
+    stats = {}
+    start = time.perf_counter()
+    try:
+        with profile_stage(fmt):
+            saved_path = write_format(raw_data, fmt, filepath, stats, partition_cols=partition_cols)
+        error = None if saved_path is not None else f"Unknown format: {fmt}"
+    except Exception as e:
+        saved_path = None
+        error = f"{type(e).__name__}: {str(e)}"
+    return saved_path, time.perf_counter() - start, error, stats
+
+
+def compression_stats(fmt, filepath, seconds, uncompressed):
+    """Compression ratio and write throughput of a compressed output
+
+    Returns:
+        dict: codec, uncompressed_bytes, compressed_bytes, ratio
+        (uncompressed / compressed) and mb_per_second (uncompressed MB
+        written per second)
+    """
+    compressed = os.path.getsize(filepath)
+    return {
+        'codec': split_compressed_format(fmt)[1],
+        'uncompressed_bytes': uncompressed,
+        'compressed_bytes': compressed,
+        'ratio': round(uncompressed / compressed, 2) if compressed else None,
+        'mb_per_second': round(uncompressed / MB_CONVERSION / seconds, 1) if seconds else None,
+    }
+
+
+def save_cleaned_data(raw_data, base_filename=DEFAULT_OUTPUT_FILENAME, formats=None, output_dir=None,
+                      parallel=LOAD_PARALLEL, executor=LOAD_EXECUTOR):
+    """Saves fifa cleaned data to multiple options.
+
+    With parallel=True every format is written concurrently, so the Load step
+    takes about as long as the slowest format instead of the sum of all of
+    them. executor='thread' shares the frame with the writers;
+    executor='process' pickles it once per format but also runs the
+    pure-Python openpyxl writer outside this process's GIL.
+
+    Returns:
+        SavedFiles: format -> path, with per-format timings and errors
+    """
 
     if formats is None:
         formats=DEFAULT_OUTPUT_FORMATS
 
-    # Use PROJECT_ROOT from utilities instead of manual path construction
-    output_dir = os.path.join(PROJECT_ROOT, DATA_DIR, PROCESSED_SUBDIR)
-    os.makedirs(output_dir, exist_ok=True)
+    if output_dir is None:
+        output_dir = default_output_dir()
+
+    targets = {fmt: (fmt, output_filepath(output_dir, base_filename, fmt)) for fmt in formats}
+    return save_targets(raw_data, targets, parallel=parallel, executor=executor)
 
-    saved_files= {}
 
-    logging.info(f"\n Saving cleaned data in {len(formats)} format(s)...")
+def save_targets(raw_data, targets, parallel=LOAD_PARALLEL, executor=LOAD_EXECUTOR, partition_cols=None):
+    """Write raw_data once per target.
+
+    Args:
+        raw_data (pd.DataFrame): Cleaned Fifa data
+        targets (dict): name -> (format, filepath)
+        parallel (bool): Write the targets concurrently
+        executor (str): 'thread' or 'process'
+        partition_cols (list): Parquet partition columns, defaults to
+            PARQUET_PARTITION_COLS
+
+    Returns:
+        SavedFiles: name -> path, with per-target timings and errors
+    """
+
+    for _, filepath in targets.values():
+        if not is_database_url(filepath):
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+
+    saved_files = SavedFiles()
+
+    logging.info(f"\n Saving cleaned data in {len(targets)} format(s)...")
     logging.info("=" * 50)
 
+    start = time.perf_counter()
+
     #Save in each requested format
 
-    for fmt in formats:
-        filepath = os.path.join(output_dir, f"{base_filename}.{fmt}")
+    if parallel and len(targets) > 1:
+        if executor == 'process':
+            pool = ProcessPoolExecutor(max_workers=LOAD_WORKERS or len(targets), **worker_logging_options())
+        else:
+            pool = ThreadPoolExecutor(max_workers=LOAD_WORKERS or len(targets))
+        with pool:
+            futures = {name: pool.submit(save_one_format, raw_data, fmt, filepath, partition_cols)
+                       for name, (fmt, filepath) in targets.items()}
+        results = {name: future.result() for name, future in futures.items()}
+    else:
+        results = {name: save_one_format(raw_data, fmt, filepath, partition_cols)
+                   for name, (fmt, filepath) in targets.items()}
+
+    for name, (filepath, seconds, error, stats) in results.items():
+        saved_files.timings[name] = seconds
+        if error is None:
+            saved_files[name] = filepath
+            if stats.get('uncompressed_bytes') is not None:
+                saved_files.compression[name] = compression_stats(targets[name][0], filepath, seconds,
+                                                                  stats['uncompressed_bytes'])
+            if 'sql_rows' in stats:
+                saved_files.sql[name] = stats['sql_rows']
+        else:
+            saved_files.errors[name] = error
+            logging.error(f"Error saving {name}: {error}")
 
+    logging.info(SUMMARY_SEPARATOR)
+    logging.info(f"Saved {len(saved_files)} file(s) successfully in {time.perf_counter() - start:.2f}s!")
+    for name, seconds in saved_files.timings.items():
+        logging.info(f"   {name}: {seconds:.2f}s")
+    for name, stats in saved_files.compression.items():
+        logging.info(f"   {name}: {stats['codec']} ratio {stats['ratio']:.1f}x, {stats['mb_per_second']:.1f} MB/s")
+    logging.info(f"   Total size: {raw_data.shape[0]:,} rows × {raw_data.shape[1]} columns")
+    
+    return saved_files
+
+
+def resolve_output_targets(targets=None, output_dir=None):
+    """Turn declarative output targets into the files they produce.
+
+    Targets that would write the same file (e.g. 'excel' and 'xlsx' with the
+    same base filename) are only kept once.
+
+    Args:
+        targets (list): Target dicts with 'format' and optional 'base_filename',
+            'name' and, for 'sql', 'url'; defaults to OUTPUT_TARGETS
+        output_dir (str): Target directory, defaults to data/processed/
+
+    Returns:
+        dict: name -> (format, filepath), in declaration order; filepath is
+        the database URL of 'sql' targets that have one
+    """
+
+    if targets is None:
+        targets = OUTPUT_TARGETS
+    if output_dir is None:
+        output_dir = default_output_dir()
+
+    resolved = {}
+    for target in targets:
+        fmt = target['format']
+        name = target.get('name', fmt)
+        filepath = target.get('url') or output_filepath(output_dir, target.get('base_filename', DEFAULT_OUTPUT_FILENAME), fmt)
+
+        if any(filepath == planned for _, planned in resolved.values()):
+            logging.warning(f" Output target '{name}' writes {filepath} again, skipping it")
+            continue
+        if name in resolved:
+            raise ValueError(f"Duplicate output target name: {name}")
+        resolved[name] = (fmt, filepath)
+    return resolved
+
+
+def save_output_targets(raw_data, targets=None, output_dir=None, partition_cols=None):
+    """Write every declared output target exactly once.
+
+    Returns:
+        SavedFiles: target name -> path, with per-target timings and errors
+    """
+    return save_targets(raw_data, resolve_output_targets(targets, output_dir), partition_cols=partition_cols)
+
+
+def plan_output_targets(input_bytes, targets=None, output_dir=None):
+    """Describe the writes a run would make, without writing anything.
+
+    Sizes and durations are rough estimates scaled from the raw CSV size
+    with the per-format factors in OUTPUT_COST_ESTIMATES.
+
+    Args:
+        input_bytes (int): Size of the raw CSV file
+        targets (list): Target dicts, defaults to OUTPUT_TARGETS
+        output_dir (str): Target directory, defaults to data/processed/
+
+    Returns:
+        list: One dict per target with name, format, path,
+        estimated_bytes and estimated_seconds
+    """
+    plan = []
+    for name, (fmt, filepath) in resolve_output_targets(targets, output_dir).items():
+        size_ratio, mb_per_second = OUTPUT_COST_ESTIMATES.get(fmt, (1.0, None))
+        estimated_bytes = int(input_bytes * size_ratio)
+        plan.append({
+            'name': name,
+            'format': fmt,
+            'path': filepath,
+            'estimated_bytes': estimated_bytes,
+            'estimated_seconds': estimated_bytes / MB_CONVERSION / mb_per_second if mb_per_second else None,
+        })
+    return plan
+
+
+def save_cleaned_chunks(chunks, base_filename=DEFAULT_OUTPUT_FILENAME, formats=None, output_dir=None):
+    """Stream cleaned chunks to every requested format as they arrive.
+
+    Only one chunk is held in memory at a time: each one is appended to the
+    CSV file, written as a Parquet row group and added to the JSON-lines file
+    before the next chunk is pulled. A format that fails is closed and
+    dropped while the others carry on.
+
+    Args:
+        chunks (iterable of pd.DataFrame): Cleaned chunks, in output order
+        base_filename (str): File name without extension
+        formats (list): Streamable formats, defaults to STREAM_OUTPUT_FORMATS
+        output_dir (str): Target directory, defaults to data/processed/
+
+    Returns:
+        dict: format -> path of every file written successfully
+    """
+
+    if formats is None:
+        formats = STREAM_OUTPUT_FORMATS
+
+    if output_dir is None:
+        output_dir = default_output_dir()
+    os.makedirs(output_dir, exist_ok=True)
+
+    writers = {}
+    for fmt in formats:
+        if not is_streamable(fmt):
+            logging.warning(f" Format '{fmt}' cannot be streamed, skipping it (streamable: {', '.join(STREAM_WRITERS)})")
+            continue
         try:
-            if fmt == 'csv':
-                raw_data.to_csv(filepath, index=SAVE_INDEX)
-                logging.info(f" CSV saved:{filepath}")
-            elif fmt == 'excel' or fmt == 'xlsx':
-                raw_data.to_excel(filepath.replace('.excel','.xlsx'),index=SAVE_INDEX, engine=EXCEL_ENGINE)
-                filepath = filepath.replace('.excel','.xlsx')
-                logging.info(f" Excel saved:{filepath}")
-
-            elif fmt == 'json':
-                 raw_data.to_json(filepath, orient=JSON_ORIENT, indent= JSON_INDENT)
-                 logging.info(f" JSON saved: {filepath}")
-
-            elif fmt == 'parquet':
-                raw_data.to_parquet(filepath, index=SAVE_INDEX, engine=PARQUET_ENGINE)
-                logging.info(f" Parquet saved: {filepath}")
-
-            elif fmt == 'feather':
-                 raw_data.to_feather(filepath)
-                 logging.info(f" Feather saved:{filepath}")
-                
-            elif fmt == 'pickle' or fmt == 'pkl':
-                 raw_data.to_pickle(filepath.replace('.pickle','.pkl'))
-                 filepath = filepath.replace('.pickle','.pkl')
-                 logging.info(f"Pickled saved: {filepath}")
-            else:
-                 logging.info(f" Unknown format: {fmt}")
-                 continue 
-            saved_files[fmt]=filepath
+            writers[fmt] = open_stream_writer(fmt, output_filepath(output_dir, base_filename, fmt))
         except Exception as e:
-             logging.info(f"Error saving{fmt}: {str(e)}")
+            logging.error(f"Error saving {fmt}: {str(e)}")
+
+    logging.info(f"\n Streaming cleaned data to {len(writers)} format(s)...")
+    logging.info("=" * 50)
+
+    total_rows = 0
+    try:
+        for chunk in chunks:
+            for fmt, writer in list(writers.items()):
+                try:
+                    writer.write(chunk)
+                except Exception as e:
+                    logging.error(f"Error saving {fmt}: {str(e)}")
+                    writer.close()
+                    del writers[fmt]
+            total_rows += len(chunk)
+            logging.info(f"   Streamed {total_rows:,} rows")
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    saved_files = {fmt: writer.filepath for fmt, writer in writers.items()}
+    for fmt, filepath in saved_files.items():
+        logging.info(f" {fmt.upper()} saved: {filepath}")
+
     logging.info(SUMMARY_SEPARATOR)
     logging.info(f"Saved {len(saved_files)} file(s) successfully!")
-    logging.info(f"   Total size: {raw_data.shape[0]:,} rows × {raw_data.shape[1]} columns")
-    
+    logging.info(f"   Total size: {total_rows:,} rows")
+
     return saved_files
 
 
@@ -167,6 +598,28 @@ def save_summary_statistics(raw_data, output_path=None):
 
     logging.info(f"Summary stats saved to: {output_path}")
 
+def save_quarantine(quarantine, output_path=None):
+    """Save the strict mode quarantine table (see quarantine_table) as Parquet
+
+    Written on every strict run, empty when nothing was rejected, so the file
+    always belongs to the latest output.
+
+    Args:
+        quarantine (pd.DataFrame): ID, column, raw_value and reason per rejected value
+        output_path (str): Defaults to data/processed/QUARANTINE_FILENAME
+
+    Returns:
+        str: Path of the quarantine file
+    """
+    if output_path is None:
+        output_path = os.path.join(default_output_dir(), QUARANTINE_FILENAME)
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    quarantine.to_parquet(output_path, engine=PARQUET_ENGINE, index=False)
+
+    logging.info(f"🚧 Quarantine ({len(quarantine):,} rejected values) saved to: {output_path}")
+    return output_path
+
 #Testing the function
 
 if __name__ == "__main__":
@@ -192,7 +645,7 @@ if __name__ == "__main__":
         logger.info("\n All files saved successfully!")
         logger.info("\nSaved files:")
         for fmt, path in saved_files.items():
-            file_size = os.path.getsize(path) / MB_CONVERSION  # Convert to MB
+            file_size = path_size(path) / MB_CONVERSION  # Convert to MB
             logger.info(f"  • {fmt.upper()}: {path} ({file_size:.2f} MB)")
     else:
         logger.error("Failed to load data!")
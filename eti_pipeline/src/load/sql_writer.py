@@ -0,0 +1,199 @@
+import os
+import re
+import sys
+import logging
+
+# Add project root to path FIRST
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config.config import (
+    COL_ID,
+    SAVE_INDEX,
+    SQL_TABLE,
+    SQL_CHUNK_ROWS,
+    SQL_INSERT_METHOD,
+    SQL_INDEX_COLUMNS,
+    SQL_WRITE_MODE
+)
+
+#sqlalchemy is imported by the functions that need it: most runs have no SQL
+#target and it is the slowest import of the Load step
+
+#Bound parameters per statement that every supported driver accepts
+#(SQLite >= 3.32 allows 32,766, PostgreSQL 65,535)
+MAX_BIND_PARAMS = 32_766
+
+
+def is_database_url(target):
+    """Whether an output target is a SQLAlchemy URL rather than a file path"""
+    return '://' in target
+
+
+def display_target(target):
+    """Target for logs and summaries, without the password of a URL"""
+    if is_database_url(target):
+        from sqlalchemy import make_url
+        return make_url(target).render_as_string(hide_password=True)
+    return target
+
+
+def sql_engine(target):
+    """SQLAlchemy engine for a database URL or a SQLite file path"""
+    from sqlalchemy import create_engine, event
+
+    if not is_database_url(target):
+        target = f"sqlite:///{os.path.abspath(target)}"
+    engine = create_engine(target)
+
+    if engine.dialect.name == 'sqlite':
+        #pysqlite commits DROP/CREATE TABLE on its own; let SQLAlchemy emit
+        #BEGIN so a failed replace rolls back to the previous table
+        @event.listens_for(engine, 'connect')
+        def disable_pysqlite_transactions(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, 'begin')
+        def begin_transaction(connection):
+            connection.exec_driver_sql('BEGIN')
+
+    return engine
+
+
+def insert_chunksize(columns, method=SQL_INSERT_METHOD, chunksize=SQL_CHUNK_ROWS):
+    """Rows per INSERT: multi-row statements bind one parameter per cell"""
+    if method == 'multi':
+        return max(1, min(chunksize, MAX_BIND_PARAMS // max(columns, 1)))
+    return chunksize
+
+
+def create_indexes(connection, table, columns=None):
+    """Create the SQL_INDEX_COLUMNS indexes of a table, unique on the ID column
+
+    Columns missing from the table are skipped.
+    """
+    from sqlalchemy import inspect, text
+
+    if columns is None:
+        columns = SQL_INDEX_COLUMNS
+    quote = connection.dialect.identifier_preparer.quote
+    present = {column['name'] for column in inspect(connection).get_columns(table)}
+
+    for column in columns:
+        if column not in present:
+            logging.warning(f"⚠️  No '{column}' column in {table}, index skipped")
+            continue
+        name = re.sub(r'\W+', '_', f"ix_{table}_{column}").lower()
+        unique = 'UNIQUE ' if column == COL_ID else ''
+        connection.execute(text(f"CREATE {unique}INDEX IF NOT EXISTS {quote(name)} ON {quote(table)} ({quote(column)})"))
+
+
+def write_sql(raw_data, target, table=SQL_TABLE, mode=None):
+    """Write raw_data to a database table in a single transaction.
+
+    mode='replace' drops and recreates the table: rows are inserted in chunks
+    (executemany, or multi-row INSERTs with SQL_INSERT_METHOD = 'multi'),
+    then the indexes are created. mode='upsert' merges raw_data into the
+    existing table on ID, see upsert_sql. If anything fails the transaction
+    is rolled back and the previous table is kept.
+
+    Args:
+        raw_data (pd.DataFrame): Cleaned Fifa data
+        target (str): SQLite file path or SQLAlchemy URL
+        table (str): Table name
+        mode (str): 'replace' or 'upsert', defaults to SQL_WRITE_MODE
+
+    Returns:
+        dict: Rows 'inserted', 'updated' and 'unchanged'
+    """
+    from sqlalchemy import inspect
+
+    if mode is None:
+        mode = SQL_WRITE_MODE
+    if mode not in ('replace', 'upsert'):
+        raise ValueError(f"Unknown SQL write mode: {mode} (use 'replace' or 'upsert')")
+
+    engine = sql_engine(target)
+    try:
+        with engine.begin() as connection:
+            if mode == 'upsert' and inspect(connection).has_table(table):
+                return upsert_sql(raw_data, connection, table)
+            insert_rows(raw_data, connection, table, if_exists='replace')
+            create_indexes(connection, table)
+    finally:
+        engine.dispose()
+    return {'inserted': len(raw_data), 'updated': 0, 'unchanged': 0}
+
+
+def insert_rows(raw_data, connection, table, if_exists):
+    """Insert raw_data into a table SQL_CHUNK_ROWS rows per statement"""
+    raw_data.to_sql(
+        table,
+        connection,
+        if_exists=if_exists,
+        index=SAVE_INDEX,
+        chunksize=insert_chunksize(raw_data.shape[1] + SAVE_INDEX),
+        method=SQL_INSERT_METHOD
+    )
+
+
+def upsert_sql(raw_data, connection, table):
+    """Merge raw_data into an existing table, keyed on the ID column.
+
+    The rows are staged in a temporary table, counted against the target,
+    then merged with a single INSERT ... ON CONFLICT (ID) DO UPDATE. Rows
+    whose values are all unchanged are not rewritten, and rows missing from
+    raw_data are kept.
+
+    Args:
+        raw_data (pd.DataFrame): Cleaned Fifa data with unique IDs
+        connection (sqlalchemy.Connection): Connection inside a transaction
+        table (str): Existing table, with columns matching raw_data
+
+    Returns:
+        dict: Rows 'inserted', 'updated' and 'unchanged'
+    """
+    from sqlalchemy import text
+
+    if raw_data[COL_ID].duplicated().any():
+        raise ValueError(f"Cannot upsert duplicate {COL_ID}s into {table}")
+
+    quote = connection.dialect.identifier_preparer.quote
+    staging = f"{table}_staging"
+    key = quote(COL_ID)
+
+    #Same columns and types as the target, visible to this connection only
+    connection.execute(text(f"DROP TABLE IF EXISTS {quote(staging)}"))
+    connection.execute(text(f"CREATE TEMPORARY TABLE {quote(staging)} AS SELECT * FROM {quote(table)} WHERE 1 = 0"))
+    insert_rows(raw_data, connection, staging, if_exists='append')
+    create_indexes(connection, table, [COL_ID])
+
+    columns = [quote(column) for column in raw_data.columns]
+    if SAVE_INDEX:
+        columns.insert(0, quote(raw_data.index.name or 'index'))
+    same = 'IS' if connection.dialect.name == 'sqlite' else 'IS NOT DISTINCT FROM'
+
+    def unchanged(left, right):
+        return ' AND '.join(f"{left}.{column} {same} {right}.{column}" for column in columns)
+
+    existing, unchanged_rows = connection.execute(text(
+        f"SELECT COUNT(*), COALESCE(SUM(CASE WHEN {unchanged('s', 't')} THEN 1 ELSE 0 END), 0) "
+        f"FROM {quote(staging)} AS s JOIN {quote(table)} AS t ON s.{key} = t.{key}"
+    )).one()
+
+    updates = ', '.join(f"{column} = excluded.{column}" for column in columns if column != key)
+    column_list = ', '.join(columns)
+    #WHERE true keeps SQLite from reading ON CONFLICT as a join constraint
+    connection.execute(text(
+        f"INSERT INTO {quote(table)} ({column_list}) SELECT {column_list} FROM {quote(staging)} WHERE true "
+        f"ON CONFLICT ({key}) DO UPDATE SET {updates} "
+        f"WHERE NOT ({unchanged(quote(table), 'excluded')})"
+    ))
+    connection.execute(text(f"DROP TABLE {quote(staging)}"))
+
+    return {
+        'inserted': len(raw_data) - existing,
+        'updated': existing - unchanged_rows,
+        'unchanged': unchanged_rows,
+    }
@@ -0,0 +1,265 @@
+import os
+import sys
+import pandas as pd
+
+# Add project root to path FIRST
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from eti_pipeline.src.utilis.compression_utilis import open_compressed, split_compressed_format, uncompressed_bytes
+from config.config import (
+    SAVE_INDEX,
+    JSON_ORIENT,
+    EXCEL_ENGINE,
+    EXCEL_MAX_ROWS,
+    EXCEL_SHEET_PREFIX,
+    PARQUET_COMPRESSION,
+    PARQUET_COMPRESSION_LEVEL,
+    PARQUET_USE_DICTIONARY,
+    FEATHER_COMPRESSION,
+    FEATHER_COMPRESSION_LEVEL
+)
+
+
+def parquet_write_options():
+    """Parquet codec and encoding options from config, for every Parquet writer"""
+    return {
+        'compression': PARQUET_COMPRESSION,
+        'compression_level': PARQUET_COMPRESSION_LEVEL,
+        'use_dictionary': PARQUET_USE_DICTIONARY,
+    }
+
+
+def arrow_ipc_options():
+    """Arrow IPC (Feather) write options from FEATHER_COMPRESSION/_LEVEL"""
+    import pyarrow as pa
+    if FEATHER_COMPRESSION is None:
+        return pa.ipc.IpcWriteOptions()
+    return pa.ipc.IpcWriteOptions(compression=pa.Codec(FEATHER_COMPRESSION, compression_level=FEATHER_COMPRESSION_LEVEL))
+
+
+def stable_arrow_schema(table, keep_dictionaries=False):
+    """Schema for a multi-chunk file: all-null columns become strings and
+    dictionary columns their value type, since every chunk of a streamed
+    frame brings its own categories. With keep_dictionaries (Parquet, which
+    stores a dictionary per row group) dictionary columns are kept with
+    int32 indices, so later chunks may hold more categories than the first"""
+    import pyarrow as pa
+
+    fields = []
+    for field in table.schema:
+        if pa.types.is_null(field.type):
+            field = field.with_type(pa.string())
+        elif pa.types.is_dictionary(field.type) and keep_dictionaries:
+            field = field.with_type(pa.dictionary(pa.int32(), field.type.value_type, field.type.ordered))
+        elif pa.types.is_dictionary(field.type):
+            field = field.with_type(field.type.value_type)
+        fields.append(field)
+    return pa.schema(fields, metadata=table.schema.metadata)
+
+
+class CsvChunkWriter:
+    """Appends chunks to one CSV file, writing the header only once.
+
+    With compression ('gzip', 'zstd' or 'bz2') every chunk is compressed as
+    it is written, so the compressed bytes are never held in memory.
+    """
+
+    extension = 'csv'
+
+    def __init__(self, filepath, compression=None):
+        self.filepath = filepath
+        self._file = open_compressed(filepath, compression, newline='')
+        self._header = True
+
+    def write(self, chunk):
+        chunk.to_csv(self._file, index=SAVE_INDEX, header=self._header)
+        self._header = False
+
+    @property
+    def uncompressed_bytes(self):
+        """Text written so far, for compressed files (None otherwise)"""
+        return uncompressed_bytes(self._file)
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetChunkWriter:
+    """Writes every chunk as its own row group of one Parquet file.
+
+    The first chunk fixes the schema (see stable_arrow_schema) and later
+    chunks are cast to it, so per-chunk dtype inference (int64 vs float64,
+    all-NaN columns, categories) does not break the file.
+    """
+
+    extension = 'parquet'
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self._writer = None
+
+    def write(self, chunk):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(chunk, preserve_index=SAVE_INDEX)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.filepath, stable_arrow_schema(table, keep_dictionaries=True),
+                                           **parquet_write_options())
+
+        self._writer.write_table(table.cast(self._writer.schema))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+class JsonLinesChunkWriter:
+    """Appends chunks to a newline-delimited JSON file, one record per line.
+
+    With compression ('gzip' or 'zstd') every chunk is compressed as it is
+    written; consumers can stream the records back line by line.
+    """
+
+    extension = 'jsonl'
+
+    def __init__(self, filepath, compression=None):
+        self.filepath = filepath
+        self._file = open_compressed(filepath, compression)
+
+    def write(self, chunk):
+        chunk.to_json(self._file, orient=JSON_ORIENT, lines=True)
+
+    @property
+    def uncompressed_bytes(self):
+        return uncompressed_bytes(self._file)
+
+    def close(self):
+        self._file.close()
+
+
+class FeatherChunkWriter:
+    """Appends chunks as record batches of one Arrow IPC (Feather v2) file.
+
+    As with Parquet, the first chunk fixes the schema and later chunks are
+    cast to it; categorical columns are stored as plain strings.
+    """
+
+    extension = 'feather'
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self._writer = None
+
+    def write(self, chunk):
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(chunk, preserve_index=SAVE_INDEX)
+        if self._writer is None:
+            self._schema = stable_arrow_schema(table)
+            self._writer = pa.ipc.new_file(self.filepath, self._schema, options=arrow_ipc_options())
+
+        self._writer.write_table(table.cast(self._schema))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+class ExcelChunkWriter:
+    """Streams chunks into a write-only Excel workbook, row by row.
+
+    Rows go straight to the sheet's XML (openpyxl write_only mode, or
+    xlsxwriter constant_memory with engine='xlsxwriter'), so the workbook is
+    never held in memory. When a sheet reaches max_rows (Excel's limit of
+    1,048,576 rows, header included) the rows continue on the next sheet:
+    Sheet1, Sheet2, ... each with its own header.
+    """
+
+    extension = 'xlsx'
+
+    def __init__(self, filepath, engine=EXCEL_ENGINE, max_rows=EXCEL_MAX_ROWS):
+        self.filepath = filepath
+        self.engine = engine
+        self.max_rows = max_rows
+        self.sheet_count = 0
+        self._sheet = None
+        self._sheet_rows = 0
+        self._header = None
+
+        if engine == 'xlsxwriter':
+            import xlsxwriter
+            self._workbook = xlsxwriter.Workbook(filepath, {'constant_memory': True})
+        else:
+            from openpyxl import Workbook
+            self._workbook = Workbook(write_only=True)
+
+    def _new_sheet(self):
+        self.sheet_count += 1
+        name = f"{EXCEL_SHEET_PREFIX}{self.sheet_count}"
+        if self.engine == 'xlsxwriter':
+            self._sheet = self._workbook.add_worksheet(name)
+        else:
+            self._sheet = self._workbook.create_sheet(name)
+        self._sheet_rows = 0
+        if self._header:
+            self._append(self._header)
+
+    def _append(self, row):
+        if self.engine == 'xlsxwriter':
+            self._sheet.write_row(self._sheet_rows, 0, row)
+        else:
+            self._sheet.append(row)
+        self._sheet_rows += 1
+
+    def write(self, chunk):
+        if SAVE_INDEX:
+            chunk = chunk.reset_index()
+        if self._header is None:
+            self._header = [str(column) for column in chunk.columns]
+            self._new_sheet()
+
+        # Python values with None for every kind of missing value (NaN, NaT, pd.NA)
+        rows = chunk.astype(object).where(chunk.notna(), None).to_numpy().tolist()
+        for row in rows:
+            if self._sheet_rows >= self.max_rows:
+                self._new_sheet()
+            self._append(row)
+
+    def close(self):
+        if self._sheet is None:
+            self._new_sheet()
+        if self.engine == 'xlsxwriter':
+            self._workbook.close()
+        else:
+            self._workbook.save(self.filepath)
+
+
+STREAM_WRITERS = {
+    'csv': CsvChunkWriter,
+    'parquet': ParquetChunkWriter,
+    'jsonl': JsonLinesChunkWriter,
+    'excel': ExcelChunkWriter,
+    'feather': FeatherChunkWriter,
+}
+
+#Formats that can also be written compressed, as '<format>.gz' / '.zst' / '.bz2'
+COMPRESSIBLE_FORMATS = ['csv', 'jsonl']
+
+
+def is_streamable(fmt):
+    """Whether a format (e.g. 'csv', 'jsonl.gz') has a chunk writer"""
+    base, compression = split_compressed_format(fmt)
+    return base in STREAM_WRITERS and (compression is None or base in COMPRESSIBLE_FORMATS)
+
+
+def open_stream_writer(fmt, filepath):
+    """Create the chunk writer of a format, compressed for '<format>.gz' etc."""
+    if not is_streamable(fmt):
+        raise ValueError(f"Format '{fmt}' has no chunk writer")
+    base, compression = split_compressed_format(fmt)
+    if compression is None:
+        return STREAM_WRITERS[base](filepath)
+    return STREAM_WRITERS[base](filepath, compression=compression)
@@ -0,0 +1,151 @@
+import os
+import re
+import sys
+import glob
+import logging
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from eti_pipeline.src.utilis.path_utilis import PROJECT_ROOT
+from eti_pipeline.src.utilis.logger_utilis import worker_logging_options
+from eti_pipeline.src.extract.extract import load_raw_data
+from eti_pipeline.src.transform.transform import transform_fifa_data, combine_partitions, quarantine_table
+from config.config import (
+    DATA_DIR,
+    RAW_SUBDIR,
+    RAW_BATCH_GLOB,
+    BATCH_WORKERS,
+    CSV_ENGINE,
+    COL_SOURCE_FILE,
+    COL_SEASON,
+    SEASON_PATTERN,
+    RAW_COLUMN_MAPS,
+    TRANSFORM_REGISTRY
+)
+
+#Raw columns the Transform step converts -> their cleaned names
+REQUIRED_COLUMNS = {entry['source']: entry['target'] for entry in TRANSFORM_REGISTRY}
+
+
+def raw_batch_files(pattern=RAW_BATCH_GLOB, raw_dir=None):
+    """Return the raw files matching pattern, in name order
+
+    Args:
+        pattern (str): Glob relative to raw_dir, e.g. '*.csv' or 'fifa2*.csv'
+        raw_dir (str): Defaults to data/raw/
+    """
+    if raw_dir is None:
+        raw_dir = os.path.join(PROJECT_ROOT, DATA_DIR, RAW_SUBDIR)
+    return sorted(path for path in glob.glob(os.path.join(raw_dir, pattern)) if os.path.isfile(path))
+
+
+def season_of(file_path):
+    """Season a raw file belongs to, from its name ('FIFA 20 raw.csv' -> 'fifa20')
+
+    Files without a season in their name are tagged with the name itself.
+    """
+    name = os.path.splitext(os.path.basename(file_path))[0]
+    match = re.search(SEASON_PATTERN, name, flags=re.IGNORECASE)
+    return f"fifa{match.group(1)}" if match else name
+
+
+def extract_transform_file(file_path, engine=CSV_ENGINE):
+    """Extract and transform one raw file, tagged with its source file and season
+
+    Column renames for the file's season come from RAW_COLUMN_MAPS. Required
+    columns the file does not have are added empty.
+
+    Returns:
+        tuple: (cleaned_data, quarantine) - the cleaned rows of this file and
+        its strict mode rejects (see quarantine_table), tagged with the file
+    """
+    season = season_of(file_path)
+    raw_data = load_raw_data(file_path, engine=engine, column_map=RAW_COLUMN_MAPS.get(season))
+
+    missing = [column for column in REQUIRED_COLUMNS if column not in raw_data.columns]
+    if missing:
+        logging.warning(f"⚠️  {os.path.basename(file_path)} has no {missing} column(s), left empty")
+        for column in missing:
+            raw_data[column] = pd.Series(pd.NA, index=raw_data.index, dtype=object)
+
+    rejected = []
+    cleaned_data = transform_fifa_data(raw_data, quarantine=rejected)
+    for column in missing:
+        # The converters read a missing value as 0, keep the column empty instead
+        target = REQUIRED_COLUMNS[column]
+        cleaned_data[target] = pd.Series(float('nan'), index=cleaned_data.index).astype(cleaned_data[target].dtype)
+    cleaned_data[COL_SOURCE_FILE] = pd.Categorical([os.path.basename(file_path)] * len(cleaned_data))
+    cleaned_data[COL_SEASON] = pd.Categorical([season] * len(cleaned_data))
+
+    # IDs repeat across seasons, the source file tells the rejects apart
+    quarantine = quarantine_table(rejected)
+    quarantine[COL_SOURCE_FILE] = pd.Categorical([os.path.basename(file_path)] * len(quarantine))
+    return cleaned_data, quarantine
+
+
+def transform_batch(file_paths, engine=CSV_ENGINE, workers=BATCH_WORKERS, quarantine=None):
+    """Extract and transform several raw files in parallel and combine them
+
+    Each file is processed by its own worker process. A file that cannot
+    be read or transformed is reported and left out; the other files are
+    still combined.
+
+    Args:
+        file_paths (list): Raw CSV files
+        engine (str): CSV parser, 'c' or 'pyarrow'
+        workers (int): Processes, defaults to one per file (at most one per CPU)
+        quarantine (list): Strict mode rejects of each processed file are
+            appended to it, see extract_transform_file
+
+    Returns:
+        tuple: (cleaned_data, report) - cleaned_data is None when no file
+        could be processed, report has one dict per file with its 'file',
+        'season', 'rows' and 'error'
+    """
+    if workers is None:
+        workers = min(len(file_paths), os.cpu_count() or 1)
+
+    logging.info(f"Transforming {len(file_paths)} raw file(s) on {workers} worker(s)----")
+
+    if workers > 1 and len(file_paths) > 1:
+        with ProcessPoolExecutor(max_workers=workers, **worker_logging_options()) as executor:
+            futures = [executor.submit(extract_transform_file, path, engine) for path in file_paths]
+            outcomes = [future.exception() or future.result() for future in futures]
+    else:
+        outcomes = []
+        for path in file_paths:
+            try:
+                outcomes.append(extract_transform_file(path, engine))
+            except Exception as e:
+                outcomes.append(e)
+
+    results, report = [], []
+    for path, outcome in zip(file_paths, outcomes):
+        entry = {'file': os.path.basename(path), 'season': season_of(path), 'rows': 0, 'error': None}
+        if isinstance(outcome, Exception):
+            entry['error'] = f"{type(outcome).__name__}: {outcome}"
+            logging.error(f"❌ Skipping {entry['file']}: {entry['error']}")
+        else:
+            cleaned, rejected = outcome
+            entry['rows'] = len(cleaned)
+            results.append(cleaned)
+            if quarantine is not None:
+                quarantine.append(rejected)
+        report.append(entry)
+
+    if not results:
+        return None, report
+
+    # Files of other seasons may lack some columns: align them before combining
+    columns = list(dict.fromkeys(column for result in results for column in result.columns))
+    results = [result if list(result.columns) == columns else result.reindex(columns=columns)
+               for result in results]
+    cleaned_data = combine_partitions(results).reset_index(drop=True)
+
+    logging.info(f"====Batch Transformation Complete: {len(cleaned_data):,} rows from {len(results)} file(s)====")
+    return cleaned_data, report
@@ -0,0 +1,191 @@
+import os
+import sys
+import json
+import logging
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from eti_pipeline.src.utilis.path_utilis import PROJECT_ROOT
+from eti_pipeline.src.utilis.cache_utilis import pipeline_fingerprint
+from eti_pipeline.src.transform.transform import transform_fifa_data, combine_partitions, quarantine_table
+from config.config import (
+    DATA_DIR,
+    INCREMENTAL_SUBDIR,
+    COL_ID,
+    TRANSFORM_WORKERS
+)
+
+SNAPSHOT_FILENAME = 'raw_snapshot.parquet'
+CLEANED_FILENAME = 'cleaned.parquet'
+STATE_FILENAME = 'state.json'
+QUARANTINE_FILENAME = 'quarantine.parquet'
+
+
+def default_state_dir():
+    """Return the incremental state location, data/incremental/"""
+    return os.path.join(PROJECT_ROOT, DATA_DIR, INCREMENTAL_SUBDIR)
+
+
+def row_hashes(raw_data):
+    """Hash every raw row, keyed by player ID
+
+    Returns:
+        pd.Series: uint64 row hash indexed by ID
+    """
+    hashes = pd.util.hash_pandas_object(raw_data, index=False).to_numpy()
+    return pd.Series(hashes, index=pd.Index(raw_data[COL_ID].to_numpy(), name=COL_ID), name='hash')
+
+
+def load_incremental_state(state_dir=None):
+    """Load the raw snapshot, cleaned data and quarantine of the previous run
+
+    Returns:
+        tuple: (snapshot_hashes, cleaned_data, state, quarantine) or None if
+        there is no usable previous run
+    """
+    if state_dir is None:
+        state_dir = default_state_dir()
+
+    paths = [os.path.join(state_dir, name)
+             for name in (SNAPSHOT_FILENAME, CLEANED_FILENAME, STATE_FILENAME, QUARANTINE_FILENAME)]
+    if not all(os.path.exists(path) for path in paths):
+        return None
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    try:
+        snapshot = pq.read_table(paths[0]).to_pandas()
+        cleaned_data = pq.read_table(paths[1]).to_pandas()
+        with open(paths[2], encoding='utf-8') as file:
+            state = json.load(file)
+        quarantine = pq.read_table(paths[3]).to_pandas()
+    except (OSError, ValueError, pa.ArrowException) as e:
+        logging.warning(f"⚠️  Unreadable incremental state, rebuilding it: {e}")
+        return None
+
+    return snapshot['hash'], cleaned_data, state, quarantine
+
+
+def store_incremental_state(hashes, cleaned_data, state, state_dir=None, quarantine=None):
+    """Save this run's raw snapshot, cleaned data and quarantine for the next run
+
+    The quarantine (see quarantine_table) holds the strict mode rejects of
+    cleaned_data, so unchanged players keep theirs on the next run.
+
+    Returns:
+        bool: False if the cleaned data cannot be stored as Parquet
+    """
+    if state_dir is None:
+        state_dir = default_state_dir()
+    os.makedirs(state_dir, exist_ok=True)
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    try:
+        cleaned_table = pa.Table.from_pandas(cleaned_data)
+    except (pa.ArrowException, ValueError, TypeError) as e:
+        logging.warning(f"⚠️  Cleaned data cannot be stored as Parquet, next run will be a full run: {e}")
+        return False
+
+    pq.write_table(cleaned_table, os.path.join(state_dir, CLEANED_FILENAME))
+    pq.write_table(pa.Table.from_pandas(hashes.to_frame()), os.path.join(state_dir, SNAPSHOT_FILENAME))
+    if quarantine is None:
+        quarantine = quarantine_table([])
+    pq.write_table(pa.Table.from_pandas(quarantine, preserve_index=False), os.path.join(state_dir, QUARANTINE_FILENAME))
+    with open(os.path.join(state_dir, STATE_FILENAME), 'w', encoding='utf-8') as file:
+        json.dump(state, file, indent=2)
+    return True
+
+
+def transform_incremental(raw_data, workers=TRANSFORM_WORKERS, state_dir=None, fingerprint=None, quarantine=None):
+    """Transform only the players that are new or changed since the last run
+
+    Every raw row is hashed and compared, by ID, with the previous run's
+    snapshot. New and changed rows are transformed and merged with the
+    previous cleaned rows of unchanged players; deleted players are dropped.
+    The result is the same as transform_fifa_data(raw_data). Without a
+    usable previous run (first run, other code or settings, other columns,
+    duplicate IDs) every row is transformed.
+
+    Args:
+        raw_data (pd.DataFrame): Raw Fifa Dataset, left unmodified
+        workers (int): Processes used to transform the changed rows
+        state_dir (str): Snapshot location, defaults to data/incremental/
+        fingerprint (str): Code/settings version, see pipeline_fingerprint
+        quarantine (list): Strict mode rejected values of the cleaned data,
+            see transform_fifa_data: the rejects of new and changed players,
+            plus the previous run's rejects of unchanged players
+
+    Returns:
+        tuple: (cleaned_data, counts) - counts holds the number of new,
+        changed, unchanged and deleted players
+    """
+    if fingerprint is None:
+        fingerprint = pipeline_fingerprint()
+
+    hashes = row_hashes(raw_data)
+    state = {'fingerprint': fingerprint, 'columns': list(raw_data.columns)}
+
+    if quarantine is None:
+        quarantine = []
+
+    if hashes.index.has_duplicates:
+        logging.warning(f"⚠️  Duplicate {COL_ID} values, incremental mode needs unique IDs - transforming every row")
+        cleaned_data = transform_fifa_data(raw_data, workers=workers, quarantine=quarantine)
+        return cleaned_data, {'new': len(cleaned_data), 'changed': 0, 'unchanged': 0, 'deleted': 0}
+
+    previous = load_incremental_state(state_dir)
+    if previous is None or previous[2] != state:
+        logging.info("🔁 No matching previous run, transforming every row")
+        rejected = []
+        cleaned_data = transform_fifa_data(raw_data, workers=workers, quarantine=rejected)
+        rejected = quarantine_table(rejected)
+        store_incremental_state(hashes, cleaned_data, state, state_dir, quarantine=rejected)
+        quarantine.append(rejected)
+        return cleaned_data, {'new': len(cleaned_data), 'changed': 0, 'unchanged': 0, 'deleted': 0}
+
+    snapshot, previous_cleaned, _, previous_quarantine = previous
+
+    # Position of every player in the previous snapshot (-1 for new players)
+    positions = snapshot.index.get_indexer(hashes.index)
+    known = positions >= 0
+    fresh = ~known
+    fresh[known] = snapshot.to_numpy()[positions[known]] != hashes.to_numpy()[known]
+
+    counts = {
+        'new': int((~known).sum()),
+        'changed': int(fresh.sum() - (~known).sum()),
+        'unchanged': int((~fresh).sum()),
+        'deleted': int(len(snapshot) - known.sum()),
+    }
+    logging.info(
+        f"🔁 Incremental transform: {counts['new']:,} new, {counts['changed']:,} changed, "
+        f"{counts['unchanged']:,} unchanged, {counts['deleted']:,} deleted"
+    )
+
+    # Unchanged players keep their cleaned rows, found by ID
+    cleaned_positions = pd.Index(previous_cleaned[COL_ID]).get_indexer(hashes.index[~fresh])
+    unchanged = previous_cleaned.iloc[cleaned_positions].set_axis(np.flatnonzero(~fresh))
+    rejected = []
+    changed = transform_fifa_data(raw_data.iloc[np.flatnonzero(fresh)], workers=workers, quarantine=rejected)
+    changed = changed.set_axis(np.flatnonzero(fresh))
+
+    # Unchanged players keep their previous rejects; in raw row order, as a full run lists them
+    kept = previous_quarantine[previous_quarantine[COL_ID].isin(hashes.index[~fresh])]
+    rejected = quarantine_table([kept, *rejected])
+    positions = hashes.index.get_indexer(rejected[COL_ID])
+    rejected = rejected.iloc[np.lexsort((positions, rejected['column'].cat.codes))].reset_index(drop=True)
+    quarantine.append(rejected)
+
+    cleaned_data = combine_partitions([unchanged, changed]).sort_index().set_axis(raw_data.index)
+    for column in cleaned_data.columns:
+        if isinstance(cleaned_data[column].dtype, pd.CategoricalDtype):
+            cleaned_data[column] = cleaned_data[column].cat.remove_unused_categories()
+
+    store_incremental_state(hashes, cleaned_data, state, state_dir, quarantine=rejected)
+    return cleaned_data, counts
@@ -1,7 +1,20 @@
 import pandas as pd
+import numpy as np
 import os
 import re 
 
+from eti_pipeline.src.utilis.series_utilis import (
+    start_conversion,
+    match_pattern,
+    finish_conversion,
+    to_float
+)
+
+#Canonical release clause shapes, e.g. '€138.4M', '€71K', '€0', '€'
+CLAUSE_PATTERN = r"€?(?P<number>[0-9]+(?:\.[0-9]+)?)(?P<suffix>[MK])"
+CLAUSE_ZERO_PATTERN = r"€?[0-9]+(?:\.[0-9]+)?[mk]?"
+CLAUSE_BLANK_PATTERN = r"€?[KM]?"
+
 
 def convert_clause_thousands(values):
     """Converts Release clause to thousands in pounds"""
@@ -48,4 +61,27 @@ def convert_clause_thousands(values):
             return False 
     else:
         return 0.0
-        
+
+
+def convert_clause_series(values):
+    """Vectorized twin of convert_clause_thousands for a whole column.
+
+    Returns the same values and dtype as values.apply(convert_clause_thousands).
+    """
+    strings, result, pending = start_conversion(values, False)
+
+    positions, groups = match_pattern(strings, CLAUSE_PATTERN, pending)
+    multiplier = np.where((groups['suffix'] == 'M').to_numpy(dtype=bool), 1000000, 1000)
+    clean_release_column = to_float(groups, 'number') * multiplier
+    converted = clean_release_column.astype(object)
+    converted[clean_release_column > 203100000.0] = False
+    result[positions] = converted
+
+    #Without an upper-case 'M' or 'K' suffix the clause counts as 0
+    positions, _ = match_pattern(strings, CLAUSE_ZERO_PATTERN, pending)
+    result[positions] = 0.0
+
+    positions, _ = match_pattern(strings, CLAUSE_BLANK_PATTERN, pending)
+    result[positions] = ''
+
+    return finish_conversion(values, result, pending, convert_clause_thousands)
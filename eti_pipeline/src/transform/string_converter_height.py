@@ -1,7 +1,21 @@
 import pandas as pd
+import numpy as np
 import os
 import re
 
+from eti_pipeline.src.utilis.series_utilis import (
+    start_conversion,
+    match_pattern,
+    finish_conversion,
+    to_float
+)
+
+#Canonical height shapes, e.g. "5'10", "5'10\"", '180cm', '180', ''
+HEIGHT_FEET_PATTERN = r"(?P<feet>[0-9]+)'(?P<inches>[0-9]+)\"?"
+HEIGHT_CM_PATTERN = r"(?P<number>[0-9]+(?:\.[0-9]+)?)[Cc][Mm]"
+HEIGHT_NUMBER_PATTERN = r"(?P<number>[0-9]+(?:\.[0-9]+)?)"
+HEIGHT_BLANK_PATTERN = r"(?:cm)?"
+
 def convert_height_column(values):
     """Converting height column from a string to an integer"""
 
@@ -67,6 +81,35 @@ def convert_height_column(values):
         
     
 
+def convert_height_series(values):
+    """Vectorized twin of convert_height_column for a whole column.
+
+    Returns the same values and dtype as values.apply(convert_height_column).
+    """
+    strings, result, pending = start_conversion(values, 0.0)
+
+    #Feet and inches: round() only runs once per distinct height
+    positions, groups = match_pattern(strings, HEIGHT_FEET_PATTERN, pending)
+    total_inches = (to_float(groups, 'feet') * 12) + to_float(groups, 'inches')
+    distinct, inverse = np.unique(total_inches * 2.54, return_inverse=True)
+    rounded = np.empty(len(distinct), dtype=object)
+    rounded[:] = [round(converted_cm, 2) for converted_cm in distinct.tolist()]
+    result[positions] = rounded[inverse]
+
+    #Centimetres, with or without the 'cm' suffix
+    for pattern in (HEIGHT_CM_PATTERN, HEIGHT_NUMBER_PATTERN):
+        positions, groups = match_pattern(strings, pattern, pending)
+        converted_cm = to_float(groups, 'number')
+        converted = converted_cm.astype(object)
+        converted[(converted_cm <= 0) | (converted_cm > 220)] = False
+        result[positions] = converted
+
+    positions, _ = match_pattern(strings, HEIGHT_BLANK_PATTERN, pending)
+    result[positions] = ''
+
+    return finish_conversion(values, result, pending, convert_height_column)
+
+
 # Test the function when running this file directly
 if __name__ == "__main__":
     print("Testing convert_height_column function:")
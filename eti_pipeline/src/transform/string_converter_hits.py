@@ -3,6 +3,19 @@ import numpy as np
 import os
 import re
 
+from eti_pipeline.src.utilis.series_utilis import (
+    start_conversion,
+    match_pattern,
+    finish_conversion,
+    to_float,
+    to_upper
+)
+
+#Canonical hits shapes, e.g. '372', '1.6K', 'nan' (from astype(str)), 'K'
+HITS_PATTERN = r"(?P<number>[0-9]+(?:\.[0-9]+)?)(?P<suffix>[Kk]?)"
+HITS_NAN_PATTERN = r"nan"
+HITS_BLANK_PATTERN = r"[Kk]?"
+
 def convert_hits_column(values):
     """Convert hits column to numeric formart"""
     #Input Validation
@@ -32,4 +45,25 @@ def convert_hits_column(values):
         return clean_values
     else:
         clean_digits=float(clean_values)
-        return clean_digits 
\ No newline at end of file
+        return clean_digits
+
+
+def convert_hits_series(values):
+    """Vectorized twin of convert_hits_column for a whole column.
+
+    Returns the same values and dtype as values.apply(convert_hits_column).
+    """
+    strings, result, pending = start_conversion(values, 0.0)
+
+    positions, groups = match_pattern(strings, HITS_PATTERN, pending)
+    hits = to_float(groups, 'number')
+    clean_values = np.where(to_upper(groups, 'suffix') == 'K', hits * 1000, hits)
+    result[positions] = clean_values.astype(object)
+
+    positions, _ = match_pattern(strings, HITS_NAN_PATTERN, pending)
+    result[positions] = np.nan
+
+    positions, _ = match_pattern(strings, HITS_BLANK_PATTERN, pending)
+    result[positions] = ''
+
+    return finish_conversion(values, result, pending, convert_hits_column)
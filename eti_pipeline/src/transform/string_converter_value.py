@@ -1,7 +1,19 @@
 import pandas as pd
+import numpy as np
 import os
 import re 
 
+from eti_pipeline.src.utilis.series_utilis import (
+    start_conversion,
+    match_pattern,
+    finish_conversion,
+    to_float,
+    to_upper
+)
+
+#Canonical value shape, e.g. '€1.5M', '€500K', '€0'
+VALUE_PATTERN = r"€(?P<number>[0-9]+(?:\.[0-9]+)?)(?P<suffix>[MmKk]?)"
+
 
 def convert_value_column(values):
     """Converts the value string column into an standardized integer"""
@@ -71,6 +83,29 @@ def convert_value_column(values):
     return clean_value 
     
 
+def convert_value_series(values):
+    """Vectorized twin of convert_value_column for a whole column.
+
+    Returns the same values and dtype as values.apply(convert_value_column).
+    """
+    strings, result, pending = start_conversion(values, None)
+
+    positions, groups = match_pattern(strings, VALUE_PATTERN, pending)
+    numbers = to_float(groups, 'number')
+    suffix = to_upper(groups, 'suffix')
+    multiplier = np.select([suffix == 'M', suffix == 'K'], [1_000_000, 1_000], 1)
+    clean_value = numbers * multiplier
+
+    #'€0K' and '€0M' are treated as missing, like values out of range
+    rejected = ((groups['number'] == '0').to_numpy(dtype=bool) & (suffix != '')) \
+        | (clean_value < 0) | (clean_value > 200_000_000)
+    converted = clean_value.astype(object)
+    converted[rejected] = None
+    result[positions] = converted
+
+    return finish_conversion(values, result, pending, convert_value_column)
+
+
 #=====Quick Component Testing====
 
 if __name__ == "__main__":
@@ -1,7 +1,20 @@
 import pandas as pd
+import numpy as np
 import os
 import re
 
+from eti_pipeline.src.utilis.series_utilis import (
+    start_conversion,
+    match_pattern,
+    finish_conversion,
+    to_float,
+    to_upper
+)
+
+#Canonical wage shapes, e.g. '€560K', '€500', '€K'
+WAGE_PATTERN = r"€?(?P<number>[0-9]+(?:\.[0-9]+)?)(?P<suffix>[Kk]?)"
+WAGE_BLANK_PATTERN = r"€?K?"
+
 def convert_wages_thousands(values):
         """Converts strings to floats in the wage column"""
         #Remove '€' symbol from the string
@@ -57,6 +70,23 @@ def convert_wages_thousands(values):
                  return clean_wage_column
             except ValueError:
                  return False
-            
 
-            
\ No newline at end of file
+
+def convert_wages_series(values):
+    """Vectorized twin of convert_wages_thousands for a whole column.
+
+    Returns the same values and dtype as values.apply(convert_wages_thousands).
+    """
+    strings, result, pending = start_conversion(values, False)
+
+    positions, groups = match_pattern(strings, WAGE_PATTERN, pending)
+    wages = to_float(groups, 'number')
+    clean_wage_column = np.where(to_upper(groups, 'suffix') == 'K', wages, wages / 1000)
+    converted = clean_wage_column.astype(object)
+    converted[clean_wage_column > 560.0] = False
+    result[positions] = converted
+
+    positions, _ = match_pattern(strings, WAGE_BLANK_PATTERN, pending)
+    result[positions] = ''
+
+    return finish_conversion(values, result, pending, convert_wages_thousands)
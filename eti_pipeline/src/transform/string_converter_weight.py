@@ -2,6 +2,17 @@ import pandas as pd
 import os
 import re 
 
+from eti_pipeline.src.utilis.series_utilis import (
+    start_conversion,
+    match_pattern,
+    finish_conversion,
+    to_float
+)
+
+#Canonical weight shapes, e.g. '72kg' and '170lbs'
+WEIGHT_KG_PATTERN = r"(?P<number>[0-9]+(?:\.[0-9]+)?)[Kk][Gg]"
+WEIGHT_LBS_PATTERN = r"(?P<number>[0-9]+(?:\.[0-9]+)?)[Ll][Bb][Ss]"
+
 
 
 def convert_weight_column(values):
@@ -63,6 +74,26 @@ def convert_weight_column(values):
     
             
 
+def convert_weight_series(values):
+    """Vectorized twin of convert_weight_column for a whole column.
+
+    Returns the same values and dtype as values.apply(convert_weight_column).
+    """
+    strings, result, pending = start_conversion(values, None)
+
+    positions, groups = match_pattern(strings, WEIGHT_KG_PATTERN, pending)
+    weight_KG = to_float(groups, 'number')
+    converted = weight_KG.astype(object)
+    converted[(weight_KG < 50) | (weight_KG > 150)] = None
+    result[positions] = converted
+
+    #convert_weight_column never accepts the 'lbs' suffix
+    positions, _ = match_pattern(strings, WEIGHT_LBS_PATTERN, pending)
+    result[positions] = None
+
+    return finish_conversion(values, result, pending, convert_weight_column)
+    
+
 #======Quick component tests=====
 
 #Testing None/empty
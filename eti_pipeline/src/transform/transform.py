@@ -1,10 +1,12 @@
 import sys
 import pandas as pd
+import numpy as np
 import os
 import re
-import matplotlib.pyplot as plt
 import logging
+import warnings
 from datetime import datetime 
+from concurrent.futures import ProcessPoolExecutor
 
 #Add project root to path
 # 1. Path setup
@@ -15,23 +17,25 @@ if project_root not in sys.path:
 
 # 2. Import utilities
 from eti_pipeline.src.utilis.path_utilis import PROJECT_ROOT
-from eti_pipeline.src.utilis.logger_utilis import setup_logging
 from eti_pipeline.src.utilis.file_utilis import load_csv_safe
+from eti_pipeline.src.utilis.series_utilis import memoize, convert_factorized
+from eti_pipeline.src.utilis.profile_utilis import profile_stage
+from eti_pipeline.src.utilis.logger_utilis import worker_logging_options
 
 try:
-     from .string_converter_wages import convert_wages_thousands
-     from .string_converter_clause import convert_clause_thousands 
-     from .string_converter_hits import convert_hits_column
-     from .string_converter_height import convert_height_column 
-     from .string_converter_weight import convert_weight_column
-     from .string_converter_value import convert_value_column 
+     from .string_converter_wages import convert_wages_thousands, convert_wages_series
+     from .string_converter_clause import convert_clause_thousands, convert_clause_series
+     from .string_converter_hits import convert_hits_column, convert_hits_series
+     from .string_converter_height import convert_height_column, convert_height_series
+     from .string_converter_weight import convert_weight_column, convert_weight_series
+     from .string_converter_value import convert_value_column, convert_value_series
 except:
-     from string_converter_wages import convert_wages_thousands
-     from string_converter_clause import convert_clause_thousands
-     from string_converter_hits import convert_hits_column
-     from string_converter_height import convert_height_column 
-     from string_converter_weight import convert_weight_column
-     from string_converter_value import convert_value_column  
+     from string_converter_wages import convert_wages_thousands, convert_wages_series
+     from string_converter_clause import convert_clause_thousands, convert_clause_series
+     from string_converter_hits import convert_hits_column, convert_hits_series
+     from string_converter_height import convert_height_column, convert_height_series
+     from string_converter_weight import convert_weight_column, convert_weight_series
+     from string_converter_value import convert_value_column, convert_value_series
 
 
 from config.config import(
@@ -43,24 +47,28 @@ from config.config import(
      #Pandas paremeter
      CSV_LOW_MEMORY,
 
-     #Original columns
+     #Columns and their conversions
      COL_HEIGHT,
      COL_HITS,
      COL_RELEASE_COLUMN,
      COL_VALUE,
      COL_WAGE,
      COL_WEIGHT,
-     
-     #New columns(transformed)
      COL_WAGES_K,
      COL_HEIGHT_CM,
      COL_WEIGHT_KG,
+     COL_ID,
+     TRANSFORM_REGISTRY,
+     TRANSFORM_STRICT,
      
      #Drop columns
      COLUMNS_TO_DROP,
 
      #Other Parameter
      DROP_AXIS,
+     TRANSFORM_WORKERS,
+     CONVERTER_FACTORIZE,
+     CONVERTER_CACHE_SIZE,
      SUMMARY_SEPARATOR,
 
      #log settings
@@ -69,120 +77,440 @@ from config.config import(
      
 )
 
-# 4. Setup logger
-logger = setup_logging(__name__)
+# 4. Setup logger (handlers are configured by the entry point, see setup_logging)
+logger = logging.getLogger(__name__)
+
+#Converter name -> (memoized scalar converter, vectorized converter)
+CONVERTERS = {
+     'value': (memoize(convert_value_column, CONVERTER_CACHE_SIZE), convert_value_series),
+     'weight': (memoize(convert_weight_column, CONVERTER_CACHE_SIZE), convert_weight_series),
+     'height': (memoize(convert_height_column, CONVERTER_CACHE_SIZE), convert_height_series),
+     'wages': (memoize(convert_wages_thousands, CONVERTER_CACHE_SIZE), convert_wages_series),
+     'clause': (memoize(convert_clause_thousands, CONVERTER_CACHE_SIZE), convert_clause_series),
+     'hits': (memoize(convert_hits_column, CONVERTER_CACHE_SIZE), convert_hits_series),
+}
+
+#Registry null policies -> fill value (None = keep missing values)
+NULL_POLICIES = {
+     'keep': None,
+     'zero': 0.0,
+}
+
+#Strict mode: why a converted value was rejected (see reject_reasons)
+REJECT_INVALID = 'invalid or out of range'
+REJECT_EMPTY = 'no number'
+REJECT_NOT_NUMBER = 'not a number'
+REJECT_NOT_INTEGER = 'not an integer'
+
+#Columns of the strict mode quarantine table
+QUARANTINE_COLUMNS = [COL_ID, 'column', 'raw_value', 'reason']
+
+def convert_column(values, name):
+     """Convert a raw string column with the named converter
+
+     With CONVERTER_FACTORIZE the column is dictionary-encoded and each
+     distinct string is converted once through the memoized converter,
+     otherwise every row goes through the vectorized converter.
+     """
+     memo_func, series_func = CONVERTERS[name]
+     if CONVERTER_FACTORIZE:
+          return convert_factorized(values, memo_func, series_func, CONVERTER_CACHE_SIZE)
+     return series_func(values)
+
+def converter_cache_info():
+     """Return converter name -> (hits, misses) of the memoized converters"""
+     return {name: (memo_func.cache_info().hits, memo_func.cache_info().misses)
+             for name, (memo_func, _) in CONVERTERS.items()}
+
+def log_converter_cache(before):
+     """Log the memo hits and misses since the converter_cache_info() snapshot"""
+     after = converter_cache_info()
+     counts = [f"{name} {after[name][0] - before[name][0]:,}/{after[name][1] - before[name][1]:,}"
+               for name in CONVERTERS]
+     logging.info(f"🧠 Converter cache hits/misses: {', '.join(counts)}")
+
+def warn_deprecated_step(name):
+     """Warn that a single-column step is deprecated in favour of transform_fifa_data"""
+     warnings.warn(f"{name}() is deprecated, use transform_fifa_data (TRANSFORM_REGISTRY) "
+                   "or convert_column instead", DeprecationWarning, stacklevel=3)
+
+#Single-column steps replaced by the registry plan, kept as deprecated wrappers
+
+def transform_weight_column(df, inplace=False):
+     """Deprecated: rename the weight column to weight(kg) and convert it"""
+     warn_deprecated_step('transform_weight_column')
+     if not inplace:
+          df = df.copy()
+     df.rename(columns={COL_WEIGHT: COL_WEIGHT_KG}, inplace=True)
+     df[COL_WEIGHT_KG] = convert_column(df[COL_WEIGHT_KG], 'weight')
+     return df
 
-def transform_weight_column(df):
-     """Renaming the weight column to weight(kg)"""
-     df=df.copy()
-     df.rename(columns={COL_WEIGHT:COL_WEIGHT_KG}, inplace=True)
+def transform_height_column(df, inplace=False):
+     """Deprecated: rename the height column to height(cm) and convert it"""
+     warn_deprecated_step('transform_height_column')
+     if not inplace:
+          df = df.copy()
+     df.rename(columns={COL_HEIGHT: COL_HEIGHT_CM}, inplace=True)
+     df[COL_HEIGHT_CM] = convert_column(df[COL_HEIGHT_CM], 'height')
+     return df
 
-     df[COL_WEIGHT_KG]=df[COL_WEIGHT_KG].apply(convert_weight_column)
+def transform_value_column(df, inplace=False):
+     """Deprecated: convert the value column to numbers"""
+     warn_deprecated_step('transform_value_column')
+     if not inplace:
+          df = df.copy()
+     df[COL_VALUE] = convert_column(df[COL_VALUE], 'value')
      return df
-   
-#Rename the existing height column and converting string to interger
-def transform_height_column(df):
-        
-     """"Renaming the height column to height(cm)"""
-     df = df.copy()
-     df.rename(columns={COL_HEIGHT: COL_HEIGHT_CM}, inplace=True)
 
-     #Removing the "cm" from the string rows
-     df[COL_HEIGHT_CM]=df[COL_HEIGHT_CM].apply(convert_height_column)
+def transform_wage_column(df, inplace=False):
+     """Deprecated: rename the wage column and convert it to thousands(K)"""
+     warn_deprecated_step('transform_wage_column')
+     if not inplace:
+          df = df.copy()
+     df.rename(columns={COL_WAGE: COL_WAGES_K}, inplace=True)
+     df[COL_WAGES_K] = convert_column(df[COL_WAGES_K], 'wages')
      return df
 
-#Rename the value column and convert the existing rows into integers
+def transform_release_column(df, inplace=False):
+     """Deprecated: convert the release clause column to numbers"""
+     warn_deprecated_step('transform_release_column')
+     if not inplace:
+          df = df.copy()
+     df[COL_RELEASE_COLUMN] = convert_column(df[COL_RELEASE_COLUMN], 'clause')
+     return df
 
-def transform_value_column(df):
-        
-     """converts string values to integers"""
-     df= df.copy()
-     df[COL_VALUE]=df[COL_VALUE].apply(convert_value_column)
-     return df 
+def transform_hits_column(df, inplace=False):
+     """Deprecated: convert the hits column to numbers"""
+     warn_deprecated_step('transform_hits_column')
+     if not inplace:
+          df = df.copy()
+     df[COL_HITS] = convert_column(df[COL_HITS].astype(str), 'hits')
+     return df
 
-def transform_wage_column(df):
-        
-        
-        """Converts wage to standardized thousands(K)"""
-        df = df.copy()
+def delete_four_column(df, inplace=False):
+     """Deprecated: drop COLUMNS_TO_DROP"""
+     warn_deprecated_step('delete_four_column')
+     columns = [column for column in COLUMNS_TO_DROP if column in df.columns]
+     if not inplace:
+          return df.drop(columns, axis=DROP_AXIS)
+     df.drop(columns, axis=DROP_AXIS, inplace=True)
+     return df
 
-        #Rename the column
-        
-        df.rename(columns={COL_WAGE:COL_WAGES_K},inplace=True)
-        
-        df[COL_WAGES_K]= df[COL_WAGES_K].apply(convert_wages_thousands)
-        return df
+def build_transform_plan(columns, registry=None):
+     """Compile the column registry into the plan of one transform pass
 
-def transform_release_column(df):
-     """Convert Release clause column to standardize column"""
-     df = df.copy()
+     Args:
+          columns(list): Columns of the raw frame, in order
+          registry(list): Registry entries, defaults to TRANSFORM_REGISTRY
 
-     df[COL_RELEASE_COLUMN]=df[COL_RELEASE_COLUMN].apply(convert_clause_thousands)
-     return df 
+     Returns:
+          dict: 'conversions' (registry entries keyed by source column),
+          'renames' (every source -> target rename) and 'columns' (the output
+          columns as (source, target) pairs, in raw order, dropped columns
+          left out)
+
+     Raises:
+          KeyError: If a registry source column is missing
+          ValueError: If an entry names an unknown converter or null policy,
+               or two output columns would get the same name
+     """
+     if registry is None:
+          registry = TRANSFORM_REGISTRY
+
+     conversions = {}
+     for entry in registry:
+          if entry['converter'] not in CONVERTERS:
+               raise ValueError(f"Unknown converter '{entry['converter']}' for {entry['source']}")
+          if entry.get('nulls', 'keep') not in NULL_POLICIES:
+               raise ValueError(f"Unknown null policy '{entry['nulls']}' for {entry['source']}")
+          conversions[entry['source']] = entry
+
+     missing = [source for source in conversions if source not in columns]
+     if missing:
+          raise KeyError(missing[0] if len(missing) == 1 else missing)
+
+     renames = {source: entry['target'] for source, entry in conversions.items() if source != entry['target']}
+     output = [(column, renames.get(column, column)) for column in columns if column not in COLUMNS_TO_DROP]
+
+     targets = [target for _, target in output]
+     collisions = sorted({target for target in targets if targets.count(target) > 1})
+     if collisions:
+          raise ValueError(f"Registry targets collide with other output columns: {collisions}")
+     return {'conversions': conversions, 'renames': renames, 'columns': output}
+
+def convert_entry(values, entry, strict=False):
+     """Convert one raw column as its registry entry says
+
+     Args:
+          values(pd.Series): Raw column
+          entry(dict): Registry entry
+          strict(bool): Return the entry's nullable strict_dtype, rejected
+               values becoming missing instead of False/''/None sentinels
 
-def transform_hits_column(df):
-     """Convert Hits column to standardized format"""
-     ## Convert all values to strings (NaN becomes 'nan' string, but pd.isna() still catches it)
+     Returns:
+          tuple: (converted column, reasons) - reasons holds why each
+          rejected value was rejected, by row position (empty unless strict)
+     """
+     raw_values = values
+     if entry.get('as_text'):
+          values = values.astype(str)
+     converted = convert_column(values, entry['converter'])
+     reasons = pd.Series(dtype=object)
+     fill = NULL_POLICIES[entry.get('nulls', 'keep')]
+     if strict:
+          converted, reasons = strict_column(raw_values, converted, entry.get('strict_dtype', 'Float64'))
+          # Only values missing from the raw data are filled, rejected ones stay missing
+          missing = raw_values.isna().to_numpy()
+          if fill is not None and missing.any():
+               converted = converted.mask(missing, fill)
+     elif fill is not None and converted.isna().any():
+          converted = converted.fillna(fill)
+     if entry.get('dtype') is not None and not strict:
+          converted = converted.astype(entry['dtype'])
+     return converted, reasons
+
+def reject_reason(value, integer=False):
+     """Why one converted value is rejected, None for a kept number"""
+     if isinstance(value, (bool, np.bool_)) or value is None or value is pd.NA:
+          return REJECT_INVALID
+     if isinstance(value, str):
+          return REJECT_NOT_NUMBER if value.strip() else REJECT_EMPTY
+     if not isinstance(value, (int, float, np.number)):
+          return REJECT_NOT_NUMBER
+     if np.isnan(value):
+          return REJECT_INVALID
+     if integer and not float(value).is_integer():
+          return REJECT_NOT_INTEGER
+     return None
+
+def reject_reasons(raw_values, converted, integer=False):
+     """Why each converted value is rejected, None where it is kept
+
+     Kept are real numbers and the rows whose raw value is missing; the
+     converters' sentinels (False, '' or None for a raw value they could not
+     read) and anything else are rejected. A converter gives the same result
+     for equal raw values, so each distinct raw value is classified once.
+     """
+     if pd.api.types.is_numeric_dtype(converted) and not pd.api.types.is_bool_dtype(converted):
+          numbers = converted.to_numpy(dtype='float64', na_value=np.nan)
+          reasons = np.where(np.isnan(numbers), REJECT_INVALID, None).astype(object)
+          if integer:
+               reasons[~np.isnan(numbers) & (numbers != np.round(numbers))] = REJECT_NOT_INTEGER
+          reasons[raw_values.isna().to_numpy()] = None
+          return reasons
+
+     codes, uniques = pd.factorize(raw_values)
+     if not len(uniques):
+          return np.full(len(raw_values), None, dtype=object)
+
+     # Position of the first row holding each distinct raw value
+     first = np.empty(len(uniques), dtype=np.intp)
+     positions = np.flatnonzero(codes >= 0)
+     first[codes[positions[::-1]]] = positions[::-1]
+
+     values = converted.to_numpy(dtype=object)[first]
+     reasons = np.array([reject_reason(value, integer) for value in values] + [None], dtype=object)
+     # Missing raw values (code -1) pick the trailing None
+     return reasons[codes]
+
+def strict_column(raw_values, converted, dtype):
+     """Typed nullable column of a strict conversion and its rejected values
 
-     df = df.copy()
-     df[COL_HITS]=df[COL_HITS].astype(str)
-     df[COL_HITS]=df[COL_HITS].apply(convert_hits_column)
-     return df 
+     Args:
+          raw_values(pd.Series): Raw column
+          converted(pd.Series): Converter output, numbers mixed with sentinels
+          dtype(str): Nullable dtype, e.g. 'Float64' or 'Int32'
 
-def delete_four_column(df):
-     """Converts the name column into a standardize format"""
+     Returns:
+          tuple: (column of dtype, rejected values missing; reasons of the
+          rejected rows, indexed by row position)
+     """
+     integer = pd.api.types.is_integer_dtype(pd.api.types.pandas_dtype(dtype))
+     reasons = reject_reasons(raw_values, converted, integer=integer)
+     rejected = pd.notna(reasons)
+     keep = ~rejected & raw_values.notna().to_numpy()
+
+     if pd.api.types.is_numeric_dtype(converted) and not pd.api.types.is_bool_dtype(converted):
+          numbers = np.where(keep, converted.to_numpy(dtype='float64', na_value=np.nan), np.nan)
+     else:
+          numbers = np.full(len(converted), np.nan)
+          numbers[keep] = converted.to_numpy(dtype=object)[keep].astype('float64')
+     typed = pd.Series(numbers, index=converted.index, name=converted.name).astype(dtype)
+     return typed, pd.Series(reasons[rejected], index=np.flatnonzero(rejected), dtype=object)
+
+def quarantine_frame(raw_data, source, target, reasons):
+     """Quarantine rows (ID, column, raw value, reason) of one strict conversion"""
+     positions = reasons.index.to_numpy()
+     ids = raw_data[COL_ID].to_numpy()[positions] if COL_ID in raw_data.columns else raw_data.index[positions]
+     return pd.DataFrame({
+          COL_ID: ids,
+          'column': target,
+          'raw_value': raw_data[source].take(positions).astype(str).to_numpy(),
+          'reason': reasons.to_numpy(),
+     }, columns=QUARANTINE_COLUMNS)
+
+def quarantine_table(frames, registry=None):
+     """Combine quarantine frames into one table with compact dtypes
+
+     The rows are ordered by registry column, then by their raw row, so a
+     parallel run gives the same table as a serial one.
 
-     df = df.copy()
-     df=df.drop(COLUMNS_TO_DROP, axis= DROP_AXIS)
-     return df     
+     Args:
+          frames(list): quarantine_frame results, as collected by
+               transform_fifa_data(quarantine=...)
+          registry(list): Registry entries, defaults to TRANSFORM_REGISTRY
 
-def transform_fifa_data(raw_data):
-     """Master function that applies all the transformation in sequence
+     Returns:
+          pd.DataFrame: ID, column, raw_value and reason of every rejected value
+     """
+     if registry is None:
+          registry = TRANSFORM_REGISTRY
+
+     frames = [frame for frame in frames if len(frame)]
+     table = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=QUARANTINE_COLUMNS)
+     table = table.astype({COL_ID: 'int32', 'raw_value': 'str', 'reason': 'category'})
+     table['column'] = pd.Categorical(table['column'], categories=[entry['target'] for entry in registry])
+     return table.sort_values('column', kind='stable', ignore_index=True)
+
+def apply_transform_plan(raw_data, plan, strict=False, quarantine=None):
+     """Run a transform plan in one pass over raw_data
+
+     Each source column is read and converted once, untouched columns are
+     passed through without copying, and the cleaned frame is assembled in
+     a single step. raw_data itself is never modified.
+
+     With strict, the rejected values of each converted column are appended
+     to the quarantine list (see quarantine_frame).
+     """
+     converted = {}
+     for source, entry in plan['conversions'].items():
+          with profile_stage(f"convert_{entry['converter']}"):
+               converted[source], reasons = convert_entry(raw_data[source], entry, strict=strict)
+          if len(reasons) and quarantine is not None:
+               quarantine.append(quarantine_frame(raw_data, source, entry['target'], reasons))
+
+     with profile_stage('assemble'):
+          columns = {target: converted[source] if source in converted else raw_data[source]
+                     for source, target in plan['columns']}
+          return pd.DataFrame(columns, index=raw_data.index, copy=False)
+
+def transform_fifa_data(raw_data, inplace=None, workers=TRANSFORM_WORKERS, strict=None, quarantine=None):
+     """Master function that cleans the raw data in one fused pass
+
+     TRANSFORM_REGISTRY is compiled into a plan (build_transform_plan): each
+     converted column is read and converted once, the renames are applied
+     together and the untouched columns are passed through as they are, so
+     the cost grows with the number of converted columns only.
      
      Args:
           raw_data(pd.Dataframe): Raw Fifa Dataset
+          inplace(bool): Deprecated, has no effect: raw_data is never copied
+               or modified, the cleaned frame shares its untouched columns
+          workers(int): Number of processes; above 1 the rows are split into
+               partitions that are transformed in parallel
+          strict(bool): Nullable typed converted columns (each entry's
+               strict_dtype), defaults to TRANSFORM_STRICT
+          quarantine(list): If given, strict mode appends the rejected values
+               to it as DataFrames, see quarantine_table
           
      Returns:
           pd.Dataframe: Fully transformed dataset
           
     """
-     
-     logging.info("Starting transformation pipeline----")
+     if inplace is not None:
+          warnings.warn("transform_fifa_data(inplace=...) is deprecated and has no effect: "
+                        "raw_data is never modified", DeprecationWarning, stacklevel=2)
+     if strict is None:
+          strict = TRANSFORM_STRICT
 
-     # Step 1: Cleaning column names
+     if workers > 1 and len(raw_data) > 1:
+          return transform_in_parallel(raw_data, workers, strict=strict, quarantine=quarantine)
 
-     logging.info('\n - Cleaning column names---')
-     df = raw_data.copy()
+     logging.info("Starting transformation pipeline----")
+     cache_before = converter_cache_info()
+
+     with profile_stage('plan'):
+          plan = build_transform_plan(list(raw_data.columns))
+     logging.info(f" - {len(plan['conversions'])} converted column(s), {len(plan['renames'])} rename(s), "
+                  f"{len(raw_data.columns) - len(plan['columns'])} dropped---")
+
+     rejected = []
+     df = apply_transform_plan(raw_data, plan, strict=strict, quarantine=rejected)
+     if rejected:
+          logging.warning(f"🚧 {sum(map(len, rejected)):,} value(s) rejected in strict mode, quarantined")
+     if quarantine is not None:
+          quarantine.extend(rejected)
+
+     if CONVERTER_FACTORIZE:
+          log_converter_cache(cache_before)
+     logging.info('====Transformation Complete!====')
+     return df 
 
-     # Step 2: Transforming value columns
-     df = transform_value_column(df)
+def transform_partition(partition, strict):
+     """transform_fifa_data of one worker: the cleaned rows and their quarantine"""
+     quarantine = []
+     return transform_fifa_data(partition, strict=strict, quarantine=quarantine), quarantine
 
-     # Step 3: Transform weight column
+def transform_in_parallel(raw_data, workers, strict=False, quarantine=None):
+     """Transform row partitions of raw_data in a process pool
 
-     df = transform_weight_column(df)
+     The partitions are reassembled in their original order. Each partition
+     infers the dtype of a converted column on its own rows, so columns whose
+     partitions disagree are re-inferred over all rows, exactly as a serial
+     run would have done.
 
-     # Step 4: Transform wage column
+     Args:
+          raw_data(pd.Dataframe): Raw Fifa Dataset
+          workers(int): Number of worker processes
+          strict(bool): See transform_fifa_data
+          quarantine(list): See transform_fifa_data
 
-     df = transform_wage_column(df)
+     Returns:
+          pd.Dataframe: Fully transformed dataset, identical to the serial run
+     """
 
-     # Step 5: Transform height column
+     bounds = np.linspace(0, len(raw_data), min(workers, len(raw_data)) + 1).astype(int)
+     partitions = [raw_data.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
 
-     df = transform_height_column(df) 
+     logging.info(f"Transforming {len(raw_data):,} rows in {len(partitions)} partitions on {workers} workers----")
 
-     # Step 6: Transform hits column
+     with ProcessPoolExecutor(max_workers=workers, **worker_logging_options()) as executor:
+          results = list(executor.map(transform_partition, partitions, [strict] * len(partitions)))
 
-     df = transform_hits_column(df)
+     df = combine_partitions([cleaned for cleaned, _ in results])
+     if quarantine is not None:
+          quarantine.extend(frame for _, rejected in results for frame in rejected)
 
-     # Step 7: transform release column
+     logging.info('====Parallel Transformation Complete!====')
+     return df
 
-     df = transform_release_column(df)
+def combine_partitions(results):
+     """Concatenate transformed partitions as if they were transformed together
 
-     # Step 8: Deleted four columns
+     Each partition infers the dtype of a converted column on its own rows,
+     so columns whose partitions disagree are re-inferred over all rows.
+     Categorical columns with different categories are rebuilt from the
+     values they hold.
 
-     df= delete_four_column(df)
+     Args:
+          results(list): Transformed partitions, in row order
 
-     logging.info('====Transformation Complete!====')
-     return df 
+     Returns:
+          pd.Dataframe: The concatenated partitions
+     """
+
+     non_empty = [result for result in results if len(result)] or results[:1]
+     df = pd.concat(non_empty)
+
+     for column in df.columns:
+          dtypes = [result[column].dtype for result in non_empty]
+          if all(isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes):
+               if not isinstance(df[column].dtype, pd.CategoricalDtype):
+                    df[column] = df[column].astype('category')
+          elif len({str(dtype) for dtype in dtypes}) > 1:
+               df[column] = pd.Series(df[column].to_numpy(dtype=object), index=df.index,
+                                      name=column, dtype=object).infer_objects()
+     return df
 
 if __name__ == "__main__":
 
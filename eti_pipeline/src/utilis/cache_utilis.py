@@ -0,0 +1,297 @@
+import os
+import sys
+import glob
+import json
+import hashlib
+import logging
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from eti_pipeline.src.utilis.path_utilis import PROJECT_ROOT
+from eti_pipeline.src.utilis.file_utilis import path_size
+from config import config
+from config.config import (
+    DATA_DIR,
+    CACHE_SUBDIR,
+    RUN_CACHE_MAX_MB,
+    RUN_CACHE_KEY_SETTINGS,
+    RUN_CACHE_OUTPUT_SETTINGS,
+    MB_CONVERSION
+)
+
+#Source files whose changes invalidate cached output
+CODE_VERSION_FILES = [
+    os.path.join('eti_pipeline', 'src', 'extract', '*.py'),
+    os.path.join('eti_pipeline', 'src', 'transform', '*.py'),
+    os.path.join('eti_pipeline', 'src', 'utilis', 'file_utilis.py'),
+    os.path.join('eti_pipeline', 'src', 'utilis', 'series_utilis.py'),
+]
+
+#Source files whose changes rewrite the output files of a cached run
+OUTPUT_CODE_FILES = [
+    os.path.join('eti_pipeline', 'src', 'load', '*.py'),
+    os.path.join('eti_pipeline', 'src', 'utilis', 'compression_utilis.py'),
+]
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+#Suffix of the strict mode quarantine stored with a cache entry
+QUARANTINE_SUFFIX = '.quarantine.parquet'
+
+
+def default_cache_dir():
+    """Return the run cache location, data/cache/"""
+    return os.path.join(PROJECT_ROOT, DATA_DIR, CACHE_SUBDIR)
+
+
+def file_digest(file_path):
+    """SHA-256 of a file's contents, read in 1 MB blocks"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def code_files(patterns=None):
+    """Project-relative source files matching patterns (CODE_VERSION_FILES), in order"""
+    if patterns is None:
+        patterns = CODE_VERSION_FILES
+    return [os.path.relpath(path, PROJECT_ROOT)
+            for pattern in patterns
+            for path in sorted(glob.glob(os.path.join(PROJECT_ROOT, pattern)))]
+
+
+def code_version(patterns=None):
+    """Hash of the Extract/Transform source code (or of the files matching patterns)"""
+    digest = hashlib.sha256()
+    for path in code_files(patterns):
+        digest.update(path.encode())
+        with open(os.path.join(PROJECT_ROOT, path), 'rb') as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def pipeline_fingerprint(**options):
+    """Hash of everything besides the raw data that shapes the cleaned output.
+
+    Args:
+        **options: Run options that change the cleaned output (e.g. engine)
+
+    Returns:
+        str: Hex digest of the code version, RUN_CACHE_KEY_SETTINGS and options
+    """
+    settings = {name: getattr(config, name) for name in RUN_CACHE_KEY_SETTINGS}
+    fingerprint = json.dumps(
+        {'code': code_version(), 'settings': settings, 'options': options},
+        sort_keys=True,
+        default=repr
+    )
+    return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+
+def output_settings_digest():
+    """Hash of the writer code (OUTPUT_CODE_FILES) and the settings in RUN_CACHE_OUTPUT_SETTINGS"""
+    settings = {name: getattr(config, name) for name in RUN_CACHE_OUTPUT_SETTINGS}
+    settings['code'] = code_version(OUTPUT_CODE_FILES)
+    return hashlib.sha256(json.dumps(settings, sort_keys=True, default=repr).encode()).hexdigest()
+
+
+def run_cache_key(raw_path, **options):
+    """Cache key of a run: raw file contents, code version and settings.
+
+    Args:
+        raw_path (str): Raw CSV file
+        **options: Run options that change the cleaned output (e.g. engine)
+
+    Returns:
+        str: Hex digest identifying the cleaned output
+    """
+    key = f"{file_digest(raw_path)}:{pipeline_fingerprint(**options)}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def entry_paths(key, cache_dir=None):
+    """Return the (data, metadata) files of a cache entry"""
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+    return os.path.join(cache_dir, f"{key}.parquet"), os.path.join(cache_dir, f"{key}.json")
+
+
+def quarantine_entry_path(key, cache_dir=None):
+    """Return the quarantine file of a cache entry, see store_cached_run"""
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+    return os.path.join(cache_dir, f"{key}{QUARANTINE_SUFFIX}")
+
+
+def load_cached_run(key, cache_dir=None):
+    """Load the cleaned data of a previous run with the same key.
+
+    A hit marks the entry as recently used for LRU eviction.
+
+    Returns:
+        tuple: (cleaned_data, metadata) or None on a miss
+    """
+    data_path, meta_path = entry_paths(key, cache_dir)
+    if not (os.path.exists(data_path) and os.path.exists(meta_path)):
+        logging.info(f"🗃️  Run cache miss: {key[:12]}")
+        return None
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    try:
+        with open(meta_path, encoding='utf-8') as file:
+            metadata = json.load(file)
+        cleaned_data = pq.read_table(data_path).to_pandas()
+    except (OSError, ValueError, pa.ArrowException) as e:
+        logging.warning(f"⚠️  Unreadable run cache entry {key[:12]}, ignoring it: {e}")
+        return None
+
+    for path in (data_path, meta_path):
+        os.utime(path)
+    logging.info(f"🗃️  Run cache hit: {key[:12]} ({cleaned_data.shape[0]:,} rows)")
+    return cleaned_data, metadata
+
+
+def load_cached_quarantine(key, cache_dir=None):
+    """Load the strict mode quarantine stored with a cache entry
+
+    Returns:
+        pd.DataFrame: The quarantine table, or None if the entry has none
+    """
+    quarantine_path = quarantine_entry_path(key, cache_dir)
+    if not os.path.exists(quarantine_path):
+        return None
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    try:
+        return pq.read_table(quarantine_path).to_pandas()
+    except (OSError, pa.ArrowException) as e:
+        logging.warning(f"⚠️  Unreadable quarantine of run cache entry {key[:12]}, ignoring it: {e}")
+        return None
+
+
+def store_cached_run(key, cleaned_data, raw_shape, cache_dir=None, max_mb=RUN_CACHE_MAX_MB, quarantine=None):
+    """Store the cleaned data of a run, then evict old entries.
+
+    Frames Parquet cannot hold (mixed-type columns left by malformed values)
+    are not cached. A strict run's quarantine table is stored with the
+    entry, so a cache hit can write it again (see load_cached_quarantine).
+
+    Returns:
+        str: Path of the cached Parquet file, or None if not cached
+    """
+    data_path, meta_path = entry_paths(key, cache_dir)
+    os.makedirs(os.path.dirname(data_path), exist_ok=True)
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    try:
+        pq.write_table(pa.Table.from_pandas(cleaned_data), data_path)
+    except (pa.ArrowException, ValueError, TypeError) as e:
+        logging.warning(f"⚠️  Cleaned data cannot be cached as Parquet: {e}")
+        if os.path.exists(data_path):
+            os.remove(data_path)
+        return None
+
+    quarantine_path = quarantine_entry_path(key, cache_dir)
+    if quarantine is not None:
+        pq.write_table(pa.Table.from_pandas(quarantine, preserve_index=False), quarantine_path)
+    elif os.path.exists(quarantine_path):
+        os.remove(quarantine_path)
+
+    write_metadata(meta_path, {'raw_shape': list(raw_shape), 'outputs': {}})
+    logging.info(f"🗃️  Stored run cache entry {key[:12]}")
+    evict_cache(max_mb, cache_dir)
+    return data_path
+
+
+def write_metadata(meta_path, metadata):
+    """Write a cache entry's JSON metadata"""
+    with open(meta_path, 'w', encoding='utf-8') as file:
+        json.dump(metadata, file, indent=2)
+
+
+def evict_cache(max_mb=RUN_CACHE_MAX_MB, cache_dir=None):
+    """Delete least recently used entries until the cache fits in max_mb.
+
+    Returns:
+        list: Keys of the evicted entries
+    """
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+
+    entries = []
+    for data_path in glob.glob(os.path.join(cache_dir, '*.parquet')):
+        if data_path.endswith(QUARANTINE_SUFFIX):
+            continue
+        key = os.path.splitext(os.path.basename(data_path))[0]
+        paths = [path for path in (*entry_paths(key, cache_dir), quarantine_entry_path(key, cache_dir))
+                 if os.path.exists(path)]
+        entries.append((
+            max(os.path.getmtime(path) for path in paths),
+            sum(os.path.getsize(path) for path in paths),
+            key,
+            paths
+        ))
+
+    total = sum(size for _, size, _, _ in entries)
+    evicted = []
+    for _, size, key, paths in sorted(entries):
+        if total <= max_mb * MB_CONVERSION:
+            break
+        for path in paths:
+            os.remove(path)
+        total -= size
+        evicted.append(key)
+
+    if evicted:
+        logging.info(f"🗃️  Evicted {len(evicted)} run cache entr{'y' if len(evicted) == 1 else 'ies'}")
+    return evicted
+
+
+def record_cached_outputs(key, saved_files, cache_dir=None):
+    """Remember the files a cached run wrote, see cached_outputs_current"""
+    _, meta_path = entry_paths(key, cache_dir)
+    if not os.path.exists(meta_path):
+        return
+
+    with open(meta_path, encoding='utf-8') as file:
+        metadata = json.load(file)
+    metadata['outputs'] = {
+        name: {'path': path, 'size': path_size(path), 'mtime_ns': os.stat(path).st_mtime_ns}
+        for name, path in saved_files.items()
+        if os.path.exists(path)  # database URLs cannot be checked, they are always reloaded
+    }
+    metadata['output_settings'] = output_settings_digest()
+    write_metadata(meta_path, metadata)
+
+
+def cached_outputs_current(metadata, targets):
+    """Check that every target was written from this cache entry and is untouched.
+
+    Args:
+        metadata (dict): Cache entry metadata from load_cached_run
+        targets (dict): name -> (format, filepath), see resolve_output_targets
+
+    Returns:
+        bool: True if the Load step can be skipped
+    """
+    outputs = metadata.get('outputs', {})
+    if not targets or set(outputs) != set(targets):
+        return False
+    if metadata.get('output_settings') != output_settings_digest():
+        return False
+
+    for name, (_, filepath) in targets.items():
+        output = outputs[name]
+        if output['path'] != filepath or not os.path.exists(filepath):
+            return False
+        if path_size(filepath) != output['size'] or os.stat(filepath).st_mtime_ns != output['mtime_ns']:
+            return False
+    return True
@@ -0,0 +1,97 @@
+import io
+import os
+import sys
+import bz2
+import gzip
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config.config import COMPRESSION_LEVELS, FILE_ENCODING
+
+#File suffix -> codec, e.g. the 'jsonl.gz' format is gzip-compressed JSON Lines
+COMPRESSION_SUFFIXES = {
+    'gz': 'gzip',
+    'zst': 'zstd',
+    'bz2': 'bz2',
+}
+
+
+def split_compressed_format(fmt):
+    """Split a format name into its base format and codec
+
+    Returns:
+        tuple: ('jsonl', 'gzip') for 'jsonl.gz', ('csv', None) for 'csv'
+    """
+    base, _, suffix = fmt.rpartition('.')
+    if base and suffix in COMPRESSION_SUFFIXES:
+        return base, COMPRESSION_SUFFIXES[suffix]
+    return fmt, None
+
+
+class CountingWriter(io.BufferedIOBase):
+    """Binary stream that counts the bytes passed on to the wrapped stream"""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.bytes_written = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.raw.write(data)
+        self.bytes_written += len(data)
+        return len(data)
+
+    def flush(self):
+        self.raw.flush()
+
+    def close(self):
+        if not self.closed:
+            super().close()
+            self.raw.close()
+
+
+def uncompressed_bytes(file):
+    """Bytes of text written so far to a file from open_compressed(compression=...)"""
+    return getattr(getattr(file, 'buffer', None), 'bytes_written', None)
+
+
+def open_compressed(filepath, compression=None, level=None, encoding=FILE_ENCODING, newline=None):
+    """Open a text file for writing, compressing it on the fly
+
+    Text is encoded and compressed block by block as it is written, so the
+    compressed bytes are never held in memory.
+
+    Args:
+        filepath (str): File to write
+        compression (str): 'gzip', 'zstd', 'bz2' or None for plain text
+        level (int): Codec level, defaults to COMPRESSION_LEVELS[compression]
+
+    Returns:
+        io.TextIOBase: File object; closing it finishes the compressed stream.
+        For compressed files uncompressed_bytes(file) counts the text written.
+    """
+    if compression is None:
+        return open(filepath, 'w', encoding=encoding, newline=newline)
+
+    if level is None:
+        level = COMPRESSION_LEVELS[compression]
+
+    if compression == 'gzip':
+        binary = gzip.open(filepath, 'wb', compresslevel=level)
+    elif compression == 'bz2':
+        binary = bz2.open(filepath, 'wb', compresslevel=level)
+    elif compression == 'zstd':
+        try:
+            import zstandard  # optional, only needed for .zst outputs
+        except ImportError:
+            raise ImportError("zstd compression needs the 'zstandard' package (pip install zstandard)") from None
+        binary = zstandard.ZstdCompressor(level=level).stream_writer(open(filepath, 'wb'), closefd=True)
+    else:
+        raise ValueError(f"Unknown compression: {compression} (known: {', '.join(COMPRESSION_SUFFIXES.values())})")
+
+    return io.TextIOWrapper(CountingWriter(binary), encoding=encoding, newline=newline)
@@ -1,5 +1,6 @@
 import os
 import sys
+import numpy as np
 import pandas as pd
 import logging
 
@@ -12,19 +13,24 @@ if project_root not in sys.path:
 from eti_pipeline.src.utilis.path_utilis import PROJECT_ROOT
 from config.config import DATA_DIR, CSV_LOW_MEMORY
 
-def load_csv_safe(file_path: str, **kwargs) -> pd.DataFrame:
-    """Safely load CSV with comprehensive error handling.
-    
-    Raises explicit exceptions instead of returning None.
-    Provides helpful error messages for debugging.
+def path_size(path: str) -> int:
+    """Size in bytes of a file, or of every file under a directory"""
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+def check_csv_file(file_path: str) -> None:
+    """Check that a CSV file exists, is readable and is not empty.
 
     Raises:
         FileNotFoundError: If file doesn't exist
         PermissionError: If file can't be read
-        pd.errors.EmptyDataError: If file is empty or has no data
-        pd.errors.ParserError: If CSV is malformed
-        UnicodeDecodeError: If file encoding is wrong
-    
+        pd.errors.EmptyDataError: If file is empty
     """
 
     # Check 1: Does the file exists
@@ -59,13 +65,36 @@ def load_csv_safe(file_path: str, **kwargs) -> pd.DataFrame:
         error_msg = f"❌ File is empty (0 bytes): {os.path.basename(file_path)}"
         logging.error(error_msg)
         raise pd.errors.EmptyDataError(error_msg)
+
+
+def load_csv_safe(file_path: str, schema: dict = None, **kwargs) -> pd.DataFrame:
+    """Safely load CSV with comprehensive error handling.
     
+    Raises explicit exceptions instead of returning None.
+    Provides helpful error messages for debugging.
+
+    Args:
+        file_path (str): CSV file to read
+        schema (dict): Typed read options ('dtype', 'usecols'), e.g.
+            RAW_SCHEMA. If the values do not fit the declared dtypes the
+            file is read again with inferred dtypes.
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        PermissionError: If file can't be read
+        pd.errors.EmptyDataError: If file is empty or has no data
+        pd.errors.ParserError: If CSV is malformed
+        UnicodeDecodeError: If file encoding is wrong
+    
+    """
+
+    check_csv_file(file_path)
 
     #Try to load CSV
 
     try:
         logging.info(f"Loading CSV: {os.path.basename(file_path)}")
-        df = pd.read_csv(file_path, **kwargs)
+        df = read_csv_typed(file_path, schema, **kwargs)
         
         # Check 4: Did we actually get data?
         if df.empty or len(df) == 0:
@@ -113,6 +142,207 @@ def load_csv_safe(file_path: str, **kwargs) -> pd.DataFrame:
         logging.error(error_msg)
         raise Exception(error_msg) from e
 
+
+def resolve_usecols(file_path: str, usecols):
+    """Turn a callable usecols filter into the list of matching header columns.
+
+    The pyarrow engine only accepts column lists, so the header is read once
+    and filtered here.
+    """
+    if not callable(usecols):
+        return usecols
+    header = pd.read_csv(file_path, nrows=0).columns
+    return [column for column in header if usecols(column)]
+
+
+def split_integer_dtypes(schema: dict):
+    """Take the integer dtypes out of a read schema
+
+    read_csv wraps integers that do not fit a narrow dtype (300 -> 44 as
+    int8) and the pyarrow engine truncates fractions, so integer columns are
+    read with inferred dtypes and narrowed afterwards by narrow_integers.
+
+    Returns:
+        tuple: (schema without the integer dtypes, column -> integer dtype)
+    """
+    dtypes = schema.get('dtype') or {}
+    integers = {column: dtype for column, dtype in dtypes.items()
+                if dtype != 'category' and pd.api.types.is_integer_dtype(pd.api.types.pandas_dtype(dtype))}
+    others = {column: dtype for column, dtype in dtypes.items() if column not in integers}
+    return {**schema, 'dtype': others}, integers
+
+
+def scan_integers(df: pd.DataFrame, dtypes: dict, stats: dict = None) -> dict:
+    """Collect what narrow_integers needs to know about the integer columns of df
+
+    Pass the stats of earlier chunks to accumulate them over a whole file.
+
+    Returns:
+        dict: column -> {'numeric', 'integral', 'missing', 'min', 'max'}
+    """
+    stats = {} if stats is None else stats
+    for column in dtypes:
+        if column not in df.columns:
+            continue
+        values = df[column]
+        entry = stats.setdefault(column, {'numeric': True, 'integral': True, 'missing': False,
+                                          'min': np.inf, 'max': -np.inf})
+        if not pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+            entry['numeric'] = False
+            continue
+
+        numbers = values.to_numpy(dtype='float64', na_value=np.nan)
+        present = numbers[~np.isnan(numbers)]
+        entry['integral'] = entry['integral'] and bool(np.all(present == np.round(present)))
+        entry['missing'] = entry['missing'] or len(present) < len(numbers)
+        if len(present):
+            entry['min'] = min(entry['min'], present.min())
+            entry['max'] = max(entry['max'], present.max())
+    return stats
+
+
+def fitted_integer_dtype(entry: dict, dtype: str):
+    """dtype, or its nullable variant (int8 -> Int8) when values are missing,
+    if every scanned value fits it - None otherwise"""
+    limits = np.iinfo(dtype)
+    if not (entry['numeric'] and entry['integral']) or entry['min'] < limits.min or entry['max'] > limits.max:
+        return None
+    return dtype.capitalize() if entry['missing'] else dtype
+
+
+def narrow_integers(df: pd.DataFrame, dtypes: dict) -> pd.DataFrame:
+    """Narrow columns to their schema integer dtype where every value fits
+
+    A column whose values are all whole numbers in the dtype's range gets the
+    dtype, or its nullable variant (int8 -> Int8) when values are missing.
+    Columns with fractions, out-of-range values or text are kept as read and
+    reported, so no value is ever changed.
+    """
+    stats = scan_integers(df, dtypes)
+    misfits = []
+    for column, dtype in dtypes.items():
+        if column not in stats:
+            continue
+        target = fitted_integer_dtype(stats[column], dtype)
+        if target is None:
+            misfits.append(column)
+            continue
+
+        values = df[column]
+        if isinstance(values.dtype, pd.ArrowDtype):
+            import pyarrow as pa
+            target = pd.ArrowDtype(pa.from_numpy_dtype(np.dtype(dtype)))
+        if values.dtype != target:
+            df[column] = values.astype(target)
+
+    if misfits:
+        logging.warning(f"⚠️  Values do not fit the schema dtypes of {misfits}, kept with inferred dtypes")
+    return df
+
+
+def stream_integer_dtypes(file_path: str, dtypes: dict, chunksize: int, **kwargs) -> dict:
+    """Integer dtypes of a chunked read, decided once from the whole file
+
+    Narrowing every chunk on its own would give the chunks of one stream
+    different dtypes (int8 in one, int64 in the next), which a Parquet or
+    Feather writer cannot append. The integer columns alone are read once
+    beforehand, chunk by chunk, and each gets the dtype narrow_integers would
+    give it on a full read: the schema dtype (nullable if any value is
+    missing) when every value fits, else int64, float64 or str.
+
+    Returns:
+        dict: column -> dtype for every chunk
+    """
+    stats = {}
+    options = {key: value for key, value in kwargs.items() if key != 'usecols'}
+    with pd.read_csv(file_path, chunksize=chunksize, usecols=lambda column: column in dtypes, **options) as reader:
+        for chunk in reader:
+            scan_integers(chunk, dtypes, stats)
+
+    targets, misfits = {}, []
+    int64 = np.iinfo('int64')
+    for column, entry in stats.items():
+        targets[column] = fitted_integer_dtype(entry, dtypes[column])
+        if targets[column] is not None:
+            continue
+        misfits.append(column)
+        if not entry['numeric']:
+            targets[column] = 'str'
+        elif entry['integral'] and not entry['missing'] and int64.min <= entry['min'] and entry['max'] <= int64.max:
+            targets[column] = 'int64'
+        else:
+            targets[column] = 'float64'
+
+    if misfits:
+        logging.warning(f"⚠️  Values do not fit the schema dtypes of {misfits}, kept with inferred dtypes")
+    return targets
+
+
+def read_csv_typed(file_path: str, schema: dict = None, **kwargs) -> pd.DataFrame:
+    """pd.read_csv with a schema, falling back to inferred dtypes
+
+    Integer columns are parsed as int64/float64 and narrowed after the read
+    (see narrow_integers), so values that do not fit the schema are kept
+    instead of wrapped. read_csv wraps narrow dtypes, nullable ones too, so
+    only the resident frame is smaller, not the parse itself.
+    """
+    if not schema:
+        return pd.read_csv(file_path, **kwargs)
+
+    if kwargs.get('engine') == 'pyarrow' and 'usecols' in schema:
+        schema = {**schema, 'usecols': resolve_usecols(file_path, schema['usecols'])}
+    schema, integers = split_integer_dtypes(schema)
+
+    try:
+        return narrow_integers(pd.read_csv(file_path, **schema, **kwargs), integers)
+    except pd.errors.ParserError:
+        raise
+    except ValueError as e:
+        logging.warning(f"⚠️  Values do not fit the schema dtypes ({e}), reading with inferred dtypes")
+        untyped = {key: value for key, value in schema.items() if key != 'dtype'}
+        return pd.read_csv(file_path, **untyped, **kwargs)
+
+
+def iter_csv_safe(file_path: str, chunksize: int, schema: dict = None, **kwargs):
+    """Read a CSV file lazily, one DataFrame of at most chunksize rows at a time.
+
+    Runs the same file checks as load_csv_safe before the first chunk is read,
+    so memory stays bounded by the chunk size instead of the file size.
+    A schema is applied to every chunk. Integer columns get the same dtype in
+    every chunk, decided from the whole file by stream_integer_dtypes (one
+    extra pass over those columns only): values that do not fit are kept,
+    not wrapped, and no chunk fails the read.
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        PermissionError: If file can't be read
+        pd.errors.EmptyDataError: If file is empty or has no data
+        pd.errors.ParserError: If CSV is malformed
+    """
+    check_csv_file(file_path)
+
+    logging.info(f"Streaming CSV: {os.path.basename(file_path)} ({chunksize:,} rows per chunk)")
+    schema, integers = split_integer_dtypes(schema or {})
+    try:
+        if integers:
+            integers = stream_integer_dtypes(file_path, integers, chunksize, **kwargs)
+        with pd.read_csv(file_path, chunksize=chunksize, **schema, **kwargs) as reader:
+            for chunk in reader:
+                yield chunk.astype({column: dtype for column, dtype in integers.items() if column in chunk.columns})
+
+    except pd.errors.EmptyDataError as e:
+        error_msg = f"❌ CSV file is empty or has no valid data: {os.path.basename(file_path)}"
+        logging.error(error_msg)
+        raise pd.errors.EmptyDataError(error_msg) from e
+
+    except pd.errors.ParserError as e:
+        error_msg = (
+            f"\n CSV file is corrupted or malformed: {file_path}\n"
+            f"   Parser error: {str(e)}"
+        )
+        logging.error(error_msg)
+        raise pd.errors.ParserError(error_msg) from e
+
 # Test code
 if __name__ == "__main__":
     from logger_utilis import setup_logging
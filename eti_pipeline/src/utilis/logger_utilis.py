@@ -1,60 +1,121 @@
 import os
 import sys
+import atexit
 import logging
-from datetime import datetime
+import multiprocessing
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
 
 # Add project root to path FIRST
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-#Import  Path_Utilis FIRST to fix Python Path 
+#Import  Path_Utilis FIRST to fix Python Path
 from eti_pipeline.src.utilis.path_utilis import PROJECT_ROOT
 
-#Import from config 
+#Import from config
 from config.config import (
     LOG_FORMAT,
-    LOG_LEVEL
+    LOG_LEVEL,
+    LOG_DIR,
+    LOG_FILENAME,
+    LOG_ROTATION,
+    LOG_MAX_MB,
+    LOG_ROTATE_WHEN,
+    LOG_BACKUP_COUNT,
+    MB_CONVERSION
 )
 
+#Process-wide logging state, see setup_logging
+_log_queue = None
+_listener = None
 
-def setup_logging(name: str = None) -> logging.Logger:
+
+def rotating_file_handler(log_filepath):
+    """File handler rotating by size or time (LOG_ROTATION), keeping LOG_BACKUP_COUNT old files"""
+    if LOG_ROTATION == 'time':
+        return TimedRotatingFileHandler(log_filepath, when=LOG_ROTATE_WHEN, backupCount=LOG_BACKUP_COUNT,
+                                        encoding='utf-8', delay=True)
+    return RotatingFileHandler(log_filepath, maxBytes=int(LOG_MAX_MB * MB_CONVERSION),
+                               backupCount=LOG_BACKUP_COUNT, encoding='utf-8', delay=True)
+
+
+def setup_logging(name: str = None, log_dir: str = None) -> logging.Logger:
     """Configure and return with consistent formatting
-       Creates timestamped log files in logs/ directory.
-       Console shows INFO+, file captures DEBUG+.
-    
+       Logs go to the console and to logs/LOG_FILENAME, rotated by size or
+       time with LOG_BACKUP_COUNT old files kept.
+
+       The loggers only put records on a queue; a QueueListener thread
+       formats them and does the console and file I/O, so logging never
+       blocks the pipeline. The queue is a multiprocessing queue: worker
+       processes started with worker_logging_options() log through it too.
+
+       Call it once from an entry point; library modules only use
+       logging.getLogger and never configure handlers on import. Calling it
+       again returns the logger without adding handlers.
+
+    """
+    global _log_queue, _listener
+
+    if _listener is None:
+        # Create logs directory if it doesn't exist
+        if log_dir is None:
+            log_dir = os.path.join(PROJECT_ROOT, LOG_DIR)
+        os.makedirs(log_dir, exist_ok=True)
+        log_filepath = os.path.join(log_dir, LOG_FILENAME)
+
+        formatter = logging.Formatter(LOG_FORMAT)
+        handlers = [logging.StreamHandler(), rotating_file_handler(log_filepath)]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        _log_queue = multiprocessing.Queue(-1)
+        _listener = QueueListener(_log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+        attach_queue_handler(_log_queue)
+        logging.getLogger(name).info(f" Logging to: {log_filepath}")
+
+    return logging.getLogger(name)
+
+
+def attach_queue_handler(log_queue):
+    """Route every record of this process to log_queue, replacing the root handlers"""
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(LOG_LEVEL)
+
+
+def worker_logging_options():
+    """ProcessPoolExecutor keyword arguments that send the workers' logs to this process
+
+    Returns:
+        dict: initializer/initargs, empty when setup_logging has not been called
     """
+    if _log_queue is None:
+        return {}
+    return {'initializer': attach_queue_handler, 'initargs': (_log_queue,)}
+
+
+def shutdown_logging():
+    """Write out the queued records and stop the listener (registered with atexit)"""
+    global _log_queue, _listener
+
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
 
-    # Create logs directory if it doesn't exist
-    log_dir = os.path.join(PROJECT_ROOT, 'logs')
-    os.makedirs(log_dir, exist_ok=True)
-    
-    # Create timestamped log filename
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    log_filename = f'pipeline_{timestamp}.log'
-    log_filepath = os.path.join(log_dir, log_filename)
-    
-    # Clear any existing handlers (prevents duplicate logs)
     root_logger = logging.getLogger()
-    if root_logger.handlers:
-        root_logger.handlers.clear()
-
-
-    logging.basicConfig(
-        level=LOG_LEVEL,
-        format=LOG_FORMAT,
-        handlers=[
-            
-            # Handler 1: Console (shows INFO and above)
-            logging.StreamHandler(),
-            # Handler 2: File (captures everything including DEBUG)
-            logging.FileHandler(log_filepath, mode='w', encoding='utf-8')
-            ]
-    )
-
-    logger = logging.getLogger(name)
-    logger.info(f" Log file created: {log_filename}")
-    return logger
+    for handler in root_logger.handlers[:]:
+        if isinstance(handler, QueueHandler) and handler.queue is _log_queue:
+            root_logger.removeHandler(handler)
+    _log_queue.close()
+    _log_queue = _listener = None
 
 # Test the logger setup
 
@@ -63,4 +124,3 @@ if __name__ == "__main__":
     logger.info("Logger utility is working!")
     logger.debug("This is a debug message")
     logger.warning("This is a warning")
-
@@ -0,0 +1,159 @@
+import os
+import sys
+import json
+import time
+import logging
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Add project root to path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config.config import MB_CONVERSION, SUMMARY_SEPARATOR, SUMMARY_SUBSEPARATOR
+
+#ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+RSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
+_active_profiler = None
+
+
+def peak_rss_mb():
+    """High-water mark of this process's resident memory, in MB"""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * RSS_UNIT / MB_CONVERSION
+
+
+class StageProfiler:
+    """Records wall time, CPU time and memory of nested pipeline stages.
+
+    Stages are opened with profile_stage(name) anywhere in the pipeline while
+    the profiler is active. Each record holds:
+        wall_s: elapsed seconds
+        cpu_s: CPU seconds of the process (of the thread for stages run in
+            worker threads, e.g. the parallel writers)
+        peak_rss_mb: process resident memory high-water mark at stage end
+        peak_traced_mb: peak Python allocations during the stage, when
+            trace_memory is on (main thread only)
+    """
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.stages = []
+        self.started_at = datetime.now()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._main_stack = []
+
+    def _stack(self):
+        if threading.current_thread() is threading.main_thread():
+            return self._main_stack
+        if not hasattr(self._local, 'stack'):
+            # Worker threads nest under the stage that is open in the main thread
+            self._local.stack = list(self._main_stack[-1:])
+        return self._local.stack
+
+    @contextmanager
+    def stage(self, name):
+        """Profile the enclosed block as a sub-stage of the open stage"""
+        stack = self._stack()
+        in_main = stack is self._main_stack
+        record = {
+            'stage': '/'.join([stack[-1]['stage'], name]) if stack else name,
+            'depth': stack[-1]['depth'] + 1 if stack else 0,
+        }
+        cpu_clock = time.process_time if in_main else time.thread_time
+        traced = self.trace_memory and in_main and tracemalloc.is_tracing()
+
+        if traced:
+            # Fold the peak seen so far into the enclosing stage before resetting it
+            if stack:
+                stack[-1]['_traced_peak'] = max(stack[-1].get('_traced_peak', 0), tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+
+        with self._lock:
+            self.stages.append(record)
+        stack.append(record)
+        wall_start, cpu_start = time.perf_counter(), cpu_clock()
+        try:
+            yield record
+        finally:
+            record['wall_s'] = round(time.perf_counter() - wall_start, 4)
+            record['cpu_s'] = round(cpu_clock() - cpu_start, 4)
+            record['peak_rss_mb'] = peak_rss_mb()
+            if traced:
+                peak = max(record.pop('_traced_peak', 0), tracemalloc.get_traced_memory()[1])
+                record['peak_traced_mb'] = round(peak / MB_CONVERSION, 2)
+                if len(stack) > 1:
+                    stack[-2]['_traced_peak'] = max(stack[-2].get('_traced_peak', 0), peak)
+                tracemalloc.reset_peak()
+            else:
+                record['peak_traced_mb'] = None
+            stack.pop()
+
+    def summary_table(self):
+        """Return the recorded stages as a printable table"""
+        lines = [
+            SUMMARY_SEPARATOR,
+            f"{'Stage':<28}{'Wall (s)':>8}{'CPU (s)':>8}{'RSS (MB)':>9}{'Traced':>7}",
+            SUMMARY_SUBSEPARATOR,
+        ]
+        for record in self.stages:
+            name = '  ' * record['depth'] + record['stage'].rsplit('/', 1)[-1]
+            rss = f"{record['peak_rss_mb']:.0f}" if record.get('peak_rss_mb') is not None else '-'
+            traced = f"{record['peak_traced_mb']:.1f}" if record.get('peak_traced_mb') is not None else '-'
+            lines.append(f"{name[:28]:<28}{record.get('wall_s', 0):>8.3f}{record.get('cpu_s', 0):>8.3f}{rss:>9}{traced:>7}")
+        lines.append(SUMMARY_SEPARATOR)
+        return "\n".join(lines)
+
+    def write_metrics(self, filepath, **extra):
+        """Write the recorded stages (and any extra fields) as JSON"""
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        metrics = {
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'tracemalloc': self.trace_memory,
+            **extra,
+            'stages': self.stages,
+        }
+        with open(filepath, 'w', encoding='utf-8') as file:
+            json.dump(metrics, file, indent=2)
+        logging.info(f"📈 Run metrics saved: {filepath}")
+        return filepath
+
+
+@contextmanager
+def profiling(trace_memory=False):
+    """Activate a StageProfiler for the enclosed block and yield it"""
+    global _active_profiler
+    previous = _active_profiler
+    profiler = StageProfiler(trace_memory=trace_memory)
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    _active_profiler = profiler
+    try:
+        yield profiler
+    finally:
+        _active_profiler = previous
+        if started_tracing:
+            tracemalloc.stop()
+
+
+@contextmanager
+def profile_stage(name):
+    """Record the enclosed block as a stage of the active profiler, if any"""
+    if _active_profiler is None:
+        yield None
+    else:
+        with _active_profiler.stage(name) as record:
+            yield record
+
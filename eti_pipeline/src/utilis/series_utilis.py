@@ -0,0 +1,133 @@
+import re
+import functools
+import numpy as np
+import pandas as pd
+
+
+@functools.cache
+def arrow_dtype(name: str) -> pd.ArrowDtype:
+    """pd.ArrowDtype of a pyarrow type ('string', 'float64'), importing pyarrow on first use"""
+    import pyarrow as pa
+    return pd.ArrowDtype(getattr(pa, name)())
+
+
+def start_conversion(series: pd.Series, na_result):
+    """Start a vectorized conversion of a string column.
+
+    Missing rows (None, NaN, pd.NA) get the converter's null result straight
+    away, every other row is marked as pending. Columns made only of strings
+    are viewed as Arrow strings so the regex work runs outside the
+    interpreter; mixed columns are left entirely to the scalar converter.
+
+    Returns:
+        tuple: (strings, result, pending) - the Arrow string view of the
+        column (None for mixed columns), an object array holding the
+        converted values and a boolean mask of the rows still to convert.
+    """
+    missing = series.isna().to_numpy(dtype=bool)
+    result = np.empty(len(series), dtype=object)
+    result[missing] = na_result
+
+    values = series.cat.categories if isinstance(series.dtype, pd.CategoricalDtype) else series
+    if pd.api.types.infer_dtype(values, skipna=True) in ('string', 'empty'):
+        strings = series.astype(arrow_dtype('string'))
+    else:
+        strings = None
+    return strings, result, ~missing
+
+
+def match_pattern(strings: pd.Series, pattern: str, pending: np.ndarray):
+    """Match the pending rows of a column against a canonical pattern.
+
+    Only rows whose whole value matches the pattern are returned; they are
+    removed from the pending mask so later patterns skip them.
+
+    Returns:
+        tuple: (positions, groups) - integer positions of the matched rows and
+        a DataFrame with one column per named group of the pattern.
+    """
+    names = list(re.compile(pattern).groupindex)
+    positions = np.flatnonzero(pending)
+
+    if strings is not None and len(positions):
+        candidates = strings.iloc[positions]
+        hit = candidates.str.fullmatch(pattern).to_numpy(dtype=bool, na_value=False)
+        positions = positions[hit]
+    else:
+        positions = positions[:0]
+
+    if names and len(positions):
+        groups = candidates[hit].str.extract(f"^{pattern}$", expand=True)
+    else:
+        groups = pd.DataFrame({name: pd.Series(dtype=arrow_dtype('string')) for name in names})
+    pending[positions] = False
+    return positions, groups
+
+
+def finish_conversion(series: pd.Series, result: np.ndarray, pending: np.ndarray, scalar_func) -> pd.Series:
+    """Convert leftover rows with the scalar converter and build the output.
+
+    Rows that did not match any canonical pattern are handed to the original
+    scalar converter, so unusual strings are treated exactly as before. The
+    dtype is inferred the same way Series.apply does it.
+    """
+    if len(series) == 0:
+        return series.copy()
+
+    if pending.any():
+        leftovers = series.iloc[np.flatnonzero(pending)].to_numpy(dtype=object)
+        converted = np.empty(len(leftovers), dtype=object)
+        converted[:] = [scalar_func(value) for value in leftovers]
+        result[pending] = converted
+
+    return pd.Series(result, index=series.index, name=series.name, dtype=object).infer_objects()
+
+
+def to_float(groups: pd.DataFrame, column: str) -> np.ndarray:
+    """Parse a numeric group extracted by match_pattern into float64"""
+    return groups[column].astype(arrow_dtype('float64')).to_numpy(dtype='float64')
+
+
+def to_upper(groups: pd.DataFrame, column: str) -> np.ndarray:
+    """Return an extracted group as an upper-case object array"""
+    return groups[column].str.upper().to_numpy(dtype=object)
+
+
+def memoize(scalar_func, maxsize):
+    """Wrap a scalar converter in a bounded LRU cache.
+
+    typed=True keeps 1, 1.0 and True apart, since the converters treat them
+    differently.
+    """
+    return functools.lru_cache(maxsize=maxsize, typed=True)(scalar_func)
+
+
+def convert_factorized(series: pd.Series, memo_func, series_func, max_memo: int) -> pd.Series:
+    """Dictionary-encoded conversion of a low-cardinality string column.
+
+    The column is factorized, every distinct value is converted once by the
+    memoized scalar converter and the results are mapped back onto the rows
+    with take. When there are more distinct values than the memo holds, they
+    are converted by the vectorized series_func instead so a high-cardinality
+    column does not flush the cache. Returns the same values and dtype as
+    series.apply(scalar converter).
+    """
+    if len(series) == 0:
+        return series.copy()
+
+    codes, uniques = pd.factorize(series)
+
+    converted = np.empty(len(uniques), dtype=object)
+    if len(uniques) <= max_memo:
+        converted[:] = [memo_func(value) for value in np.asarray(uniques, dtype=object)]
+    elif len(uniques):
+        converted[:] = series_func(pd.Series(uniques)).to_numpy(dtype=object)
+
+    result = converted.take(codes) if len(uniques) else np.empty(len(series), dtype=object)
+
+    # Missing values (None, NaN, pd.NA) are kept apart by factorize
+    missing = codes < 0
+    if missing.any():
+        result[missing] = [memo_func(value) for value in series[missing].to_numpy(dtype=object)]
+
+    return pd.Series(result, index=series.index, name=series.name, dtype=object).infer_objects()
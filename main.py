@@ -9,7 +9,9 @@ This script runs the complete ETL (Extract, Transform, Load) pipeline:
 
 import os
 import sys
+import argparse
 import logging  
+import pandas as pd
 from datetime import datetime 
 
 # Add project root to Python path
@@ -27,44 +29,127 @@ from config.config import (
     DATA_DIR,
     RAW_SUBDIR,
     RAW_FILENAME,
-    LOG_DIR,
-    LOG_FILENAME_PREFIX,
     LOG_FORMAT,
     LOG_LEVEL,
     MB_CONVERSION,
     SUMMARY_SEPARATOR,
     SUMMARY_SUBSEPARATOR,
     DEFAULT_OUTPUT_FILENAME,
-    DEFAULT_OUTPUT_FORMATS,
-    LOG_FILENAME_PREFIX   
+    STREAM_CHUNKSIZE,
+    STREAM_OUTPUT_FORMATS,
+    CSV_ENGINE,
+    COLUMNS_TO_DROP,
+    RUN_CACHE_ENABLED,
+    TRANSFORM_INCREMENTAL,
+    TRANSFORM_STRICT,
+    QUARANTINE_FILENAME,
+    PROFILE_TRACEMALLOC,
+    RUN_METRICS_FILENAME,
+    TRANSFORM_WORKERS,
+    RAW_BATCH_GLOB,
+    BATCH_WORKERS,
+    BATCH_OUTPUT_TARGETS,
+    BATCH_PARTITION_COLS
 )
 
-from eti_pipeline.src.extract.extract import load_raw_data
-from eti_pipeline.src.transform.transform import transform_fifa_data
-from eti_pipeline.src.load.save_data import save_cleaned_data, save_summary_statistics 
+from eti_pipeline.src.extract.extract import default_raw_path, load_raw_data, load_raw_data_chunks
+from eti_pipeline.src.transform.transform import transform_fifa_data, quarantine_table
+from eti_pipeline.src.transform.incremental import transform_incremental
+from eti_pipeline.src.transform.batch import raw_batch_files, transform_batch
+from eti_pipeline.src.utilis.cache_utilis import (
+    run_cache_key,
+    pipeline_fingerprint,
+    load_cached_run,
+    load_cached_quarantine,
+    store_cached_run,
+    record_cached_outputs,
+    cached_outputs_current
+)
+from eti_pipeline.src.utilis.profile_utilis import profiling, profile_stage
+from eti_pipeline.src.utilis.file_utilis import path_size
+from eti_pipeline.src.load.sql_writer import display_target
+from eti_pipeline.src.load.save_data import (
+    SavedFiles,
+    default_output_dir,
+    resolve_output_targets,
+    save_targets,
+    save_output_targets,
+    plan_output_targets,
+    save_cleaned_chunks,
+    save_summary_statistics,
+    save_quarantine
+)
 
 
-#logging configurations
+logger = logging.getLogger(__name__)
 
-# Setup logging with file handler
-os.makedirs(LOG_DIR, exist_ok=True)
-timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-log_filename = f'{LOG_DIR}/{LOG_FILENAME_PREFIX}_{timestamp}.log'
 
-# Setup logger (will configure with both file and console output)
-import logging
-logger = setup_logging(__name__)
+def init_logging():
+    """Configure console and file logging for a pipeline run
 
-# Add file handler to the existing logger
-file_handler = logging.FileHandler(log_filename)
-file_handler.setLevel(logging.INFO)
-file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-logger.addHandler(file_handler)
+    Called by the command line entry point only, so importing main (tests,
+    benchmarks, worker processes) creates no log file. Every run appends to
+    the same rotating logs/pipeline.log, see setup_logging.
+    """
+    setup_logging(__name__)
 
 
-def run_pipeline():
+def run_pipeline(stream=False, chunksize=STREAM_CHUNKSIZE, workers=TRANSFORM_WORKERS, dry_run=False,
+                 engine=CSV_ENGINE, use_cache=RUN_CACHE_ENABLED, incremental=TRANSFORM_INCREMENTAL,
+                 profile_memory=PROFILE_TRACEMALLOC, raw_path=None, output_dir=None, targets=None,
+                 raw_glob=None):
     """
     RUN the complete Fifa data pipeline with comprehensive eerror handling
+
+    Args:
+        stream (bool): Process the raw CSV chunk by chunk instead of loading
+            it whole, see run_streaming_pipeline
+        chunksize (int): Rows per chunk in streaming mode
+        workers (int): Processes used by the Transform step
+        dry_run (bool): Only report the planned writes, see run_dry_run
+        engine (str): CSV parser for the Extract step, 'c' or 'pyarrow'
+        use_cache (bool): Skip Extract and Transform when the raw file, the
+            code and the settings match a cached run (data/cache/)
+        incremental (bool): Only transform players that are new or changed
+            since the previous run, see transform_incremental
+        profile_memory (bool): Trace Python allocations per stage with
+            tracemalloc (slower), see report_run_metrics
+        raw_path (str): Raw CSV, defaults to data/raw/RAW_FILENAME
+        output_dir (str): Output directory, defaults to data/processed/
+        targets (list): Output targets, defaults to OUTPUT_TARGETS
+        raw_glob (str): Process every raw file matching this glob in
+            data/raw/ instead of raw_path, see run_multi_file_pipeline
+    """
+
+    if dry_run:
+        return run_dry_run(targets=targets, raw_path=raw_path, output_dir=output_dir)
+
+    if stream:
+        if targets is not None or raw_glob is not None:
+            raise ValueError("Streaming writes STREAM_OUTPUT_FORMATS from a single raw file, "
+                             "it cannot be combined with targets or raw_glob")
+        return run_streaming_pipeline(chunksize=chunksize, workers=workers, raw_path=raw_path, output_dir=output_dir)
+
+    if raw_glob is not None:
+        return run_multi_file_pipeline(raw_glob, engine=engine, output_dir=output_dir, targets=targets)
+
+    with profiling(trace_memory=profile_memory) as profiler:
+        cleaned_data = run_batch_pipeline(engine=engine, workers=workers, use_cache=use_cache,
+                                          incremental=incremental, raw_path=raw_path,
+                                          output_dir=output_dir, targets=targets)
+
+    if cleaned_data is not None:
+        report_run_metrics(profiler, output_dir=output_dir, rows=len(cleaned_data), columns=cleaned_data.shape[1])
+    return cleaned_data
+
+
+def run_batch_pipeline(engine=CSV_ENGINE, workers=TRANSFORM_WORKERS, use_cache=RUN_CACHE_ENABLED,
+                       incremental=TRANSFORM_INCREMENTAL, raw_path=None, output_dir=None, targets=None):
+    """
+    RUN Extract, Transform and Load on the whole raw file, see run_pipeline
+
+    Returns:
+        pd.DataFrame: The cleaned data, or None on failure
     """
 
     print('=' * 60)
@@ -75,59 +160,45 @@ def run_pipeline():
 
     try:
         #====================================================================
-        #   STEP 1: EXTRACT - Load Raw Data
+        #   STEP 1-2: EXTRACT + TRANSFORM (or reuse a cached run)
         #====================================================================
-        
-        print("\n STEP 1: EXTRACT")
-        print("=" * 60)
-        
-        try:
-            raw_data = load_raw_data()
 
-        except FileNotFoundError as e:
-            print("\n" + "=" * 60)
-            print("❌ PIPELINE FAILED - INPUT FILE NOT FOUND")
-            print("=" * 60)
-            logging.critical(str(e))
-            print("\n💡 Solution: Ensure CSV file exists in data/raw/ folder")
-            return None
-
-        except pd.errors.EmptyDataError as e:
-            print("\n" + "=" * 60)
-            print("❌ PIPELINE FAILED - INPUT FILE IS EMPTY")
+        cache_key = cached_run = quarantine = None
+        if raw_path is None:
+            raw_path = default_raw_path()
+
+        if use_cache and os.path.exists(raw_path):
+            with profile_stage('run_cache'):
+                cache_key = run_cache_key(raw_path, engine=engine)
+                cached_run = load_cached_run(cache_key)
+                if cached_run is not None and TRANSFORM_STRICT:
+                    quarantine = load_cached_quarantine(cache_key)
+                    if quarantine is None:
+                        logging.info("🗃️  Cached run has no quarantine, running Extract and Transform")
+                        cached_run = None
+
+        if cached_run is not None:
+            cleaned_data, cache_metadata = cached_run
+            raw_shape = tuple(cache_metadata['raw_shape'])
+            print("\n STEP 1-2: EXTRACT + TRANSFORM")
             print("=" * 60)
-            logging.critical(str(e))
-            return None
-            
-        except pd.errors.ParserError as e:
-            print("\n" + "=" * 60)
-            print("❌ PIPELINE FAILED - CSV FILE IS CORRUPTED")
-            print("=" * 60)
-            logging.critical(str(e))
-            print("\n💡 Solution: Check that file is a valid CSV")
-            return None
-
-        #====================================================================
-        #   STEP 2: TRANSFORM - Clean the Data
-        #====================================================================
-
-
-        print("\n STEP 2: TRANSFORM")
-        print("=" * 60)
-        
-        try:
-            cleaned_data = transform_fifa_data(raw_data)
-            print(f"✅ Transform complete!")
+            print(f"✅ Raw data unchanged, reusing cached cleaned data")
             print(f" 📊 Cleaned data: {cleaned_data.shape[0]:,} rows × {cleaned_data.shape[1]} columns")
-            
-        except KeyError as e:
-            print("\n" + "=" * 60)
-            print("❌ PIPELINE FAILED - MISSING REQUIRED COLUMN")
-            print("=" * 60)
-            logging.critical(f"Missing column in CSV: {e}")
-            print(f"\n💡 Required column not found: {e}")
-            print("   Check that CSV has all expected columns")
-            return None
+        else:
+            result = extract_and_transform(engine=engine, workers=workers, incremental=incremental,
+                                           raw_path=raw_path, output_dir=output_dir)
+            if result is None:
+                return None
+            cleaned_data, raw_shape, quarantine = result
+            if cache_key is not None:
+                store_cached_run(cache_key, cleaned_data, raw_shape, quarantine=quarantine)
+
+        if quarantine is not None:
+            # Written on cache hits too, so the file always belongs to this output
+            quarantine_path = save_quarantine(
+                quarantine, os.path.join(output_dir or default_output_dir(), QUARANTINE_FILENAME)
+            )
+            print(f" 🚧 Quarantined values: {len(quarantine):,} -> {quarantine_path}")
 
         #===================================================================
         #  STEP 3: LOAD - Save cleaned data
@@ -138,8 +209,22 @@ def run_pipeline():
         print("=" * 60)
         
         try:
-            saved_files = save_cleaned_data(cleaned_data, base_filename='fifa21_cleaned')
-            print(f"✅ Load Complete!")
+            targets = resolve_output_targets(targets, output_dir)
+            if cached_run is not None and cached_outputs_current(cache_metadata, targets):
+                # Every output is already the one this cache entry produced
+                saved_files = SavedFiles({name: filepath for name, (_, filepath) in targets.items()})
+                saved_files.timings.update({name: 0.0 for name in saved_files})
+                print(f"✅ Output files are up to date, nothing to write")
+            else:
+                # Every target in OUTPUT_TARGETS is written exactly once
+                with profile_stage('load'):
+                    saved_files = save_targets(cleaned_data, targets)
+                if load_failed(saved_files):
+                    return None
+                if cache_key is not None and not saved_files.errors:
+                    record_cached_outputs(cache_key, saved_files)
+                print(f"✅ Load Complete!" if not saved_files.errors else
+                      f"⚠️  Load finished, {len(saved_files.errors)} output(s) failed")
             
         except PermissionError as e:
             print("\n" + "=" * 60)
@@ -149,31 +234,20 @@ def run_pipeline():
             print("\n💡 Solution: Check that data/processed/ folder is writable")
             return None
 
-        # Save in multiple formats
-
-        saved_files =save_cleaned_data(cleaned_data, base_filename = DEFAULT_OUTPUT_FILENAME, formats = DEFAULT_OUTPUT_FORMATS)
-
-        #Save summary statistics
-
         logging.info(f" Load Complete!")
 
         #==================================================================
         # PIPELINE SUMMARY
         #==================================================================
-        print("\n" + "-" * 60)
-        print("✅ PIPELINE COMPLETED SUCCESSFULLY")
-        print("=" * 60)
+        print_completion(saved_files)
 
         print("\n📊 Summary:")
-        print(f"  • Input rows: {raw_data.shape[0]:,}")
+        print(f"  • Input rows: {raw_shape[0]:,}")
         print(f"  • Output rows: {cleaned_data.shape[0]:,}")
-        print(f"  • Columns removed: {raw_data.shape[1] - cleaned_data.shape[1]}")
+        print(f"  • Columns removed: {raw_shape[1] - cleaned_data.shape[1]}")
         print(f"  • Files created: {len(saved_files)}")
 
-        print("\n📁 Output Files:")
-        for fmt, path in saved_files.items():
-            file_size = os.path.getsize(path) / (1024*1024)
-            print(f"  • {fmt.upper()}: {file_size:.2f} MB")
+        print_saved_files(saved_files)
 
         print("\n" + "-" * 60)
         print(f"Finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -198,9 +272,439 @@ def run_pipeline():
         print("\n💡 Please check the log file for details")
         raise  # Re-raise for debugging
 
+
+def load_failed(saved_files):
+    """Report a Load step in which no output target could be written
+
+    Returns:
+        bool: True if every target failed, which fails the run
+    """
+    if saved_files or not saved_files.errors:
+        return False
+    print("\n" + "=" * 60)
+    print("❌ PIPELINE FAILED - NO OUTPUT FILE COULD BE WRITTEN")
+    print("=" * 60)
+    for name, error in saved_files.errors.items():
+        print(f"  ❌ {name.upper()}: {error}")
+    logging.critical(f"Every output target failed: {', '.join(saved_files.errors)}")
+    return True
+
+
+def print_completion(saved_files):
+    """Print the end of run banner, flagging the targets that were not written"""
+    print("\n" + "-" * 60)
+    if saved_files.errors:
+        print(f"⚠️  PIPELINE COMPLETED WITH ERRORS - {len(saved_files.errors)} output(s) not written")
+    else:
+        print("✅ PIPELINE COMPLETED SUCCESSFULLY")
+    print("=" * 60)
+
+
+def print_saved_files(saved_files):
+    """Print the size, write time and stats of every output of a run"""
+    print("\n📁 Output Files:")
+    for name, path in saved_files.items():
+        if not os.path.exists(path):
+            print(f"  • {name.upper()}: {display_target(path)} ({saved_files.timings[name]:.2f}s)")
+            continue
+        file_size = path_size(path) / MB_CONVERSION
+        print(f"  • {name.upper()}: {file_size:.2f} MB ({saved_files.timings[name]:.2f}s)")
+    for name, stats in saved_files.compression.items():
+        print(f"  🗜️  {name.upper()}: {stats['codec']} ratio {stats['ratio']:.1f}x, "
+              f"{stats['mb_per_second']:.1f} MB/s uncompressed")
+    for name, rows in saved_files.sql.items():
+        print(f"  🗄️  {name.upper()}: {rows['inserted']:,} inserted, {rows['updated']:,} updated, "
+              f"{rows['unchanged']:,} unchanged")
+    for name, error in saved_files.errors.items():
+        print(f"  ❌ {name.upper()}: {error}")
+
+
+def run_multi_file_pipeline(raw_glob, engine=CSV_ENGINE, workers=BATCH_WORKERS, raw_dir=None,
+                            output_dir=None, targets=None):
+    """
+    RUN Extract and Transform on every raw file matching raw_glob, one worker
+    process per file, then Load the combined rows once
+
+    Rows are tagged with their source file and season. The Parquet output is
+    partitioned by BATCH_PARTITION_COLS (one directory per season).
+
+    Args:
+        raw_glob (str): Glob relative to raw_dir, e.g. '*.csv'
+        raw_dir (str): Defaults to data/raw/
+        targets (list): Output targets, defaults to BATCH_OUTPUT_TARGETS
+
+    Returns:
+        pd.DataFrame: The combined cleaned data, or None on failure
+    """
+
+    print('=' * 60)
+    print(" FIFA Data Pipeline (multi-file)")
+    print("=" * 60)
+    print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 60)
+
+    file_paths = raw_batch_files(raw_glob, raw_dir)
+    if not file_paths:
+        print("\n" + "=" * 60)
+        print("❌ PIPELINE FAILED - NO INPUT FILES")
+        print("=" * 60)
+        logging.critical(f"No raw files match {raw_glob}")
+        print("\n💡 Solution: Put the season CSV files in the data/raw/ folder")
+        return None
+
+    print("\n STEP 1-2: EXTRACT + TRANSFORM")
+    print("=" * 60)
+
+    with profile_stage('extract_transform'):
+        quarantine = []
+        cleaned_data, report = transform_batch(file_paths, engine=engine, workers=workers, quarantine=quarantine)
+
+    for entry in report:
+        if entry['error'] is None:
+            print(f"  • {entry['file']} ({entry['season']}): {entry['rows']:,} rows")
+        else:
+            print(f"  ❌ {entry['file']}: {entry['error']}")
+
+    if cleaned_data is None:
+        print("\n" + "=" * 60)
+        print("❌ PIPELINE FAILED - NO FILE COULD BE PROCESSED")
+        print("=" * 60)
+        logging.critical("Every raw file failed to extract or transform")
+        return None
+    print(f" 📊 Cleaned data: {cleaned_data.shape[0]:,} rows × {cleaned_data.shape[1]} columns")
+
+    if TRANSFORM_STRICT:
+        quarantine = quarantine_table(quarantine)
+        quarantine_path = save_quarantine(
+            quarantine, os.path.join(output_dir or default_output_dir(), QUARANTINE_FILENAME)
+        )
+        print(f" 🚧 Quarantined values: {len(quarantine):,} -> {quarantine_path}")
+
+    print("\n STEP 3: LOAD")
+    print("=" * 60)
+
+    try:
+        with profile_stage('load'):
+            saved_files = save_output_targets(cleaned_data, targets if targets is not None else BATCH_OUTPUT_TARGETS,
+                                              output_dir, partition_cols=BATCH_PARTITION_COLS)
+    except PermissionError as e:
+        print("\n" + "=" * 60)
+        print("❌ PIPELINE FAILED - CANNOT WRITE OUTPUT FILES")
+        print("=" * 60)
+        logging.critical(f"Permission denied: {e}")
+        return None
+
+    if load_failed(saved_files):
+        return None
+    print_completion(saved_files)
+
+    print("\n📊 Summary:")
+    print(f"  • Files processed: {len(report) - sum(entry['error'] is not None for entry in report)}/{len(report)}")
+    print(f"  • Output rows: {cleaned_data.shape[0]:,}")
+    print(f"  • Files created: {len(saved_files)}")
+
+    print_saved_files(saved_files)
+
+    print("\n" + "-" * 60)
+    print(f"Finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("-" * 60)
+
+    return cleaned_data
+
+
+def extract_and_transform(engine=CSV_ENGINE, workers=TRANSFORM_WORKERS, incremental=TRANSFORM_INCREMENTAL,
+                          raw_path=None, output_dir=None):
+    """
+    Run the Extract and Transform steps
+
+    Returns:
+        tuple: (cleaned_data, raw_shape, quarantine), or None on failure -
+        quarantine is the table of rejected values with TRANSFORM_STRICT
+        (see quarantine_table), None otherwise
+    """
+
+    #====================================================================
+    #   STEP 1: EXTRACT - Load Raw Data
+    #====================================================================
+    
+    print("\n STEP 1: EXTRACT")
+    print("=" * 60)
+    
+    try:
+        with profile_stage('extract'):
+            raw_data = load_raw_data(raw_path, engine=engine)
+
+    except FileNotFoundError as e:
+        print("\n" + "=" * 60)
+        print("❌ PIPELINE FAILED - INPUT FILE NOT FOUND")
+        print("=" * 60)
+        logging.critical(str(e))
+        print("\n💡 Solution: Ensure CSV file exists in data/raw/ folder")
+        return None
+
+    except pd.errors.EmptyDataError as e:
+        print("\n" + "=" * 60)
+        print("❌ PIPELINE FAILED - INPUT FILE IS EMPTY")
+        print("=" * 60)
+        logging.critical(str(e))
+        return None
+        
+    except pd.errors.ParserError as e:
+        print("\n" + "=" * 60)
+        print("❌ PIPELINE FAILED - CSV FILE IS CORRUPTED")
+        print("=" * 60)
+        logging.critical(str(e))
+        print("\n💡 Solution: Check that file is a valid CSV")
+        return None
+
+    #====================================================================
+    #   STEP 2: TRANSFORM - Clean the Data
+    #====================================================================
+
+
+    print("\n STEP 2: TRANSFORM")
+    print("=" * 60)
+    
+    try:
+        # transform_fifa_data never modifies raw_data and shares its untouched columns.
+        # Columns skipped by the typed read still count as removed.
+        raw_shape = (raw_data.shape[0], raw_data.shape[1] + len(set(COLUMNS_TO_DROP) - set(raw_data.columns)))
+        quarantine = []
+        if incremental:
+            with profile_stage('transform'):
+                cleaned_data, counts = transform_incremental(
+                    raw_data, workers=workers, fingerprint=pipeline_fingerprint(engine=engine),
+                    quarantine=quarantine
+                )
+            print(f" 🔁 Players: {counts['new']:,} new, {counts['changed']:,} changed, "
+                  f"{counts['unchanged']:,} unchanged, {counts['deleted']:,} deleted")
+        else:
+            with profile_stage('transform'):
+                cleaned_data = transform_fifa_data(raw_data, workers=workers, quarantine=quarantine)
+        del raw_data
+        print(f"✅ Transform complete!")
+        print(f" 📊 Cleaned data: {cleaned_data.shape[0]:,} rows × {cleaned_data.shape[1]} columns")
+        quarantine = quarantine_table(quarantine) if TRANSFORM_STRICT else None
+        
+    except KeyError as e:
+        print("\n" + "=" * 60)
+        print("❌ PIPELINE FAILED - MISSING REQUIRED COLUMN")
+        print("=" * 60)
+        logging.critical(f"Missing column in CSV: {e}")
+        print(f"\n💡 Required column not found: {e}")
+        print("   Check that CSV has all expected columns")
+        return None
+
+    return cleaned_data, raw_shape, quarantine
+
+
+def report_run_metrics(profiler, output_dir=None, **extra):
+    """
+    Print the stage profile of a run and save it as run_metrics.json next
+    to the output files
+
+    Returns:
+        str: Path of the metrics file
+    """
+
+    print("\n⏱️  Stage profile:")
+    print(profiler.summary_table())
+
+    metrics_path = os.path.join(output_dir or default_output_dir(), RUN_METRICS_FILENAME)
+    profiler.write_metrics(metrics_path, **extra)
+    print(f"📈 Metrics saved: {metrics_path}")
+    return metrics_path
+
+
+def run_dry_run(targets=None, raw_path=None, output_dir=None):
+    """
+    Report the writes run_pipeline would make without reading or writing data
+
+    Output sizes and durations are estimated from the size of the raw CSV,
+    see OUTPUT_COST_ESTIMATES.
+
+    Args:
+        targets (list): Output targets, defaults to OUTPUT_TARGETS
+        raw_path (str): Raw CSV, defaults to data/raw/RAW_FILENAME
+        output_dir (str): Output directory, defaults to data/processed/
+
+    Returns:
+        list: The planned writes, see plan_output_targets
+    """
+
+    if raw_path is None:
+        raw_path = default_raw_path()
+    input_bytes = os.path.getsize(raw_path) if os.path.exists(raw_path) else 0
+
+    print('=' * 60)
+    print(" FIFA 21 Data Pipeline (dry run)")
+    print("=" * 60)
+    print(f"Input: {raw_path} ({input_bytes / MB_CONVERSION:.2f} MB)")
+    if not input_bytes:
+        print("⚠️  Input file not found or empty, estimates are zero")
+    print("=" * 60)
+
+    plan = plan_output_targets(input_bytes, targets, output_dir)
+
+    print("\n📁 Planned writes:")
+    for write in plan:
+        seconds = write['estimated_seconds']
+        duration = f"~{seconds:.2f}s" if seconds is not None else "unknown"
+        print(f"  • {write['name'].upper()}: {write['path']}")
+        print(f"      ~{write['estimated_bytes'] / MB_CONVERSION:.2f} MB, {duration}")
+
+    known = [write['estimated_seconds'] for write in plan if write['estimated_seconds'] is not None]
+    print("\n📊 Estimated cost:")
+    print(f"  • Files: {len(plan)}")
+    print(f"  • Output size: ~{sum(write['estimated_bytes'] for write in plan) / MB_CONVERSION:.2f} MB")
+    print(f"  • Load time: ~{sum(known):.2f}s serial, ~{max(known, default=0):.2f}s parallel")
+
+    return plan
+
+
+def run_streaming_pipeline(chunksize=STREAM_CHUNKSIZE, formats=None, workers=TRANSFORM_WORKERS, raw_path=None,
+                           output_dir=None):
+    """
+    RUN the Fifa data pipeline chunk by chunk
+
+    Each chunk of raw rows is read, transformed and appended to every
+    streamable output before the next one is read, so memory is bounded by
+    the chunk size rather than the file size. With TRANSFORM_STRICT the
+    rejected values of every chunk are saved to QUARANTINE_FILENAME in
+    output_dir.
+
+    Args:
+        chunksize (int): Rows per chunk
+        formats (list): Streamable formats, defaults to STREAM_OUTPUT_FORMATS
+        workers (int): Processes transforming each chunk
+        raw_path (str): Raw CSV, defaults to data/raw/RAW_FILENAME
+        output_dir (str): Output directory, defaults to data/processed/
+
+    Returns:
+        dict: format -> path of the files written, or None on failure
+    """
+
+    print('=' * 60)
+    print(" FIFA 21 Data Pipeline (streaming)")
+    print("=" * 60)
+    print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Chunk size: {chunksize:,} rows")
+    print("=" * 60)
+
+    counts = {'chunks': 0, 'input_rows': 0, 'output_rows': 0}
+    quarantine = []
+
+    def cleaned_chunks():
+        for raw_chunk in load_raw_data_chunks(raw_path, chunksize=chunksize):
+            counts['chunks'] += 1
+            counts['input_rows'] += len(raw_chunk)
+            cleaned_chunk = transform_fifa_data(raw_chunk, workers=workers, quarantine=quarantine)
+            counts['output_rows'] += len(cleaned_chunk)
+            yield cleaned_chunk
+
+    print("\n STEP 1-3: EXTRACT → TRANSFORM → LOAD")
+    print("=" * 60)
+
+    try:
+        saved_files = save_cleaned_chunks(
+            cleaned_chunks(),
+            base_filename=DEFAULT_OUTPUT_FILENAME,
+            formats=formats if formats is not None else STREAM_OUTPUT_FORMATS,
+            output_dir=output_dir
+        )
+
+    except FileNotFoundError as e:
+        print("\n" + "=" * 60)
+        print("❌ PIPELINE FAILED - INPUT FILE NOT FOUND")
+        print("=" * 60)
+        logging.critical(str(e))
+        print("\n💡 Solution: Ensure CSV file exists in data/raw/ folder")
+        return None
+
+    except (pd.errors.EmptyDataError, pd.errors.ParserError) as e:
+        print("\n" + "=" * 60)
+        print("❌ PIPELINE FAILED - INPUT FILE IS EMPTY OR CORRUPTED")
+        print("=" * 60)
+        logging.critical(str(e))
+        return None
+
+    except KeyError as e:
+        print("\n" + "=" * 60)
+        print("❌ PIPELINE FAILED - MISSING REQUIRED COLUMN")
+        print("=" * 60)
+        logging.critical(f"Missing column in CSV: {e}")
+        return None
+
+    except PermissionError as e:
+        print("\n" + "=" * 60)
+        print("❌ PIPELINE FAILED - CANNOT WRITE OUTPUT FILES")
+        print("=" * 60)
+        logging.critical(f"Permission denied: {e}")
+        return None
+
+    if TRANSFORM_STRICT:
+        quarantine = quarantine_table(quarantine)
+        quarantine_path = save_quarantine(
+            quarantine, os.path.join(output_dir or default_output_dir(), QUARANTINE_FILENAME)
+        )
+        print(f" 🚧 Quarantined values: {len(quarantine):,} -> {quarantine_path}")
+
+    print("\n" + "-" * 60)
+    print("✅ PIPELINE COMPLETED SUCCESSFULLY")
+    print("=" * 60)
+
+    print("\n📊 Summary:")
+    print(f"  • Chunks processed: {counts['chunks']:,}")
+    print(f"  • Input rows: {counts['input_rows']:,}")
+    print(f"  • Output rows: {counts['output_rows']:,}")
+    print(f"  • Files created: {len(saved_files)}")
+
+    print("\n📁 Output Files:")
+    for fmt, path in saved_files.items():
+        file_size = path_size(path) / MB_CONVERSION
+        print(f"  • {fmt.upper()}: {file_size:.2f} MB")
+
+    print("\n" + "-" * 60)
+    print(f"Finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("-" * 60)
+
+    return saved_files
+
+
+def parse_args(argv=None):
+    """Parse the command line options of main.py"""
+    parser = argparse.ArgumentParser(description="FIFA 21 ETL pipeline")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--stream', action='store_true',
+                      help="process the raw CSV chunk by chunk with bounded memory")
+    parser.add_argument('--chunksize', type=int, default=STREAM_CHUNKSIZE,
+                        help=f"rows per chunk in streaming mode (default: {STREAM_CHUNKSIZE:,})")
+    parser.add_argument('--workers', type=int, default=TRANSFORM_WORKERS,
+                        help=f"processes used by the Transform step (default: {TRANSFORM_WORKERS})")
+    parser.add_argument('--engine', choices=['c', 'pyarrow'], default=CSV_ENGINE,
+                        help=f"CSV parser for the Extract step (default: {CSV_ENGINE})")
+    parser.add_argument('--incremental', action='store_true',
+                        help="only transform players that are new or changed since the previous run")
+    parser.add_argument('--profile-memory', action='store_true',
+                        help="trace Python allocations per stage with tracemalloc (slower)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="always run Extract and Transform, ignoring data/cache/")
+    mode.add_argument('--files', metavar='GLOB', nargs='?', const=RAW_BATCH_GLOB, default=None,
+                      help=f"process every raw file in data/raw/ matching GLOB (default: {RAW_BATCH_GLOB}) in parallel "
+                           "and combine them, tagged by source file and season")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="report the planned writes and their estimated cost without running")
+    return parser.parse_args(argv)
+
+
 #Run the pipeline when the script is executed
 
 if __name__ == "__main__":
-    run_pipeline()
+    args = parse_args()
+    init_logging()
+    run_pipeline(stream=args.stream, chunksize=args.chunksize, workers=args.workers, dry_run=args.dry_run,
+                 engine=args.engine, use_cache=RUN_CACHE_ENABLED and not args.no_cache,
+                 incremental=TRANSFORM_INCREMENTAL or args.incremental,
+                 profile_memory=PROFILE_TRACEMALLOC or args.profile_memory, raw_glob=args.files)
 
     
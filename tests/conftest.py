@@ -0,0 +1,83 @@
+import sys
+import pytest
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+RAW_COLUMNS = [
+    'ID', 'Name', 'LongName', 'photoUrl', 'playerUrl', 'Nationality', 'Age', '↓OVA', 'POT',
+    'Club', 'Contract', 'Positions', 'Height', 'Weight', 'Preferred Foot', 'BOV',
+    'Best Position', 'Joined', 'Loan Date End', 'Value', 'Wage', 'Release Clause',
+    'Attacking', 'Crossing', 'Finishing', 'Heading Accuracy', 'Short Passing', 'Volleys',
+    'Skill', 'Dribbling', 'Curve', 'FK Accuracy', 'Long Passing', 'Ball Control',
+    'Movement', 'Acceleration', 'Sprint Speed', 'Agility', 'Reactions', 'Balance', 'Power',
+    'Shot Power', 'Jumping', 'Stamina', 'Strength', 'Long Shots', 'Mentality', 'Aggression',
+    'Interceptions', 'Positioning', 'Vision', 'Penalties', 'Composure', 'Defending',
+    'Marking', 'Standing Tackle', 'Sliding Tackle', 'Goalkeeping', 'GK Diving',
+    'GK Handling', 'GK Kicking', 'GK Positioning', 'GK Reflexes', 'Total Stats',
+    'Base Stats', 'W/F', 'SM', 'A/W', 'D/W', 'IR', 'PAC', 'SHO', 'PAS', 'DRI', 'DEF', 'PHY',
+    'Hits',
+]
+
+
+def make_raw_fifa_data(rows=12, malformed=True):
+    """Build a small frame shaped like 'fifa21 raw data v2.csv'
+
+    With malformed=False every converted column only holds valid values, so
+    the cleaned columns come out numeric (as with the real dataset).
+    """
+    data = {column: np.arange(rows) % 90 + 10 for column in RAW_COLUMNS}
+    text = lambda prefix: [f"{prefix} {i}" for i in range(rows)]
+    pick = lambda values: [values[i % len(values)] for i in range(rows)]
+
+    data.update({
+        'ID': np.arange(rows) + 1000,
+        'Name': text('Player'),
+        'LongName': text('Long Player'),
+        'photoUrl': text('https://cdn.sofifa.com/players'),
+        'playerUrl': text('http://sofifa.com/player'),
+        'Nationality': pick(['Argentina', 'Portugal', 'Brazil', 'England']),
+        'Club': pick(['FC Barcelona', 'Juventus', 'Liverpool']),
+        'Contract': pick(['2004 ~ 2021', '2018 ~ 2022']),
+        'Positions': pick(['RW, ST, CF', 'ST, LW', 'GK']),
+        'Height': pick(['170cm', '187cm', "5'10\"", '', '226cm', 'CM180']),
+        'Weight': pick(['72kg', '83kg', '170lbs', '', '49kg']),
+        'Preferred Foot': pick(['Left', 'Right']),
+        'Best Position': pick(['RW', 'ST', 'GK', 'CAM']),
+        'Joined': pick(['Jul 1, 2004', 'Jul 10, 2018']),
+        'Loan Date End': pick([np.nan, np.nan, 'Jun 30, 2021']),
+        'Value': pick(['€103.5M', '€63M', '€120K', '€0', '€0K', 'N/A']),
+        'Wage': pick(['€560K', '€220K', '€500', '€K', '€€1K']),
+        'Release Clause': pick(['€138.4M', '€75.9M', '€71K', '€0', '€500M']),
+        'W/F': pick(['4 ★', '3 ★']),
+        'SM': pick(['4★', '5★']),
+        'A/W': pick(['Medium', 'High']),
+        'D/W': pick(['Low', 'Medium']),
+        'IR': pick(['5 ★', '1 ★']),
+        'Hits': pick(['771', '1.6K', np.nan, '562', 'K']),
+    })
+    if not malformed:
+        data.update({
+            'Height': pick(['170cm', '187cm', "5'10\""]),
+            'Weight': pick(['72kg', '83kg', '170lbs']),
+            'Value': pick(['€103.5M', '€63M', '€120K', '€0']),
+            'Wage': pick(['€560K', '€220K', '€500']),
+            'Release Clause': pick(['€138.4M', '€75.9M', '€71K', '€0']),
+            'Hits': pick(['771', '1.6K', np.nan, '562']),
+        })
+    return pd.DataFrame(data, columns=RAW_COLUMNS)
+
+
+@pytest.fixture
+def raw_fifa_data():
+    """Small raw FIFA frame covering valid, blank and malformed values"""
+    return make_raw_fifa_data()
+
+
+@pytest.fixture
+def clean_raw_fifa_data():
+    """Small raw FIFA frame whose converted columns are all valid"""
+    return make_raw_fifa_data(malformed=False)
@@ -0,0 +1,97 @@
+import sys
+import pytest
+import pandas as pd
+import pyarrow.parquet as pq
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.conftest import make_raw_fifa_data
+from eti_pipeline.src.extract.extract import load_raw_data
+from eti_pipeline.src.transform import batch, transform
+from eti_pipeline.src.transform.transform import transform_fifa_data, quarantine_table
+from eti_pipeline.src.transform.batch import raw_batch_files, season_of, transform_batch
+from main import run_multi_file_pipeline
+
+
+@pytest.fixture
+def raw_dir(tmp_path):
+    """A FIFA 20 and a FIFA 21 dump, the FIFA 20 one with older headers"""
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    make_raw_fifa_data(rows=12, malformed=False).to_csv(raw_dir / "fifa21 raw data v2.csv", index=False)
+    (make_raw_fifa_data(rows=8, malformed=False)
+        .rename(columns={'↓OVA': 'OVA', 'Wage': 'Wage(€)'})
+        .drop(columns=['Hits'])
+        .to_csv(raw_dir / "FIFA_20 players.csv", index=False))
+    return raw_dir
+
+
+class TestBatchIngestion:
+    """Multi-file, multi-season Extract + Transform"""
+
+    @pytest.fixture(autouse=True)
+    def column_maps(self, monkeypatch):
+        monkeypatch.setattr(batch, 'RAW_COLUMN_MAPS', {'fifa20': {'OVA': '↓OVA', 'Wage(€)': 'Wage'}})
+
+    def test_files_and_seasons(self, raw_dir):
+        files = raw_batch_files('*.csv', str(raw_dir))
+        assert [Path(path).name for path in files] == ["FIFA_20 players.csv", "fifa21 raw data v2.csv"]
+        assert [season_of(path) for path in files] == ['fifa20', 'fifa21']
+        assert season_of("players export.csv") == 'players export'
+
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_files_are_combined_and_tagged(self, raw_dir, workers):
+        cleaned, report = transform_batch(raw_batch_files('*.csv', str(raw_dir)), workers=workers)
+
+        assert [(entry['season'], entry['rows'], entry['error']) for entry in report] == [
+            ('fifa20', 8, None), ('fifa21', 12, None)]
+        assert cleaned['Season'].value_counts().to_dict() == {'fifa21': 12, 'fifa20': 8}
+        assert cleaned['Source File'].iloc[0] == "FIFA_20 players.csv"
+        assert cleaned.index.is_unique
+
+        fifa21 = cleaned[cleaned['Season'] == 'fifa21'].drop(columns=['Season', 'Source File']).reset_index(drop=True)
+        expected = transform_fifa_data(load_raw_data(str(raw_dir / "fifa21 raw data v2.csv")))
+        pd.testing.assert_frame_equal(fifa21, expected, check_dtype=False, check_categorical=False)
+
+    def test_column_map_renames_drifted_headers(self, raw_dir):
+        cleaned, _ = transform_batch([str(raw_dir / "FIFA_20 players.csv")], workers=1)
+
+        assert {'↓OVA', 'Wages(€K)'} <= set(cleaned.columns) and 'OVA' not in cleaned.columns
+        assert cleaned['↓OVA'].dtype == 'int8'
+        assert cleaned['Hits'].isna().all()
+
+    def test_rejects_are_collected_per_file(self, raw_dir, monkeypatch):
+        monkeypatch.setattr(transform, 'TRANSFORM_STRICT', True)
+        make_raw_fifa_data(rows=6).to_csv(raw_dir / "fifa21 raw data v2.csv", index=False)
+        quarantine = []
+        transform_batch(raw_batch_files('*.csv', str(raw_dir)), workers=1, quarantine=quarantine)
+
+        expected = []
+        transform_fifa_data(load_raw_data(str(raw_dir / "fifa21 raw data v2.csv")), strict=True, quarantine=expected)
+        table = quarantine_table(quarantine)
+        assert set(table['Source File']) == {"FIFA_20 players.csv", "fifa21 raw data v2.csv"}
+        fifa21 = table[table['Source File'] == "fifa21 raw data v2.csv"].drop(columns=['Source File'])
+        pd.testing.assert_frame_equal(fifa21.reset_index(drop=True), quarantine_table(expected))
+
+    def test_unreadable_file_is_reported(self, raw_dir):
+        (raw_dir / "fifa19 broken.csv").write_text("", encoding='utf-8')
+        cleaned, report = transform_batch(raw_batch_files('*.csv', str(raw_dir)), workers=1)
+
+        errors = {entry['file']: entry['error'] for entry in report}
+        assert len(cleaned) == 20
+        assert 'EmptyDataError' in errors["fifa19 broken.csv"] and errors["fifa21 raw data v2.csv"] is None
+
+    def test_output_is_partitioned_by_season(self, raw_dir, tmp_path):
+        output_dir = tmp_path / "processed"
+        targets = [{'format': 'parquet', 'base_filename': 'batch'}, {'format': 'csv', 'base_filename': 'batch'}]
+
+        cleaned = run_multi_file_pipeline('*.csv', workers=1, raw_dir=str(raw_dir),
+                                          output_dir=str(output_dir), targets=targets)
+
+        partitions = sorted(path.name for path in (output_dir / "batch.parquet").iterdir())
+        assert partitions == ['Season=fifa20', 'Season=fifa21']
+        fifa20 = pq.read_table(output_dir / "batch.parquet", filters=[('Season', '=', 'fifa20')])
+        assert fifa20.num_rows == 8
+        assert len(pd.read_csv(output_dir / "batch.csv")) == len(cleaned) == 20
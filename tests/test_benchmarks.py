@@ -0,0 +1,52 @@
+import sys
+import json
+import pandas as pd
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.generate_data import RAW_COLUMNS, make_raw_fifa_rows, write_raw_csv
+from benchmarks.run_benchmarks import run_benchmarks, write_results, bench_startup
+from benchmarks.compare import compare_results
+from eti_pipeline.src.extract.extract import load_raw_data
+from eti_pipeline.src.transform.transform import transform_fifa_data
+
+
+class TestBenchmarks:
+    """Synthetic data generator and benchmark runner"""
+
+    def test_generated_rows_convert_to_numbers(self, tmp_path):
+        raw_path = write_raw_csv(str(tmp_path / "raw.csv"), 500, chunksize=200)
+        raw_data = load_raw_data(raw_path)
+
+        assert list(pd.read_csv(raw_path, nrows=0).columns) == RAW_COLUMNS
+        assert raw_data['ID'].is_unique and len(raw_data) == 500
+
+        cleaned = transform_fifa_data(raw_data)
+        for column in ['Value', 'Wages(€K)', 'Release Clause', 'Height(cm)', 'Weight(KG)', 'Hits']:
+            assert pd.api.types.is_float_dtype(cleaned[column]), column
+        assert cleaned['Value'].notna().all()
+
+    def test_generator_is_deterministic(self):
+        pd.testing.assert_frame_equal(make_raw_fifa_rows(50, seed=3), make_raw_fifa_rows(50, seed=3))
+
+    def test_results_are_saved_and_compared(self, tmp_path):
+        records = run_benchmarks([200], suites=['converters', 'transform'])
+        filepath = write_results(records, str(tmp_path))
+
+        with open(filepath, encoding='utf-8') as file:
+            report = json.load(file)
+        assert {'commit', 'created_at', 'pandas', 'results'} <= report.keys()
+        assert {r['suite'] for r in report['results']} == {'converters', 'transform'}
+
+        baseline = {(r['suite'], r['name'], r['rows']): r for r in records}
+        slower = {key: {**r, 'seconds': r['seconds'] * 2} for key, r in baseline.items()}
+        comparison = compare_results(baseline, slower, threshold=0.5)
+        assert len(comparison) == len(records) and all(row['regression'] for row in comparison)
+
+    def test_startup_imports_no_heavy_optional_packages(self):
+        [record] = bench_startup(['main'], repeats=1)
+
+        assert record['name'] == 'import main' and record['seconds'] > 0
+        assert record['heavy_modules'] == []
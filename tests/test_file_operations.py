@@ -1,13 +1,23 @@
 import sys
 import pytest
 import os
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from eti_pipeline.src.utilis.file_utilis import load_csv_safe
+from eti_pipeline.src.extract import extract
+from eti_pipeline.src.extract.extract import load_raw_data, load_cleaned_data
+from eti_pipeline.src.extract.schema import RAW_SCHEMA
+from eti_pipeline.src.transform.transform import transform_fifa_data
+from eti_pipeline.src.load import stream_writers, save_data
+from eti_pipeline.src.load.save_data import save_cleaned_data
+from config.config import COLUMNS_TO_DROP
 
 class TestFileOperations:
     """Test file handling edge cases"""
@@ -68,4 +78,148 @@ class TestFileOperations:
         df = load_csv_safe(str(csv_with_spaces))
         
         assert isinstance(df, pd.DataFrame)
-        assert len(df) == 2
\ No newline at end of file
+        assert len(df) == 2
+
+class TestTypedExtraction:
+    """Schema-driven dtypes and usecols"""
+
+    def test_schema_sets_dtypes_and_skips_dropped_columns(self, raw_fifa_data, tmp_path):
+        raw_csv = tmp_path / "raw.csv"
+        raw_fifa_data.to_csv(raw_csv, index=False)
+
+        df = load_csv_safe(str(raw_csv), schema=RAW_SCHEMA)
+
+        assert not set(COLUMNS_TO_DROP) & set(df.columns)
+        assert df['ID'].dtype == 'int32'
+        assert df['Crossing'].dtype == 'int8'
+        assert df['Total Stats'].dtype == 'int16'
+        assert isinstance(df['Nationality'].dtype, pd.CategoricalDtype)
+
+    def test_values_outside_schema_fall_back_to_inferred_dtypes(self, raw_fifa_data, tmp_path):
+        raw_csv = tmp_path / "raw.csv"
+        raw_fifa_data.assign(Crossing=np.nan).to_csv(raw_csv, index=False)
+
+        df = load_csv_safe(str(raw_csv), schema=RAW_SCHEMA)
+
+        assert df['Crossing'].isna().all()
+        assert 'W/F' not in df.columns
+
+    def test_out_of_range_values_are_kept(self, raw_fifa_data, tmp_path, caplog):
+        raw_csv = tmp_path / "raw.csv"
+        raw_fifa_data.assign(Crossing=300, **{'Total Stats': 2400}).to_csv(raw_csv, index=False)
+
+        df = load_csv_safe(str(raw_csv), schema=RAW_SCHEMA)
+
+        assert (df['Crossing'] == 300).all() and (df['Total Stats'] == 2400).all()
+        assert df['Total Stats'].dtype == 'int16'
+        assert "'Crossing'" in caplog.text and df['Finishing'].dtype == 'int8'
+
+    def test_missing_values_use_nullable_dtypes(self, raw_fifa_data, tmp_path):
+        raw_csv = tmp_path / "raw.csv"
+        raw_fifa_data.assign(Crossing=[np.nan] + [55] * (len(raw_fifa_data) - 1)).to_csv(raw_csv, index=False)
+
+        df = load_csv_safe(str(raw_csv), schema=RAW_SCHEMA)
+
+        assert df['Crossing'].dtype == 'Int8' and df['Crossing'].isna().sum() == 1
+        assert df['Finishing'].dtype == 'int8'
+
+    def test_typed_pipeline_output_matches_untyped(self, raw_fifa_data, tmp_path):
+        raw_csv = tmp_path / "raw.csv"
+        raw_fifa_data.to_csv(raw_csv, index=False)
+
+        typed = transform_fifa_data(load_raw_data(str(raw_csv)))
+        untyped = transform_fifa_data(pd.read_csv(raw_csv, low_memory=False))
+
+        assert typed.to_csv(index=False) == untyped.to_csv(index=False)
+
+
+class TestPyArrowEngine:
+    """engine='pyarrow' extraction"""
+
+    def test_pyarrow_engine_matches_c_engine(self, raw_fifa_data, tmp_path):
+        raw_csv = tmp_path / "raw.csv"
+        raw_fifa_data.to_csv(raw_csv, index=False)
+
+        c_engine = load_raw_data(str(raw_csv), engine='c')
+        pyarrow_engine = load_raw_data(str(raw_csv), engine='pyarrow')
+
+        pd.testing.assert_frame_equal(pyarrow_engine, c_engine)
+
+    def test_engines_agree_on_values_outside_the_schema(self, raw_fifa_data, tmp_path):
+        raw_csv = tmp_path / "raw.csv"
+        malformed = raw_fifa_data.astype({'Crossing': float, 'Finishing': float, 'Volleys': float})
+        malformed.loc[0, 'Crossing'] = 55.5
+        malformed.loc[1, 'Finishing'] = 300
+        malformed.loc[2, 'Volleys'] = np.nan
+        malformed.to_csv(raw_csv, index=False)
+
+        c_engine = load_raw_data(str(raw_csv), engine='c')
+        pyarrow_engine = load_raw_data(str(raw_csv), engine='pyarrow')
+
+        pd.testing.assert_frame_equal(pyarrow_engine, c_engine)
+        assert c_engine.loc[0, 'Crossing'] == 55.5 and c_engine.loc[1, 'Finishing'] == 300
+        assert c_engine['Volleys'].dtype == 'Int8' and c_engine['Dribbling'].dtype == 'int8'
+
+    def test_arrow_dtypes_reach_the_parquet_file(self, clean_raw_fifa_data, tmp_path, monkeypatch):
+        monkeypatch.setattr(extract, 'CSV_ARROW_DTYPES', True)
+        raw_csv = tmp_path / "raw.csv"
+        clean_raw_fifa_data.to_csv(raw_csv, index=False)
+
+        raw_data = load_raw_data(str(raw_csv), engine='pyarrow')
+        cleaned = transform_fifa_data(raw_data)
+        saved_files = save_cleaned_data(cleaned, 'cleaned', ['csv', 'parquet'], str(tmp_path), parallel=False)
+
+        assert isinstance(raw_data['Name'].dtype, pd.ArrowDtype)
+        assert isinstance(cleaned['Name'].dtype, pd.ArrowDtype)
+        assert pq.read_schema(saved_files['parquet']).field('Name').type == pa.string()
+        expected = transform_fifa_data(load_raw_data(str(raw_csv), engine='c'))
+        assert Path(saved_files['csv']).read_text(encoding='utf-8') == expected.to_csv(index=False)
+
+
+class TestFeatherOutput:
+    """Feather (Arrow IPC) output and load_cleaned_data"""
+
+    @pytest.fixture
+    def cleaned(self, clean_raw_fifa_data):
+        # A shuffled, non-default index, as left by partitioned or incremental runs
+        return transform_fifa_data(clean_raw_fifa_data).sample(frac=1, random_state=0)
+
+    def test_round_trip_drops_any_index(self, cleaned, tmp_path):
+        saved_files = save_cleaned_data(cleaned, 'cleaned', ['feather'], str(tmp_path))
+
+        loaded = load_cleaned_data(saved_files['feather'])
+        pd.testing.assert_frame_equal(loaded, cleaned.reset_index(drop=True))
+
+    def test_uncompressed_file_is_memory_mapped(self, cleaned, tmp_path):
+        saved_files = save_cleaned_data(cleaned, 'cleaned', ['feather'], str(tmp_path))
+
+        before = pa.total_allocated_bytes()
+        table = load_cleaned_data(saved_files['feather'], as_table=True)
+        assert pa.total_allocated_bytes() - before < 1024
+        assert table.num_rows == len(cleaned)
+
+    @pytest.mark.parametrize('codec', ['lz4', 'zstd'])
+    def test_compressed_file(self, cleaned, tmp_path, monkeypatch, codec):
+        monkeypatch.setattr(save_data, 'FEATHER_COMPRESSION', codec)
+        saved_files = save_cleaned_data(cleaned, 'cleaned', ['feather'], str(tmp_path))
+
+        assert pa.ipc.open_file(saved_files['feather']).get_batch(0).num_rows == len(cleaned)
+        pd.testing.assert_frame_equal(load_cleaned_data(saved_files['feather'], columns=['ID', 'Value']),
+                                      cleaned[['ID', 'Value']].reset_index(drop=True))
+
+    def test_streamed_feather_matches_batch(self, cleaned, tmp_path, monkeypatch):
+        monkeypatch.setattr(stream_writers, 'FEATHER_COMPRESSION', 'zstd')
+        chunks = [cleaned.iloc[start:start + 5] for start in range(0, len(cleaned), 5)]
+        saved_files = save_data.save_cleaned_chunks(chunks, 'streamed', ['feather'], str(tmp_path))
+
+        loaded = load_cleaned_data(saved_files['feather'])
+        assert pa.ipc.open_file(saved_files['feather']).num_record_batches == 3
+        pd.testing.assert_frame_equal(loaded, cleaned.reset_index(drop=True), check_dtype=False, check_categorical=False)
+
+    def test_other_outputs_and_missing_file(self, cleaned, tmp_path):
+        saved_files = save_cleaned_data(cleaned, 'cleaned', ['parquet', 'csv'], str(tmp_path))
+
+        assert load_cleaned_data(saved_files['parquet'], as_table=True).num_rows == len(cleaned)
+        assert list(load_cleaned_data(saved_files['csv'], columns=['ID', 'Name']).columns) == ['ID', 'Name']
+        with pytest.raises(FileNotFoundError):
+            load_cleaned_data(str(tmp_path / "missing.feather"))
@@ -0,0 +1,78 @@
+import sys
+import pytest
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.conftest import make_raw_fifa_data
+from eti_pipeline.src.extract.extract import load_raw_data
+from eti_pipeline.src.transform import transform
+from eti_pipeline.src.transform.transform import transform_fifa_data, quarantine_table
+from eti_pipeline.src.transform.incremental import transform_incremental
+
+
+def read_raw(raw_data, tmp_path):
+    """Round-trip a raw frame through CSV so it gets the typed schema"""
+    raw_csv = tmp_path / "raw.csv"
+    raw_data.to_csv(raw_csv, index=False)
+    return load_raw_data(str(raw_csv))
+
+
+class TestTransformIncremental:
+    """ID-keyed incremental transform"""
+
+    @pytest.fixture
+    def state_dir(self, tmp_path):
+        return str(tmp_path / "state")
+
+    def test_first_run_transforms_everything(self, clean_raw_fifa_data, tmp_path, state_dir):
+        cleaned, counts = transform_incremental(read_raw(clean_raw_fifa_data, tmp_path), state_dir=state_dir)
+
+        assert counts == {'new': 12, 'changed': 0, 'unchanged': 0, 'deleted': 0}
+        pd.testing.assert_frame_equal(cleaned, transform_fifa_data(read_raw(clean_raw_fifa_data, tmp_path)))
+
+    def test_only_new_and_changed_rows_are_transformed(self, tmp_path, state_dir):
+        previous = make_raw_fifa_data(rows=30, malformed=False)
+        transform_incremental(read_raw(previous, tmp_path), state_dir=state_dir)
+
+        current = previous.drop(index=[3, 4])
+        current.loc[[0, 1], 'Value'] = '€2.5M'
+        current.loc[2, 'Club'] = 'Ajax'
+        current = pd.concat([current, make_raw_fifa_data(rows=5, malformed=False).assign(ID=np.arange(5) + 5000)])
+        current = current.sample(frac=1, random_state=0)
+
+        cleaned, counts = transform_incremental(read_raw(current, tmp_path), state_dir=state_dir)
+
+        assert counts == {'new': 5, 'changed': 3, 'unchanged': 25, 'deleted': 2}
+        pd.testing.assert_frame_equal(cleaned, transform_fifa_data(read_raw(current, tmp_path)))
+
+    def test_settings_change_triggers_full_run(self, clean_raw_fifa_data, tmp_path, state_dir):
+        transform_incremental(read_raw(clean_raw_fifa_data, tmp_path), state_dir=state_dir, fingerprint='a')
+        _, counts = transform_incremental(read_raw(clean_raw_fifa_data, tmp_path), state_dir=state_dir, fingerprint='b')
+        assert counts['new'] == 12
+
+    def test_duplicate_ids_fall_back_to_full_transform(self, clean_raw_fifa_data, tmp_path, state_dir):
+        raw_data = read_raw(clean_raw_fifa_data.assign(ID=1), tmp_path)
+        cleaned, counts = transform_incremental(raw_data, state_dir=state_dir)
+
+        assert counts == {'new': 12, 'changed': 0, 'unchanged': 0, 'deleted': 0}
+        assert not Path(state_dir).exists()
+
+    def test_strict_rejects_of_unchanged_rows_are_kept(self, tmp_path, state_dir, monkeypatch):
+        monkeypatch.setattr(transform, 'TRANSFORM_STRICT', True)
+        previous = make_raw_fifa_data(rows=30)
+        transform_incremental(read_raw(previous, tmp_path), state_dir=state_dir)
+
+        current = previous.drop(index=[3])
+        current.loc[[0, 1], 'Value'] = '€2.5M'
+        current = current.sample(frac=1, random_state=0)
+
+        quarantine, expected = [], []
+        _, counts = transform_incremental(read_raw(current, tmp_path), state_dir=state_dir, quarantine=quarantine)
+        transform_fifa_data(read_raw(current, tmp_path), quarantine=expected)
+
+        assert counts['unchanged'] == 27
+        pd.testing.assert_frame_equal(quarantine_table(quarantine), quarantine_table(expected))
@@ -0,0 +1,63 @@
+import os
+import sys
+import logging
+import pytest
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from eti_pipeline.src.utilis import logger_utilis
+from eti_pipeline.src.utilis.logger_utilis import setup_logging, shutdown_logging, worker_logging_options
+
+
+def log_from_worker(message):
+    logging.getLogger('worker').info(message)
+    return os.getpid()
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    """Run setup_logging into tmp_path, restoring pytest's own handlers afterwards"""
+    root_logger = logging.getLogger()
+    handlers, level = root_logger.handlers[:], root_logger.level
+    yield tmp_path
+    shutdown_logging()
+    root_logger.handlers[:] = handlers
+    root_logger.setLevel(level)
+
+
+class TestQueueLogging:
+    """Process-wide QueueHandler/QueueListener logging"""
+
+    def test_one_setup_and_one_file_for_all_processes(self, log_dir):
+        setup_logging('first', log_dir=str(log_dir))
+        setup_logging('second', log_dir=str(log_dir))
+        assert len(logging.getLogger().handlers) == 1
+
+        logging.getLogger('main').info("from the main process")
+        with ProcessPoolExecutor(max_workers=2, **worker_logging_options()) as executor:
+            pids = set(executor.map(log_from_worker, ["from worker 1", "from worker 2"]))
+        shutdown_logging()
+
+        assert os.getpid() not in pids
+        assert os.listdir(log_dir) == ['pipeline.log']
+        text = (log_dir / 'pipeline.log').read_text(encoding='utf-8')
+        for message in ["from the main process", "from worker 1", "from worker 2"]:
+            assert text.count(message) == 1
+
+    def test_size_rotation_keeps_backup_count_files(self, log_dir, monkeypatch):
+        monkeypatch.setattr(logger_utilis, 'LOG_MAX_MB', 0.001)
+        monkeypatch.setattr(logger_utilis, 'LOG_BACKUP_COUNT', 2)
+        logger = setup_logging(__name__, log_dir=str(log_dir))
+
+        for number in range(200):
+            logger.info(f"line {number:03d} " + "x" * 40)
+        shutdown_logging()
+
+        assert sorted(os.listdir(log_dir)) == ['pipeline.log', 'pipeline.log.1', 'pipeline.log.2']
+        assert "line 199" in (log_dir / 'pipeline.log').read_text(encoding='utf-8')
+
+    def test_no_worker_options_without_setup(self):
+        assert worker_logging_options() == {}
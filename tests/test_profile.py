@@ -0,0 +1,78 @@
+import sys
+import json
+import pytest
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from eti_pipeline.src.utilis.profile_utilis import profiling, profile_stage
+from eti_pipeline.src.transform.transform import transform_fifa_data
+from eti_pipeline.src.load.save_data import save_cleaned_data
+
+
+def stage_names(profiler):
+    return [record['stage'] for record in profiler.stages]
+
+
+class TestStageProfiler:
+    """Stage timings and memory"""
+
+    def test_stages_are_a_no_op_without_profiler(self):
+        with profile_stage('extract') as record:
+            assert record is None
+
+    def test_nested_stages(self):
+        with profiling() as profiler:
+            with profile_stage('transform'):
+                with profile_stage('step'):
+                    sum(range(10_000))
+
+        assert stage_names(profiler) == ['transform', 'transform/step']
+        outer, inner = profiler.stages
+        assert inner['depth'] == 1
+        assert outer['wall_s'] >= inner['wall_s'] >= 0
+        assert outer['cpu_s'] >= 0
+
+    def test_worker_threads_nest_under_the_open_stage(self):
+        with profiling() as profiler:
+            with profile_stage('load'):
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    for future in [pool.submit(self.write, name) for name in ['csv', 'json']]:
+                        future.result()
+
+        assert sorted(stage_names(profiler)) == ['load', 'load/csv', 'load/json']
+
+    @staticmethod
+    def write(name):
+        with profile_stage(name):
+            return name
+
+    def test_tracemalloc_peak_covers_nested_allocations(self):
+        with profiling(trace_memory=True) as profiler:
+            with profile_stage('outer'):
+                with profile_stage('inner'):
+                    block = bytearray(8 * 1024 * 1024)
+                    del block
+
+        outer, inner = profiler.stages
+        assert inner['peak_traced_mb'] >= 8
+        assert outer['peak_traced_mb'] >= inner['peak_traced_mb']
+
+    def test_pipeline_steps_and_writers_are_recorded(self, clean_raw_fifa_data, tmp_path):
+        with profiling() as profiler:
+            with profile_stage('transform'):
+                cleaned = transform_fifa_data(clean_raw_fifa_data)
+            with profile_stage('load'):
+                save_cleaned_data(cleaned, 'cleaned', ['csv', 'json'], str(tmp_path))
+
+        names = stage_names(profiler)
+        assert {'transform/plan', 'transform/convert_value', 'transform/assemble'} <= set(names)
+        assert {'load/csv', 'load/json'} <= set(names)
+
+        metrics_path = profiler.write_metrics(str(tmp_path / "run_metrics.json"), rows=len(cleaned))
+        metrics = json.loads(Path(metrics_path).read_text(encoding='utf-8'))
+        assert metrics['rows'] == 12
+        assert [stage['stage'] for stage in metrics['stages']] == names
+        assert 'convert_value' in profiler.summary_table()
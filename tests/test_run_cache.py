@@ -0,0 +1,146 @@
+import os
+import sys
+import pytest
+import pandas as pd
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import config
+from eti_pipeline.src.transform import transform
+from eti_pipeline.src.transform.transform import transform_fifa_data, quarantine_table
+from eti_pipeline.src.utilis import cache_utilis
+from eti_pipeline.src.utilis.cache_utilis import (
+    run_cache_key,
+    load_cached_run,
+    load_cached_quarantine,
+    store_cached_run,
+    evict_cache,
+    record_cached_outputs,
+    cached_outputs_current,
+    code_files,
+    OUTPUT_CODE_FILES
+)
+
+
+@pytest.fixture
+def raw_csv(clean_raw_fifa_data, tmp_path):
+    path = tmp_path / "raw.csv"
+    clean_raw_fifa_data.to_csv(path, index=False)
+    return path
+
+
+class TestRunCacheKey:
+    """What invalidates a cached run"""
+
+    def test_key_is_stable(self, raw_csv):
+        assert run_cache_key(str(raw_csv)) == run_cache_key(str(raw_csv))
+
+    def test_raw_file_change_changes_key(self, raw_csv):
+        before = run_cache_key(str(raw_csv))
+        with open(raw_csv, 'a', encoding='utf-8') as file:
+            file.write(',' * 76 + '\n')
+        assert run_cache_key(str(raw_csv)) != before
+
+    def test_settings_and_options_change_key(self, raw_csv, monkeypatch):
+        before = run_cache_key(str(raw_csv))
+        assert run_cache_key(str(raw_csv), engine='pyarrow') != before
+
+        monkeypatch.setattr(config, 'COLUMNS_TO_DROP', ['W/F'])
+        assert run_cache_key(str(raw_csv)) != before
+
+    def test_extract_read_code_is_versioned(self):
+        files = {Path(path).as_posix() for path in code_files()}
+        assert {'eti_pipeline/src/utilis/file_utilis.py', 'eti_pipeline/src/extract/schema.py',
+                'eti_pipeline/src/transform/transform.py'} <= files
+        output_files = {Path(path).as_posix() for path in code_files(OUTPUT_CODE_FILES)}
+        assert {'eti_pipeline/src/load/stream_writers.py', 'eti_pipeline/src/utilis/compression_utilis.py'} <= output_files
+
+
+class TestRunCacheEntries:
+    """Storing, loading and evicting cleaned runs"""
+
+    def test_round_trip_keeps_dtypes(self, clean_raw_fifa_data, tmp_path):
+        cleaned = transform_fifa_data(clean_raw_fifa_data.astype({'Club': 'category'}))
+        store_cached_run('abc', cleaned, (12, 77), cache_dir=str(tmp_path))
+
+        cached, metadata = load_cached_run('abc', cache_dir=str(tmp_path))
+
+        pd.testing.assert_frame_equal(cached, cleaned)
+        assert metadata['raw_shape'] == [12, 77]
+        assert load_cached_run('missing', cache_dir=str(tmp_path)) is None
+
+    def test_mixed_type_columns_are_not_cached(self, raw_fifa_data, tmp_path):
+        cleaned = transform_fifa_data(raw_fifa_data)
+        assert store_cached_run('abc', cleaned, (12, 77), cache_dir=str(tmp_path)) is None
+        assert load_cached_run('abc', cache_dir=str(tmp_path)) is None
+
+    def test_strict_columns_are_cached(self, raw_fifa_data, tmp_path):
+        quarantine = []
+        cleaned = transform_fifa_data(raw_fifa_data, strict=True, quarantine=quarantine)
+        store_cached_run('abc', cleaned, (12, 77), cache_dir=str(tmp_path), quarantine=quarantine_table(quarantine))
+
+        cached, _ = load_cached_run('abc', cache_dir=str(tmp_path))
+        pd.testing.assert_frame_equal(cached, cleaned)
+        pd.testing.assert_frame_equal(load_cached_quarantine('abc', cache_dir=str(tmp_path)), quarantine_table(quarantine))
+        assert sorted(path.name for path in tmp_path.glob("*.parquet")) == ['abc.parquet', 'abc.quarantine.parquet']
+        assert evict_cache(max_mb=0, cache_dir=str(tmp_path)) == ['abc'] and not list(tmp_path.iterdir())
+
+    def test_cache_hit_writes_the_quarantine(self, raw_fifa_data, tmp_path, monkeypatch, capsys):
+        import main
+        for module in (main, transform, config):
+            monkeypatch.setattr(module, 'TRANSFORM_STRICT', True)
+        monkeypatch.setattr(cache_utilis, 'default_cache_dir', lambda: str(tmp_path / "cache"))
+        raw_fifa_data.to_csv(tmp_path / "raw.csv", index=False)
+        targets = [{'format': 'csv', 'base_filename': 'cleaned'}]
+
+        for run in ['first', 'second']:
+            main.run_batch_pipeline(use_cache=True, incremental=False, raw_path=str(tmp_path / "raw.csv"),
+                                    output_dir=str(tmp_path / run), targets=targets)
+
+        assert 'reusing cached cleaned data' in capsys.readouterr().out
+        first, second = (pd.read_parquet(tmp_path / run / config.QUARANTINE_FILENAME) for run in ['first', 'second'])
+        assert len(first) > 0
+        pd.testing.assert_frame_equal(second, first)
+
+    def test_least_recently_used_entries_are_evicted(self, clean_raw_fifa_data, tmp_path):
+        cleaned = transform_fifa_data(clean_raw_fifa_data)
+        for age, key in enumerate(['old', 'used', 'new']):
+            store_cached_run(key, cleaned, (12, 77), cache_dir=str(tmp_path), max_mb=100)
+            for path in tmp_path.glob(f"{key}.*"):
+                os.utime(path, (1000 + age, 1000 + age))
+        load_cached_run('used', cache_dir=str(tmp_path))
+
+        entry_size = sum(path.stat().st_size for path in tmp_path.glob("new.*"))
+        evicted = evict_cache(max_mb=2.5 * entry_size / config.MB_CONVERSION, cache_dir=str(tmp_path))
+
+        assert evicted == ['old']
+        assert sorted(path.stem for path in tmp_path.glob("*.parquet")) == ['new', 'used']
+
+    def test_outputs_are_current_until_modified(self, clean_raw_fifa_data, tmp_path):
+        cleaned = transform_fifa_data(clean_raw_fifa_data)
+        output = tmp_path / "cleaned.csv"
+        cleaned.to_csv(output, index=False)
+        targets = {'csv': ('csv', str(output))}
+
+        store_cached_run('abc', cleaned, (12, 77), cache_dir=str(tmp_path))
+        record_cached_outputs('abc', {'csv': str(output)}, cache_dir=str(tmp_path))
+        _, metadata = load_cached_run('abc', cache_dir=str(tmp_path))
+        assert cached_outputs_current(metadata, targets)
+        assert not cached_outputs_current(metadata, {**targets, 'json': ('json', str(tmp_path / "x.json"))})
+
+        output.write_text("edited", encoding='utf-8')
+        assert not cached_outputs_current(metadata, targets)
+
+    def test_writer_settings_change_rewrites_outputs(self, clean_raw_fifa_data, tmp_path, monkeypatch):
+        cleaned = transform_fifa_data(clean_raw_fifa_data)
+        output = tmp_path / "cleaned.csv"
+        cleaned.to_csv(output, index=False)
+
+        store_cached_run('abc', cleaned, (12, 77), cache_dir=str(tmp_path))
+        record_cached_outputs('abc', {'csv': str(output)}, cache_dir=str(tmp_path))
+        _, metadata = load_cached_run('abc', cache_dir=str(tmp_path))
+
+        monkeypatch.setattr(config, 'PARQUET_COMPRESSION', 'zstd')
+        assert not cached_outputs_current(metadata, {'csv': ('csv', str(output))})
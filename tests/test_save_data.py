@@ -0,0 +1,435 @@
+import sys
+import pytest
+import pandas as pd
+import pyarrow.parquet as pq
+import sqlalchemy
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from eti_pipeline.src.extract.extract import load_raw_data, load_raw_data_chunks
+from eti_pipeline.src.transform.transform import transform_fifa_data, quarantine_table
+from eti_pipeline.src.load import save_data, stream_writers, sql_writer
+from eti_pipeline.src.load.save_data import (
+    write_parquet,
+    write_excel,
+    save_cleaned_data,
+    save_cleaned_chunks,
+    resolve_output_targets,
+    plan_output_targets,
+    save_output_targets,
+    save_quarantine
+)
+
+
+class TestSaveCleanedChunks:
+    """Streaming extract -> transform -> load"""
+
+    def stream(self, raw_fifa_data, tmp_path, chunksize, formats=None):
+        raw_csv = tmp_path / "raw.csv"
+        raw_fifa_data.to_csv(raw_csv, index=False)
+        chunks = (transform_fifa_data(chunk)
+                  for chunk in load_raw_data_chunks(str(raw_csv), chunksize=chunksize))
+        return save_cleaned_chunks(chunks, base_filename='cleaned', formats=formats, output_dir=str(tmp_path))
+
+    def test_streamed_files_match_batch(self, clean_raw_fifa_data, tmp_path):
+        saved_files = self.stream(clean_raw_fifa_data, tmp_path, chunksize=5)
+        expected = transform_fifa_data(load_raw_data(str(tmp_path / "raw.csv")))
+
+        assert set(saved_files) == {'csv', 'parquet', 'jsonl'}
+        assert Path(saved_files['csv']).read_text(encoding='utf-8') == expected.to_csv(index=False)
+        pd.testing.assert_frame_equal(pd.read_parquet(saved_files['parquet']), expected, check_dtype=False)
+        assert len(pd.read_json(saved_files['jsonl'], lines=True)) == len(expected)
+
+    def test_one_row_group_per_chunk(self, clean_raw_fifa_data, tmp_path):
+        saved_files = self.stream(clean_raw_fifa_data, tmp_path, chunksize=5, formats=['parquet'])
+        assert pq.ParquetFile(saved_files['parquet']).num_row_groups == 3
+
+    def test_chunk_with_missing_values_is_read(self, clean_raw_fifa_data, tmp_path):
+        clean_raw_fifa_data['Crossing'] = clean_raw_fifa_data['Crossing'].astype(float)
+        clean_raw_fifa_data.loc[6, 'Crossing'] = None
+        saved_files = self.stream(clean_raw_fifa_data, tmp_path, chunksize=5, formats=['csv', 'parquet'])
+
+        assert pd.read_csv(saved_files['csv'])['Crossing'].isna().tolist() == [i == 6 for i in range(12)]
+        assert pd.read_parquet(saved_files['parquet'])['Crossing'].isna().sum() == 1
+
+    def test_out_of_range_chunk_is_kept_not_wrapped(self, clean_raw_fifa_data, tmp_path):
+        clean_raw_fifa_data.loc[11, 'Crossing'] = 300
+        saved_files = self.stream(clean_raw_fifa_data, tmp_path, chunksize=5, formats=['csv', 'parquet'])
+
+        assert pd.read_csv(saved_files['csv'])['Crossing'][11] == 300
+        # Every chunk gets the whole file's dtype, so the Parquet file holds 300 too
+        crossing = pd.read_parquet(saved_files['parquet'])['Crossing']
+        assert crossing[11] == 300 and crossing.dtype == 'int64'
+
+    def test_chunks_share_one_integer_dtype(self, clean_raw_fifa_data, tmp_path):
+        clean_raw_fifa_data['Crossing'] = clean_raw_fifa_data['Crossing'].astype(float)
+        clean_raw_fifa_data.loc[6, 'Crossing'] = None
+        clean_raw_fifa_data.to_csv(tmp_path / "raw.csv", index=False)
+
+        chunks = list(load_raw_data_chunks(str(tmp_path / "raw.csv"), chunksize=5))
+        assert [str(chunk['Crossing'].dtype) for chunk in chunks] == ['Int8'] * 3
+
+    def test_stream_run_uses_given_paths_and_workers(self, clean_raw_fifa_data, tmp_path, capsys):
+        from main import run_pipeline
+        clean_raw_fifa_data.to_csv(tmp_path / "raw.csv", index=False)
+        output_dir = tmp_path / "processed"
+
+        saved_files = run_pipeline(stream=True, chunksize=5, workers=2, raw_path=str(tmp_path / "raw.csv"),
+                                   output_dir=str(output_dir))
+
+        assert saved_files and all(Path(path).parent == output_dir for path in saved_files.values())
+        assert len(pd.read_csv(saved_files['csv'])) == 12
+        with pytest.raises(ValueError, match='targets'):
+            run_pipeline(stream=True, targets=[{'format': 'csv', 'base_filename': 'x'}])
+
+    def test_strict_stream_run_saves_the_quarantine(self, raw_fifa_data, tmp_path, monkeypatch):
+        import main
+        from eti_pipeline.src.transform import transform
+        monkeypatch.setattr(main, 'TRANSFORM_STRICT', True)
+        monkeypatch.setattr(transform, 'TRANSFORM_STRICT', True)
+        raw_fifa_data.to_csv(tmp_path / "raw.csv", index=False)
+        output_dir = tmp_path / "processed"
+
+        main.run_streaming_pipeline(chunksize=5, formats=['csv'], raw_path=str(tmp_path / "raw.csv"),
+                                    output_dir=str(output_dir))
+
+        expected = []
+        transform_fifa_data(load_raw_data(str(tmp_path / "raw.csv")), quarantine=expected)
+        quarantine = pd.read_parquet(output_dir / main.QUARANTINE_FILENAME)
+        assert len(quarantine) > 0
+        pd.testing.assert_frame_equal(quarantine, quarantine_table(expected))
+
+    def test_run_fails_when_no_output_is_written(self, clean_raw_fifa_data, tmp_path, monkeypatch, capsys):
+        from main import run_batch_pipeline
+        clean_raw_fifa_data.to_csv(tmp_path / "raw.csv", index=False)
+        targets = [{'format': 'csv', 'base_filename': 'cleaned'}, {'format': 'json', 'base_filename': 'cleaned'}]
+        write_format = save_data.write_format
+        failing = {'json'}
+
+        def failing_write(raw_data, fmt, *args, **kwargs):
+            if fmt in failing:
+                raise OSError("disk full")
+            return write_format(raw_data, fmt, *args, **kwargs)
+
+        monkeypatch.setattr(save_data, 'write_format', failing_write)
+        assert run_batch_pipeline(use_cache=False, raw_path=str(tmp_path / "raw.csv"),
+                                  output_dir=str(tmp_path / "partial"), targets=targets) is not None
+        assert 'COMPLETED WITH ERRORS' in capsys.readouterr().out
+
+        failing.add('csv')
+        assert run_batch_pipeline(use_cache=False, raw_path=str(tmp_path / "raw.csv"),
+                                  output_dir=str(tmp_path / "failed"), targets=targets) is None
+        assert 'NO OUTPUT FILE COULD BE WRITTEN' in capsys.readouterr().out
+
+    def test_dry_run_reports_given_targets(self, tmp_path):
+        from main import run_pipeline
+        plan = run_pipeline(dry_run=True, output_dir=str(tmp_path),
+                            targets=[{'format': 'csv', 'base_filename': 'planned'}])
+        assert [Path(write['path']) for write in plan] == [tmp_path / "planned.csv"]
+
+    def test_categories_can_grow_across_chunks(self, tmp_path):
+        writer = stream_writers.ParquetChunkWriter(str(tmp_path / "grow.parquet"))
+        writer.write(pd.DataFrame({'Club': pd.Categorical(['a', 'b'])}))
+        writer.write(pd.DataFrame({'Club': pd.Categorical([f"club {i}" for i in range(300)])}))
+        writer.close()
+
+        clubs = pd.read_parquet(tmp_path / "grow.parquet")['Club']
+        assert clubs.dtype == 'category' and len(clubs.cat.categories) == 302
+        assert clubs.iloc[-1] == "club 299"
+
+    def test_unstreamable_format_is_skipped(self, raw_fifa_data, tmp_path):
+        saved_files = self.stream(raw_fifa_data, tmp_path, chunksize=5, formats=['csv', 'pickle'])
+        assert list(saved_files) == ['csv']
+
+
+class TestSaveCleanedData:
+    """Multi-format writer"""
+
+    FORMATS = ['csv', 'excel', 'json', 'parquet']
+
+    def test_parallel_matches_serial(self, clean_raw_fifa_data, tmp_path):
+        cleaned = transform_fifa_data(clean_raw_fifa_data)
+        serial = save_cleaned_data(cleaned, 'serial', self.FORMATS, str(tmp_path), parallel=False)
+        threaded = save_cleaned_data(cleaned, 'threaded', self.FORMATS, str(tmp_path), parallel=True)
+
+        assert list(serial) == list(threaded) == ['csv', 'excel', 'json', 'parquet']
+        assert threaded['excel'].endswith('threaded.xlsx')
+        for fmt in ['csv', 'json']:
+            assert Path(serial[fmt]).read_bytes() == Path(threaded[fmt]).read_bytes()
+        pd.testing.assert_frame_equal(pd.read_parquet(serial['parquet']), pd.read_parquet(threaded['parquet']))
+
+    def test_timings_and_errors_are_reported(self, raw_fifa_data, tmp_path):
+        # Malformed values leave mixed-type columns that Parquet cannot store
+        cleaned = transform_fifa_data(raw_fifa_data)
+        saved_files = save_cleaned_data(cleaned, 'cleaned', ['csv', 'parquet', 'yaml'], str(tmp_path))
+
+        assert list(saved_files) == ['csv']
+        assert set(saved_files.timings) == {'csv', 'parquet', 'yaml'}
+        assert set(saved_files.errors) == {'parquet', 'yaml'}
+        assert 'Unknown format' in saved_files.errors['yaml']
+
+    def test_strict_output_saves_every_format(self, raw_fifa_data, tmp_path):
+        quarantine = []
+        cleaned = transform_fifa_data(raw_fifa_data, strict=True, quarantine=quarantine)
+        saved_files = save_cleaned_data(cleaned, 'cleaned', self.FORMATS + ['sql'], str(tmp_path))
+        quarantine_path = save_quarantine(quarantine_table(quarantine), str(tmp_path / "quarantine.parquet"))
+
+        assert not saved_files.errors
+        pd.testing.assert_frame_equal(pd.read_parquet(saved_files['parquet']), cleaned)
+        assert pd.read_csv(saved_files['csv'])['Wages(€K)'].isna().sum() == cleaned['Wages(€K)'].isna().sum()
+        assert pd.read_parquet(quarantine_path).equals(quarantine_table(quarantine))
+
+
+class TestOutputTargets:
+    """Declarative output targets and the dry-run plan"""
+
+    TARGETS = [
+        {'format': 'csv', 'base_filename': 'cleaned'},
+        {'format': 'excel', 'base_filename': 'cleaned'},
+        {'name': 'xlsx', 'format': 'xlsx', 'base_filename': 'cleaned'},
+        {'name': 'csv_copy', 'format': 'csv', 'base_filename': 'cleaned'},
+    ]
+
+    def test_duplicate_files_are_dropped(self, tmp_path):
+        resolved = resolve_output_targets(self.TARGETS, str(tmp_path))
+        assert resolved == {
+            'csv': ('csv', str(tmp_path / 'cleaned.csv')),
+            'excel': ('excel', str(tmp_path / 'cleaned.xlsx')),
+        }
+
+    def test_each_target_is_written_once(self, clean_raw_fifa_data, tmp_path):
+        cleaned = transform_fifa_data(clean_raw_fifa_data)
+        saved_files = save_output_targets(cleaned, self.TARGETS, str(tmp_path))
+
+        assert list(saved_files) == ['csv', 'excel']
+        assert sorted(path.name for path in tmp_path.iterdir()) == ['cleaned.csv', 'cleaned.xlsx']
+
+    def test_plan_writes_nothing(self, tmp_path):
+        plan = plan_output_targets(10 * 1024 * 1024, self.TARGETS, str(tmp_path / 'out'))
+
+        assert [write['name'] for write in plan] == ['csv', 'excel']
+        assert plan[0]['estimated_bytes'] > 0
+        assert plan[1]['estimated_seconds'] > plan[0]['estimated_seconds']
+        assert not (tmp_path / 'out').exists()
+
+
+class TestParquetOptions:
+    """Codec, row groups and Hive partitioning of the Parquet output"""
+
+    @pytest.fixture
+    def cleaned(self, clean_raw_fifa_data):
+        return transform_fifa_data(clean_raw_fifa_data)
+
+    def test_codec_and_row_groups(self, cleaned, tmp_path, monkeypatch):
+        monkeypatch.setattr(stream_writers, 'PARQUET_COMPRESSION', 'zstd')
+        monkeypatch.setattr(stream_writers, 'PARQUET_COMPRESSION_LEVEL', 9)
+        monkeypatch.setattr(save_data, 'PARQUET_ROW_GROUP_SIZE', 5)
+
+        filepath = write_parquet(cleaned, str(tmp_path / "cleaned.parquet"), sort_by=['Best Position'])
+        metadata = pq.ParquetFile(filepath).metadata
+
+        assert metadata.num_row_groups == 3
+        assert metadata.row_group(0).column(0).compression == 'ZSTD'
+        expected = cleaned.sort_values('Best Position', kind='stable').reset_index(drop=True)
+        pd.testing.assert_frame_equal(pd.read_parquet(filepath), expected)
+
+    def test_partitioned_output_reads_only_matching_files(self, cleaned, tmp_path):
+        filepath = str(tmp_path / "cleaned.parquet")
+        (tmp_path / "cleaned.parquet").write_text("previous unpartitioned file", encoding='utf-8')
+
+        write_parquet(cleaned, filepath, partition_cols=['Nationality'])
+
+        nations = sorted(path.name for path in (tmp_path / "cleaned.parquet").iterdir())
+        assert nations == sorted(f"Nationality={nation}" for nation in cleaned['Nationality'].unique())
+
+        brazil = pd.read_parquet(filepath, filters=[('Nationality', '==', 'Brazil')])
+        assert len(brazil) == (cleaned['Nationality'] == 'Brazil').sum()
+        assert brazil['Name'].tolist() == cleaned.loc[cleaned['Nationality'] == 'Brazil', 'Name'].tolist()
+
+    def test_unknown_partition_column_is_reported(self, cleaned, tmp_path):
+        with pytest.raises(ValueError, match="Nation"):
+            write_parquet(cleaned, str(tmp_path / "cleaned.parquet"), partition_cols=['Nation'])
+
+
+class TestStreamingExcel:
+    """Write-only Excel output split at the sheet row limit"""
+
+    @pytest.fixture
+    def cleaned(self, clean_raw_fifa_data):
+        return transform_fifa_data(clean_raw_fifa_data)
+
+    def test_matches_to_excel(self, cleaned, tmp_path):
+        cleaned.to_excel(tmp_path / "expected.xlsx", index=False)
+        assert write_excel(cleaned, str(tmp_path / "streamed.xlsx")) == 1
+
+        pd.testing.assert_frame_equal(pd.read_excel(tmp_path / "streamed.xlsx"),
+                                      pd.read_excel(tmp_path / "expected.xlsx"))
+
+    @pytest.mark.parametrize('engine', ['openpyxl', 'xlsxwriter'])
+    def test_rows_continue_on_new_sheets(self, cleaned, tmp_path, engine):
+        pytest.importorskip(engine)
+        filepath = str(tmp_path / "split.xlsx")
+
+        # 5 rows per sheet: a header and 4 players
+        assert write_excel(cleaned, filepath, max_rows=5, engine=engine) == 3
+
+        sheets = pd.read_excel(filepath, sheet_name=None)
+        assert list(sheets) == ['Sheet1', 'Sheet2', 'Sheet3']
+        assert [len(sheet) for sheet in sheets.values()] == [4, 4, 4]
+        assert pd.concat(sheets.values(), ignore_index=True)['ID'].tolist() == cleaned['ID'].tolist()
+
+    def test_excel_can_be_streamed(self, clean_raw_fifa_data, tmp_path):
+        saved_files = TestSaveCleanedChunks().stream(clean_raw_fifa_data, tmp_path, chunksize=5, formats=['excel'])
+        assert len(pd.read_excel(saved_files['excel'])) == len(clean_raw_fifa_data)
+
+
+class TestJsonOutputs:
+    """JSON Lines (plain, gzip, zstd) and compact JSON"""
+
+    @pytest.fixture
+    def cleaned(self, clean_raw_fifa_data):
+        return transform_fifa_data(clean_raw_fifa_data)
+
+    @pytest.mark.parametrize('fmt', ['jsonl', 'jsonl.gz', 'jsonl.zst'])
+    def test_json_lines_round_trip(self, cleaned, tmp_path, fmt):
+        if fmt.endswith('.zst'):
+            pytest.importorskip('zstandard')
+        saved_files = save_cleaned_data(cleaned, 'cleaned', [fmt, 'json'], str(tmp_path), parallel=False)
+
+        assert saved_files[fmt].endswith(f"cleaned.{fmt}")
+        pd.testing.assert_frame_equal(pd.read_json(saved_files[fmt], lines=True), pd.read_json(saved_files['json']))
+
+    def test_compressed_json_lines_can_be_streamed(self, clean_raw_fifa_data, tmp_path):
+        saved_files = TestSaveCleanedChunks().stream(clean_raw_fifa_data, tmp_path, chunksize=5, formats=['jsonl.gz'])
+        assert len(pd.read_json(saved_files['jsonl.gz'], lines=True)) == len(clean_raw_fifa_data)
+
+    def test_compact_json(self, cleaned, tmp_path, monkeypatch):
+        indented = save_cleaned_data(cleaned, 'indented', ['json'], str(tmp_path))['json']
+        monkeypatch.setattr(save_data, 'JSON_INDENT', None)
+        compact = save_cleaned_data(cleaned, 'compact', ['json'], str(tmp_path))['json']
+
+        assert Path(compact).stat().st_size < Path(indented).stat().st_size
+        assert len(Path(compact).read_text(encoding='utf-8').splitlines()) == 1
+        pd.testing.assert_frame_equal(pd.read_json(compact), pd.read_json(indented))
+
+
+class TestCompressedCsv:
+    """csv.gz / csv.zst / csv.bz2 outputs"""
+
+    @pytest.mark.parametrize('fmt', ['csv.gz', 'csv.zst', 'csv.bz2'])
+    def test_round_trip_and_stats(self, clean_raw_fifa_data, tmp_path, monkeypatch, fmt):
+        if fmt.endswith('.zst'):
+            pytest.importorskip('zstandard')
+        monkeypatch.setattr(save_data, 'WRITE_CHUNK_ROWS', 5)
+        cleaned = transform_fifa_data(clean_raw_fifa_data)
+
+        saved_files = save_cleaned_data(cleaned, 'cleaned', ['csv', fmt], str(tmp_path), parallel=False)
+
+        pd.testing.assert_frame_equal(pd.read_csv(saved_files[fmt]), pd.read_csv(saved_files['csv']))
+        stats = saved_files.compression[fmt]
+        assert list(saved_files.compression) == [fmt]
+        assert stats['uncompressed_bytes'] == Path(saved_files['csv']).stat().st_size
+        assert stats['ratio'] > 1 and stats['mb_per_second'] > 0
+
+    def test_compressed_csv_can_be_streamed(self, clean_raw_fifa_data, tmp_path):
+        saved_files = TestSaveCleanedChunks().stream(clean_raw_fifa_data, tmp_path, chunksize=5, formats=['csv', 'csv.gz'])
+        pd.testing.assert_frame_equal(pd.read_csv(saved_files['csv.gz']), pd.read_csv(saved_files['csv']))
+
+
+class TestSqlTarget:
+    """'sql' output target (SQLite file or SQLAlchemy URL)"""
+
+    def read_table(self, db_path, query="SELECT * FROM fifa21_players"):
+        engine = sqlalchemy.create_engine(f"sqlite:///{db_path}")
+        try:
+            with engine.connect() as connection:
+                return pd.read_sql(query, connection)
+        finally:
+            engine.dispose()
+
+    def test_rows_and_indexes(self, clean_raw_fifa_data, tmp_path):
+        cleaned = transform_fifa_data(clean_raw_fifa_data)
+        saved_files = save_cleaned_data(cleaned, 'cleaned', ['sql'], str(tmp_path), parallel=False)
+
+        assert saved_files['sql'].endswith('cleaned.db')
+        table = self.read_table(saved_files['sql'])
+        assert list(table.columns) == list(cleaned.columns) and len(table) == len(cleaned)
+
+        indexes = self.read_table(saved_files['sql'], "PRAGMA index_list('fifa21_players')")
+        unique = dict(zip(indexes['name'], indexes['unique']))
+        assert unique.pop('ix_fifa21_players_id') == 1
+        assert sorted(unique) == ['ix_fifa21_players_best_position', 'ix_fifa21_players_club', 'ix_fifa21_players_nationality']
+
+    def test_rewrite_replaces_table(self, clean_raw_fifa_data, tmp_path, monkeypatch):
+        monkeypatch.setattr(sql_writer, 'SQL_INSERT_METHOD', 'multi')
+        monkeypatch.setattr(sql_writer, 'SQL_CHUNK_ROWS', 4)
+        cleaned = transform_fifa_data(clean_raw_fifa_data)
+        db_path = str(tmp_path / "fifa.db")
+
+        sql_writer.write_sql(cleaned, db_path)
+        assert sql_writer.write_sql(cleaned.head(3), db_path)['inserted'] == 3
+        assert self.read_table(db_path)['ID'].tolist() == cleaned['ID'].head(3).tolist()
+
+    def test_multi_insert_respects_bind_limit(self):
+        assert sql_writer.insert_chunksize(100, method='multi', chunksize=10_000) == sql_writer.MAX_BIND_PARAMS // 100
+        assert sql_writer.insert_chunksize(100, method=None, chunksize=10_000) == 10_000
+
+    def test_failed_write_keeps_previous_table(self, clean_raw_fifa_data, tmp_path):
+        cleaned = transform_fifa_data(clean_raw_fifa_data)
+        db_path = str(tmp_path / "fifa.db")
+        sql_writer.write_sql(cleaned, db_path)
+
+        #Duplicate IDs break the unique index, rolling back the replacement
+        with pytest.raises(sqlalchemy.exc.IntegrityError):
+            sql_writer.write_sql(pd.concat([cleaned, cleaned.head(1)]), db_path)
+        assert len(self.read_table(db_path)) == len(cleaned)
+
+    def test_url_target(self, clean_raw_fifa_data, tmp_path):
+        cleaned = transform_fifa_data(clean_raw_fifa_data)
+        url = f"sqlite:///{tmp_path / 'remote.db'}"
+        targets = [{'format': 'sql', 'url': url}]
+
+        assert resolve_output_targets(targets, str(tmp_path)) == {'sql': ('sql', url)}
+        saved_files = save_output_targets(cleaned, targets, str(tmp_path))
+        assert saved_files['sql'] == url
+        assert len(self.read_table(tmp_path / 'remote.db')) == len(cleaned)
+
+    def test_upsert_counts_and_merges(self, clean_raw_fifa_data, tmp_path):
+        cleaned = transform_fifa_data(clean_raw_fifa_data)
+        db_path = str(tmp_path / "fifa.db")
+        sql_writer.write_sql(cleaned.iloc[:8], db_path)
+
+        #2 changed rows, 6 unchanged, 4 new; IDs missing from the load are kept
+        daily = cleaned.iloc[2:].copy()
+        daily.loc[daily.index[:2], 'Value'] = 1.0
+        rows = sql_writer.write_sql(daily, db_path, mode='upsert')
+
+        assert rows == {'inserted': 4, 'updated': 2, 'unchanged': 4}
+        table = self.read_table(db_path).set_index('ID').loc[cleaned['ID']]
+        assert len(table) == len(cleaned)
+        assert table['Value'].tolist() == cleaned['Value'].iloc[:2].tolist() + [1.0, 1.0] + cleaned['Value'].iloc[4:].tolist()
+        assert sql_writer.write_sql(daily, db_path, mode='upsert') == {'inserted': 0, 'updated': 0, 'unchanged': 10}
+
+    def test_upsert_creates_missing_table(self, clean_raw_fifa_data, tmp_path):
+        cleaned = transform_fifa_data(clean_raw_fifa_data)
+        rows = sql_writer.write_sql(cleaned, str(tmp_path / "fifa.db"), mode='upsert')
+        assert rows == {'inserted': len(cleaned), 'updated': 0, 'unchanged': 0}
+
+    def test_upsert_rejects_duplicate_ids(self, clean_raw_fifa_data, tmp_path):
+        cleaned = transform_fifa_data(clean_raw_fifa_data)
+        db_path = str(tmp_path / "fifa.db")
+        sql_writer.write_sql(cleaned, db_path)
+        with pytest.raises(ValueError, match='duplicate'):
+            sql_writer.write_sql(pd.concat([cleaned, cleaned.head(1)]), db_path, mode='upsert')
+
+    def test_counts_are_reported(self, clean_raw_fifa_data, tmp_path, monkeypatch):
+        monkeypatch.setattr(sql_writer, 'SQL_WRITE_MODE', 'upsert')
+        cleaned = transform_fifa_data(clean_raw_fifa_data)
+        save_cleaned_data(cleaned, 'cleaned', ['sql'], str(tmp_path), parallel=False)
+        saved_files = save_cleaned_data(cleaned, 'cleaned', ['sql'], str(tmp_path), parallel=False)
+        assert saved_files.sql == {'sql': {'inserted': 0, 'updated': 0, 'unchanged': len(cleaned)}}
+
+    def test_password_is_hidden(self):
+        assert sql_writer.display_target("postgresql://fifa:secret@db/fifa") == "postgresql://fifa:***@db/fifa"
@@ -1,5 +1,7 @@
 import sys
 import pytest
+import numpy as np
+import pandas as pd
 from pathlib import Path
 
 
@@ -13,6 +15,13 @@ from eti_pipeline.src.transform.string_converter_height import convert_height_co
 from eti_pipeline.src.transform.string_converter_wages import convert_wages_thousands
 from eti_pipeline.src.transform.string_converter_clause import convert_clause_thousands
 from eti_pipeline.src.transform.string_converter_hits import convert_hits_column        
+from eti_pipeline.src.transform.string_converter_value import convert_value_series
+from eti_pipeline.src.transform.string_converter_weight import convert_weight_series
+from eti_pipeline.src.transform.string_converter_height import convert_height_series
+from eti_pipeline.src.transform.string_converter_wages import convert_wages_series
+from eti_pipeline.src.transform.string_converter_clause import convert_clause_series
+from eti_pipeline.src.transform.string_converter_hits import convert_hits_series
+from eti_pipeline.src.utilis.series_utilis import memoize, convert_factorized
 
 
 
@@ -232,16 +241,220 @@ class Testconvert_hits_column:
         assert convert_hits_column('1.2K')==1200.0
         assert convert_hits_column('0')==0.0
         assert convert_hits_column('10K')==10000.0
-        
 
 
-
-    
-
-
-    
-        
-
-                                       
-                                       
-
+def strict_values(series):
+    """Values with their types, so False, 0.0, '' and None never compare equal"""
+    return [(type(v).__name__, 'nan' if v != v else v) for v in series.tolist()]
+
+
+class TestSeriesConverters:
+    """The vectorized converters must match Series.apply with the scalar ones"""
+
+    SAMPLES = [
+        '€1.5M', '€100K', '€0K', '€0M', '€0', '€201M', '€203.1M', '€-1M', '€M100', '€€200K',
+        '€560K', '€561K', '€500', '500K', '€K', '€', '', '   ', 'K', 'M', '€5m', '€abc',
+        "5'10", "6'3\"", "5'10X", '180cm', '180', '195CM', 'cm', 'CM180', '0cm', '226cm',
+        '72kg', ' 75KG ', '49kg', '170lbs', '1.2K', '10', '0000000', '1.2.0', '1:2', 'nan',
+        None, np.nan,
+    ]
+
+    PAIRS = [
+        (convert_value_column, convert_value_series),
+        (convert_weight_column, convert_weight_series),
+        (convert_height_column, convert_height_series),
+        (convert_wages_thousands, convert_wages_series),
+        (convert_clause_thousands, convert_clause_series),
+    ]
+
+    @pytest.mark.parametrize("dtype", [object, "str"])
+    @pytest.mark.parametrize("scalar, vectorized", PAIRS)
+    def test_matches_scalar(self, scalar, vectorized, dtype):
+        values = pd.Series(self.SAMPLES, dtype=dtype, name='column')
+        expected = values.apply(scalar)
+        result = vectorized(values)
+        pd.testing.assert_series_equal(result, expected)
+        assert strict_values(result) == strict_values(expected)
+
+    def test_hits_matches_scalar(self):
+        samples = ['372', '1.6K', '1.2', '0', '10K', '', 'K', '-1', 'K1.2', '1:2', None]
+        values = pd.Series(samples, dtype=object).astype(str)
+        expected = values.apply(convert_hits_column)
+        result = convert_hits_series(values)
+        pd.testing.assert_series_equal(result, expected)
+        assert strict_values(result) == strict_values(expected)
+
+    def test_dtype_follows_apply(self):
+        assert convert_value_series(pd.Series(['€1M', '€2K'])).dtype == np.float64
+        assert convert_wages_series(pd.Series(['€1K', '€€1K'])).dtype == object
+        assert convert_weight_series(pd.Series([], dtype=object)).dtype == object
+
+
+class TestFactorizedConverters:
+    """Dictionary-encoded conversion must match Series.apply too"""
+
+    SAMPLES = TestSeriesConverters.SAMPLES * 3
+
+    @pytest.mark.parametrize("max_memo", [4096, 1])
+    @pytest.mark.parametrize("dtype", [object, "str", "category"])
+    @pytest.mark.parametrize("scalar, vectorized", TestSeriesConverters.PAIRS)
+    def test_matches_scalar(self, scalar, vectorized, dtype, max_memo):
+        values = pd.Series(self.SAMPLES, dtype=dtype, name='column')
+        expected = values.astype(object).apply(scalar)
+        result = convert_factorized(values, memoize(scalar, 4096), vectorized, max_memo)
+        pd.testing.assert_series_equal(result, expected)
+        assert strict_values(result) == strict_values(expected)
+
+    def test_each_distinct_value_is_converted_once(self):
+        memo_func = memoize(convert_value_column, 4096)
+        values = pd.Series(['€1M', '€2K', '€1M', None, '€1M'] * 10)
+
+        convert_factorized(values, memo_func, convert_value_series, 4096)
+        assert memo_func.cache_info().misses == 3
+
+        convert_factorized(values, memo_func, convert_value_series, 4096)
+        assert memo_func.cache_info().misses == 3
+
+    def test_transform_matches_vectorized_path(self, raw_fifa_data, monkeypatch):
+        from eti_pipeline.src.transform import transform
+        factorized = transform.transform_fifa_data(raw_fifa_data)
+        monkeypatch.setattr(transform, 'CONVERTER_FACTORIZE', False)
+        vectorized = transform.transform_fifa_data(raw_fifa_data)
+
+        pd.testing.assert_frame_equal(factorized, vectorized)
+        for column in ['Value', 'Wages(€K)', 'Height(cm)', 'Hits']:
+            assert strict_values(factorized[column]) == strict_values(vectorized[column])
+
+
+class TestTransformFifaData:
+    """Tests for the transform chain in transform_fifa_data"""
+
+    def test_output_columns(self, raw_fifa_data):
+        from eti_pipeline.src.transform.transform import transform_fifa_data
+        result = transform_fifa_data(raw_fifa_data)
+
+        assert result.shape == (len(raw_fifa_data), 73)
+        for column in ['Weight(KG)', 'Height(cm)', 'Wages(€K)']:
+            assert column in result.columns
+        for column in ['W/F', 'SM', 'IR', 'Contract', 'Weight', 'Height', 'Wage']:
+            assert column not in result.columns
+
+    def test_leaves_raw_data_untouched(self, raw_fifa_data):
+        from eti_pipeline.src.transform.transform import transform_fifa_data
+        original = raw_fifa_data.copy()
+        transform_fifa_data(raw_fifa_data)
+        pd.testing.assert_frame_equal(raw_fifa_data, original)
+
+    def test_inplace_is_deprecated(self, raw_fifa_data):
+        from eti_pipeline.src.transform.transform import transform_fifa_data
+        original = raw_fifa_data.copy()
+        expected = transform_fifa_data(raw_fifa_data)
+        with pytest.warns(DeprecationWarning, match='inplace'):
+            result = transform_fifa_data(raw_fifa_data, inplace=True)
+
+        pd.testing.assert_frame_equal(result, expected)
+        pd.testing.assert_frame_equal(raw_fifa_data, original)
+
+    def test_single_column_steps_are_deprecated(self, raw_fifa_data):
+        from eti_pipeline.src.transform.transform import transform_fifa_data, transform_value_column
+        with pytest.warns(DeprecationWarning, match='transform_value_column'):
+            result = transform_value_column(raw_fifa_data)
+
+        pd.testing.assert_series_equal(result['Value'], transform_fifa_data(raw_fifa_data)['Value'], check_dtype=False)
+
+    def test_parallel_matches_serial(self, raw_fifa_data):
+        from eti_pipeline.src.transform.transform import transform_fifa_data
+        expected = transform_fifa_data(raw_fifa_data)
+        result = transform_fifa_data(raw_fifa_data, workers=3)
+
+        pd.testing.assert_frame_equal(result, expected)
+        for column in ['Value', 'Wages(€K)', 'Height(cm)', 'Hits']:
+            assert strict_values(result[column]) == strict_values(expected[column])
+
+
+class TestTransformPlan:
+    """Registry-driven fused transform"""
+
+    def test_plan_renames_and_drops(self, raw_fifa_data):
+        from eti_pipeline.src.transform.transform import build_transform_plan
+        plan = build_transform_plan(list(raw_fifa_data.columns))
+
+        assert plan['renames'] == {'Weight': 'Weight(KG)', 'Wage': 'Wages(€K)', 'Height': 'Height(cm)'}
+        targets = [target for _, target in plan['columns']]
+        assert 'W/F' not in targets and targets.index('Weight(KG)') == list(raw_fifa_data.columns).index('Weight') - 1
+
+    def test_new_registry_entry_adds_a_column(self, raw_fifa_data, monkeypatch):
+        from eti_pipeline.src.transform import transform
+        registry = transform.TRANSFORM_REGISTRY + [
+            {'source': 'Contract', 'target': 'Contract Value', 'converter': 'value', 'dtype': 'float64', 'nulls': 'zero'}]
+        monkeypatch.setattr(transform, 'TRANSFORM_REGISTRY', registry)
+        monkeypatch.setattr(transform, 'COLUMNS_TO_DROP', ['W/F', 'SM', 'IR'])
+        raw_fifa_data['Contract'] = ['€1M', None] * (len(raw_fifa_data) // 2)
+
+        result = transform.transform_fifa_data(raw_fifa_data)
+
+        assert result['Contract Value'].tolist()[:2] == [1_000_000.0, 0.0]
+        assert result['Contract Value'].dtype == 'float64'
+
+    def test_missing_source_column_raises_key_error(self, raw_fifa_data):
+        from eti_pipeline.src.transform.transform import transform_fifa_data
+        with pytest.raises(KeyError, match='Hits'):
+            transform_fifa_data(raw_fifa_data.drop(columns=['Hits']))
+
+    def test_colliding_rename_is_rejected(self, raw_fifa_data):
+        from eti_pipeline.src.transform import transform
+        registry = transform.TRANSFORM_REGISTRY + [
+            {'source': 'Joined', 'target': 'Club', 'converter': 'value', 'nulls': 'keep'}]
+        with pytest.raises(ValueError, match="'Club'"):
+            transform.build_transform_plan(list(raw_fifa_data.columns), registry)
+
+    def test_unknown_converter_is_rejected(self, raw_fifa_data):
+        from eti_pipeline.src.transform.transform import build_transform_plan
+        with pytest.raises(ValueError, match='converter'):
+            build_transform_plan(list(raw_fifa_data.columns), [{'source': 'Value', 'target': 'Value', 'converter': 'nope'}])
+
+
+class TestStrictMode:
+    """Nullable typed columns and the quarantine table"""
+
+    def test_columns_are_nullable_and_typed(self, raw_fifa_data):
+        from eti_pipeline.src.transform.transform import transform_fifa_data
+        result = transform_fifa_data(raw_fifa_data, strict=True)
+
+        dtypes = result[['Value', 'Weight(KG)', 'Wages(€K)', 'Height(cm)', 'Hits', 'Release Clause']].dtypes
+        assert dtypes.astype(str).tolist() == ['Float64'] * 4 + ['Int32', 'Float64']
+        assert result['Hits'].tolist()[:5] == [771, 1600, 0, 562, pd.NA]
+        assert result['Wages(€K)'].isna().tolist()[:5] == [False, False, False, True, True]
+
+    def test_rejected_values_are_quarantined(self, raw_fifa_data):
+        from eti_pipeline.src.transform.transform import transform_fifa_data, quarantine_table
+        quarantine = []
+        transform_fifa_data(raw_fifa_data, strict=True, quarantine=quarantine)
+        table = quarantine_table(quarantine)
+
+        hits = table[table['column'] == 'Hits']
+        assert hits[['ID', 'raw_value', 'reason']].values.tolist() == [[1004, 'K', 'no number'], [1009, 'K', 'no number']]
+        wages = table[(table['column'] == 'Wages(€K)') & (table['ID'] == 1003)]
+        assert wages[['raw_value', 'reason']].values.tolist() == [['€K', 'no number']]
+        # A missing raw value is not a rejection
+        assert 1002 not in hits['ID'].tolist()
+        assert table.dtypes.astype(str).tolist() == ['int32', 'category', 'str', 'category']
+
+    def test_integer_column_rejects_fractions(self, clean_raw_fifa_data):
+        from eti_pipeline.src.transform.transform import transform_fifa_data, quarantine_table
+        clean_raw_fifa_data.loc[0, 'Hits'] = '1.2345K'
+        quarantine = []
+        result = transform_fifa_data(clean_raw_fifa_data, strict=True, quarantine=quarantine)
+
+        hits = quarantine_table(quarantine).query("column == 'Hits'")
+        assert hits[['ID', 'raw_value', 'reason']].values.tolist() == [[1000, '1.2345K', 'not an integer']]
+        assert pd.isna(result.loc[0, 'Hits']) and result.loc[2, 'Hits'] == 0
+
+    def test_parallel_matches_serial(self, raw_fifa_data):
+        from eti_pipeline.src.transform.transform import transform_fifa_data, quarantine_table
+        serial, parallel = [], []
+        expected = transform_fifa_data(raw_fifa_data, strict=True, quarantine=serial)
+        result = transform_fifa_data(raw_fifa_data, strict=True, workers=3, quarantine=parallel)
+
+        pd.testing.assert_frame_equal(result, expected)
+        pd.testing.assert_frame_equal(quarantine_table(parallel), quarantine_table(serial))